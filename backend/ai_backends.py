@@ -0,0 +1,209 @@
+import os
+import json
+import time
+import random
+import asyncio
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+from json_stream import IncrementalObjectParser
+
+# Which LLM backend AIService talks to: "gemini", or "stub" for offline load tests
+AI_BACKEND = os.getenv("AI_BACKEND", "gemini").strip().lower()
+
+# Stub backend behaviour
+AI_STUB_SEED = int(os.getenv("AI_STUB_SEED", "0"))
+AI_STUB_LATENCY_MS = float(os.getenv("AI_STUB_LATENCY_MS", "800"))
+# Spread of the log-normal latency distribution; 0 gives a fixed latency
+AI_STUB_LATENCY_SIGMA = float(os.getenv("AI_STUB_LATENCY_SIGMA", "0.5"))
+AI_STUB_ERROR_RATE = float(os.getenv("AI_STUB_ERROR_RATE", "0"))
+AI_STUB_TIMEOUT_RATE = float(os.getenv("AI_STUB_TIMEOUT_RATE", "0"))
+AI_STUB_MALFORMED_RATE = float(os.getenv("AI_STUB_MALFORMED_RATE", "0"))
+AI_STUB_HANG_SECONDS = float(os.getenv("AI_STUB_HANG_SECONDS", "3600"))
+AI_STUB_STREAM_CHUNKS = int(os.getenv("AI_STUB_STREAM_CHUNKS", "8"))
+AI_STUB_TEMPLATE_PATH = os.getenv("AI_STUB_TEMPLATE_PATH")
+
+@dataclass
+class LLMUsage:
+    prompt_token_count: int
+    candidates_token_count: int
+    cached_content_token_count: int = 0
+
+@dataclass
+class LLMResponse:
+    """Response or streamed chunk; mirrors the attributes AIService reads from Gemini responses"""
+    text: str
+    usage_metadata: Optional[LLMUsage] = None
+
+class GeminiBackend:
+    """Google Gemini through google.generativeai, constrained to the response schema"""
+
+    def __init__(self, model_name: str):
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not found in environment variables.")
+
+        # google.generativeai pulls in gRPC and protobuf, so it is only imported here
+        import google.generativeai as genai
+        self._genai = genai
+        genai.configure(api_key=api_key)
+        self.model_name = model_name
+        self.model = genai.GenerativeModel(model_name)
+
+    def _generation_config(self, response_schema: Dict[str, Any]):
+        return self._genai.GenerationConfig(
+            response_mime_type="application/json",
+            response_schema=response_schema
+        )
+
+    def generate(self, prompt: str, response_schema: Dict[str, Any]):
+        return self.model.generate_content(prompt, generation_config=self._generation_config(response_schema))
+
+    async def generate_async(self, prompt: str, response_schema: Dict[str, Any]):
+        return await self.model.generate_content_async(
+            prompt, generation_config=self._generation_config(response_schema)
+        )
+
+    async def stream_async(self, prompt: str, response_schema: Dict[str, Any]) -> AsyncIterator[Any]:
+        return await self.model.generate_content_async(
+            prompt, generation_config=self._generation_config(response_schema), stream=True
+        )
+
+    def count_tokens(self, prompt: str) -> int:
+        return self.model.count_tokens(prompt).total_tokens
+
+class _SafeFormatDict(dict):
+    """Leaves unknown placeholders intact instead of raising KeyError"""
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+# Item ids in batched prompts, which are serialized as compact JSON
+_PROMPT_ID_PATTERN = re.compile(r'"id":"([^"]*)"')
+
+class StubBackend:
+    """
+    Deterministic offline backend for load testing the AI code paths.
+
+    Latencies follow a log-normal distribution around AI_STUB_LATENCY_MS, and
+    calls fail, hang past any timeout or return malformed JSON at the
+    configured rates. Latencies and failures come from a seeded generator, so a
+    run with the same seed and call order behaves the same. Output is derived
+    from the response schema, or from a template file whose strings may use
+    profile fields such as {name} or {age_range}, and is stable per prompt.
+    """
+
+    def __init__(self, seed: int = AI_STUB_SEED, latency_ms: float = AI_STUB_LATENCY_MS,
+                 latency_sigma: float = AI_STUB_LATENCY_SIGMA, error_rate: float = AI_STUB_ERROR_RATE,
+                 timeout_rate: float = AI_STUB_TIMEOUT_RATE, malformed_rate: float = AI_STUB_MALFORMED_RATE,
+                 template_path: Optional[str] = AI_STUB_TEMPLATE_PATH):
+        self.model_name = "stub"
+        self.rng = random.Random(seed)
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.malformed_rate = malformed_rate
+        self.template = None
+        if template_path:
+            with open(template_path, "r", encoding="utf-8") as template_file:
+                self.template = json.load(template_file)
+
+    def _plan_call(self) -> tuple[float, str]:
+        """Draw the latency (seconds) and outcome of the next call"""
+        latency = self.latency_ms * self.rng.lognormvariate(0, self.latency_sigma) if self.latency_sigma else self.latency_ms
+        roll = self.rng.random()
+        if roll < self.error_rate:
+            outcome = "error"
+        elif roll < self.error_rate + self.timeout_rate:
+            outcome = "timeout"
+        elif roll < self.error_rate + self.timeout_rate + self.malformed_rate:
+            outcome = "malformed"
+        else:
+            outcome = "ok"
+        return latency / 1000, outcome
+
+    def render(self, prompt: str, response_schema: Dict[str, Any]) -> str:
+        """JSON text for the schema's sections, stable for a given prompt"""
+        profile_parser = IncrementalObjectParser()
+        profile_parser.feed(prompt)
+        values = _SafeFormatDict({key: value for key, value in profile_parser.members.items() if isinstance(value, str)})
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8]
+
+        output = {}
+        for section, section_schema in response_schema.get("properties", {}).items():
+            if self.template and section in self.template:
+                output[section] = [
+                    {key: value.format_map(values) if isinstance(value, str) else value for key, value in item.items()}
+                    for item in self.template[section]
+                ]
+                continue
+            fields = list(section_schema["items"]["properties"])
+            # Batched prompts list their items by id; answer each one under the id it was given
+            ids = _PROMPT_ID_PATTERN.findall(prompt) if "id" in fields else []
+            output[section] = [
+                {
+                    field: item_id if field == "id" else f"Stub {field} {item_id} for {values.get('name', 'profile')} ({digest})"
+                    for field in fields
+                }
+                for item_id in ids or [str(number) for number in range(1, 4)]
+            ]
+        return json.dumps(output)
+
+    def _response(self, prompt: str, text: str) -> LLMResponse:
+        return LLMResponse(text, LLMUsage(len(prompt) // 4, len(text) // 4))
+
+    def _outcome_text(self, prompt: str, response_schema: Dict[str, Any], outcome: str) -> str:
+        if outcome == "error":
+            raise ConnectionError("Injected stub backend failure")
+        text = self.render(prompt, response_schema)
+        if outcome == "malformed":
+            return text[:len(text) // 2]
+        return text
+
+    def generate(self, prompt: str, response_schema: Dict[str, Any]) -> LLMResponse:
+        latency, outcome = self._plan_call()
+        time.sleep(latency)
+        # The blocking call has no deadline to run into, so a timeout surfaces directly
+        if outcome == "timeout":
+            raise TimeoutError("Injected stub backend timeout")
+        return self._response(prompt, self._outcome_text(prompt, response_schema, outcome))
+
+    async def generate_async(self, prompt: str, response_schema: Dict[str, Any]) -> LLMResponse:
+        latency, outcome = self._plan_call()
+        await asyncio.sleep(AI_STUB_HANG_SECONDS if outcome == "timeout" else latency)
+        return self._response(prompt, self._outcome_text(prompt, response_schema, outcome))
+
+    async def stream_async(self, prompt: str, response_schema: Dict[str, Any]) -> AsyncIterator[LLMResponse]:
+        latency, outcome = self._plan_call()
+        if outcome == "error":
+            await asyncio.sleep(latency)
+            raise ConnectionError("Injected stub backend failure")
+        text = self._outcome_text(prompt, response_schema, outcome)
+
+        async def chunks():
+            if outcome == "timeout":
+                await asyncio.sleep(AI_STUB_HANG_SECONDS)
+            # The first chunk arrives after a third of the latency, the rest evenly after it
+            chunk_count = max(1, AI_STUB_STREAM_CHUNKS)
+            chunk_size = -(-len(text) // chunk_count)
+            for number in range(chunk_count):
+                delay = latency / 3 if number == 0 else latency * 2 / 3 / max(1, chunk_count - 1)
+                await asyncio.sleep(delay)
+                chunk = text[number * chunk_size:(number + 1) * chunk_size]
+                yield self._response(prompt, chunk) if number == chunk_count - 1 else LLMResponse(chunk)
+
+        return chunks()
+
+    def count_tokens(self, prompt: str) -> int:
+        return len(prompt) // 4
+
+def create_backend(model_name: str, name: Optional[str] = None):
+    """Instantiate the backend named by AI_BACKEND (or name)"""
+    backend_name = (name or AI_BACKEND).strip().lower()
+    if backend_name == "gemini":
+        return GeminiBackend(model_name)
+    if backend_name == "stub":
+        return StubBackend()
+    raise ValueError(f"Unknown AI_BACKEND '{backend_name}', expected 'gemini' or 'stub'")
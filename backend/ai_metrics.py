@@ -0,0 +1,113 @@
+import time
+import bisect
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
+
+# Histogram bucket upper bounds for latencies (ms) and token counts; the last bucket is unbounded
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 20000, 40000)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2000, 4000, 8000, 16000)
+
+# Process-wide counters and histograms for AI service behaviour
+_lock = threading.Lock()
+_counters: Dict[str, int] = defaultdict(int)
+_histograms: Dict[str, "Histogram"] = {}
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum and max"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (max for the overflow bucket)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank:
+                return float(bound)
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"le_{bound}" for bound in self.buckets] + ["le_inf"]
+        return {
+            "count": self.count,
+            "sum": round(self.total, 2),
+            "mean": round(self.total / self.count, 2) if self.count else None,
+            "max": round(self.max, 2),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip(labels, self.bucket_counts))
+        }
+
+def increment(name: str, amount: int = 1):
+    """Add amount to the named counter"""
+    with _lock:
+        _counters[name] += amount
+
+def observe(name: str, value: float, buckets=LATENCY_BUCKETS_MS):
+    """Record a value in the named histogram; buckets apply when the histogram is first created"""
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram(buckets)
+        histogram.observe(value)
+
+@contextmanager
+def timer(name: str):
+    """Record the duration of the block, in milliseconds, in the named histogram"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, (time.perf_counter() - start) * 1000)
+
+def get_counters() -> Dict[str, int]:
+    """Return a copy of all counters"""
+    with _lock:
+        return dict(_counters)
+
+def _ratio(numerator: int, denominator: int) -> Optional[float]:
+    return round(numerator / denominator, 4) if denominator else None
+
+def snapshot() -> Dict[str, Any]:
+    """Counters, histograms and the derived rates, for the metrics endpoint"""
+    with _lock:
+        counters = dict(_counters)
+        histograms = {name: histogram.snapshot() for name, histogram in _histograms.items()}
+
+    cache_hits = counters.get("insights_cache_hits", 0)
+    cache_misses = counters.get("insights_cache_misses", 0)
+    served_ai = counters.get("insights_served_ai", 0)
+    served_fallback = counters.get("insights_served_rules", 0) + counters.get("insights_served_partial", 0)
+    return {
+        "counters": counters,
+        "histograms": histograms,
+        "rates": {
+            "cache_hit_ratio": _ratio(cache_hits, cache_hits + cache_misses),
+            "fallback_rate": _ratio(served_fallback, served_ai + served_fallback),
+            "parse_failure_rate": _ratio(counters.get("parse_failures", 0), counters.get("responses_parsed", 0)),
+            "gemini_error_rate": _ratio(counters.get("gemini_errors", 0), counters.get("gemini_calls", 0))
+        }
+    }
+
+def reset():
+    """Clear all counters and histograms"""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
@@ -1,28 +1,321 @@
 import os
-import google.generativeai as genai
+import time
+import random
+import asyncio
 from dotenv import load_dotenv
 import json
-from typing import Dict, Any
+import hashlib
+from functools import lru_cache
+from typing import Dict, Any, Optional, AsyncIterator, Tuple
 from bson import ObjectId
 from datetime import datetime
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from json_stream import IncrementalObjectParser
+import ai_metrics
+from ai_backends import AI_BACKEND, create_backend
 
 # Load environment variables
 load_dotenv()
 
+MODEL_NAME = "gemini-2.5-flash"
+
+# Bump whenever the prompt changes so previously cached insights are regenerated
+PROMPT_VERSION = "3"
+
+# Profile fields sent to the model; identifiers, timestamps, derived fields and media URLs are left out
+INSIGHT_PROFILE_FIELDS = [
+    "name", "pronouns", "age_range", "location", "willing_to_relocate",
+    "height", "build", "eye_color", "hair_color", "ethnicity",
+    "acting_schools", "workshops", "coaches", "stage_experience", "film_experience",
+    "special_skills", "union_status", "preferred_genres", "career_goals",
+    "bio", "tagline"
+]
+
+# Rough characters per token for English and JSON text, used for prompt size estimates
+CHARS_PER_TOKEN = 4
+
+# Call limits for Gemini requests
+AI_CALL_TIMEOUT_SECONDS = float(os.getenv("AI_CALL_TIMEOUT_SECONDS", "20"))
+AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "4"))
+AI_MAX_RETRIES = int(os.getenv("AI_MAX_RETRIES", "2"))
+AI_RETRY_BASE_DELAY_SECONDS = float(os.getenv("AI_RETRY_BASE_DELAY_SECONDS", "0.5"))
+AI_BREAKER_FAILURE_THRESHOLD = int(os.getenv("AI_BREAKER_FAILURE_THRESHOLD", "5"))
+AI_BREAKER_RESET_SECONDS = float(os.getenv("AI_BREAKER_RESET_SECONDS", "30"))
+
+@lru_cache(maxsize=None)
+def transient_errors() -> tuple:
+    """Errors worth retrying: rate limits, overload and timeouts"""
+    from google.api_core import exceptions as google_exceptions
+    return (
+        google_exceptions.ResourceExhausted,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.InternalServerError,
+        google_exceptions.DeadlineExceeded,
+        asyncio.TimeoutError,
+        ConnectionError,
+    )
+
+class AIServiceUnavailable(Exception):
+    """Raised when Gemini can't produce insights and callers should fall back"""
+
+class CircuitBreaker:
+    """
+    Stops calling a failing dependency for a cool-down period.
+    
+    After failure_threshold consecutive failures the breaker opens and rejects
+    calls immediately; once reset_seconds have passed a single trial call is
+    let through, and its outcome closes or re-opens the breaker.
+    """
+    
+    def __init__(self, failure_threshold: int = AI_BREAKER_FAILURE_THRESHOLD,
+                 reset_seconds: float = AI_BREAKER_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+    
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+    
+    def allow_request(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True
+        return False
+    
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+    
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self.trial_in_flight = False
+        if self.opened_at is not None or self.consecutive_failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+    
+    def release(self):
+        """Give back an admitted call that was cancelled before it had an outcome"""
+        self.trial_in_flight = False
+
+# Typed schema of the insights object returned by the model
+class LookalikeInsight(BaseModel):
+    name: str
+    reason: str
+
+class ScriptInsight(BaseModel):
+    title: str
+    reason: str
+
+class HeadshotInsight(BaseModel):
+    tip: str
+    reason: str
+
+class CareerAdviceInsight(BaseModel):
+    advice: str
+    reason: str
+
+INSIGHT_SECTION_MODELS = {
+    "lookalikes": LookalikeInsight,
+    "scripts": ScriptInsight,
+    "headshots": HeadshotInsight,
+    "careerAdvice": CareerAdviceInsight,
+}
+
+_SECTION_ADAPTERS = {section: TypeAdapter(list[model]) for section, model in INSIGHT_SECTION_MODELS.items()}
+
+# What each section should contain; field names are enforced by the response schema
+SECTION_INSTRUCTIONS = {
+    "lookalikes": "3 well-known actors they might be compared to on physical attributes, age range and type",
+    "scripts": "3 specific monologues or scenes that would showcase their strengths",
+    "headshots": "3 actionable tips for their next headshot session given their look and career goals",
+    "careerAdvice": "3 pieces of personalized career advice given their experience, skills and goals",
+}
+
+def insights_response_schema(sections) -> Dict[str, Any]:
+    """Response schema constraining the model to a JSON object with the given sections"""
+    properties = {}
+    for section in sections:
+        fields = list(INSIGHT_SECTION_MODELS[section].model_fields)
+        properties[section] = {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {field: {"type": "string"} for field in fields},
+                "required": fields
+            }
+        }
+    return {"type": "object", "properties": properties, "required": list(sections)}
+
+def validate_insight_section(section: str, value: Any) -> Optional[list]:
+    """Validate one section against the typed schema; returns plain dicts, or None if invalid"""
+    adapter = _SECTION_ADAPTERS.get(section)
+    if adapter is None:
+        return None
+    try:
+        return [item.model_dump() for item in adapter.validate_python(value)]
+    except ValidationError:
+        return None
+
+def _is_empty(value: Any) -> bool:
+    if isinstance(value, str):
+        return not value.strip()
+    return value is None or value == [] or value == {}
+
+def project_insight_fields(profile_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the non-empty profile fields that feed the insights prompt"""
+    projected = {}
+    for field in INSIGHT_PROFILE_FIELDS:
+        value = profile_data.get(field)
+        if isinstance(value, str):
+            value = value.strip()
+        elif isinstance(value, list):
+            value = [item.strip() if isinstance(item, str) else item for item in value if not _is_empty(item)]
+        if not _is_empty(value):
+            projected[field] = value
+    return projected
+
+def encode_profile_for_prompt(profile_data: Dict[str, Any]) -> str:
+    """Compact JSON encoding of the insight-relevant profile fields"""
+    return json.dumps(project_insight_fields(profile_data), separators=(",", ":"), ensure_ascii=False, default=str)
+
+@lru_cache(maxsize=None)
+def insight_instruction_prefix(sections: Tuple[str, ...]) -> str:
+    """
+    Static instructions for the requested sections.
+    
+    The prefix is identical for every profile, so it is built once per section
+    set and placed ahead of the profile, where the model's prefix caching applies.
+    """
+    section_lines = "\n".join(f"- {section}: {SECTION_INSTRUCTIONS[section]}" for section in sections)
+    return (
+        "You are an AI casting director and career advisor for actors. "
+        "Analyze the actor profile below and return a JSON object with these keys, each a list of items with a reason:\n"
+        f"{section_lines}\n"
+        "Base every recommendation on the profile data. Be specific, actionable, realistic and industry-appropriate, "
+        "considering experience level, physical attributes and stated goals. Work with whatever fields are present.\n"
+        "Profile:\n"
+    )
+
+def build_insight_prompt(profile_data: Dict[str, Any], sections=tuple(INSIGHT_SECTION_MODELS)) -> str:
+    """Static instruction prefix followed by the compact profile"""
+    return insight_instruction_prefix(tuple(sections)) + encode_profile_for_prompt(profile_data)
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a piece of text"""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def prompt_token_report(profile_data: Dict[str, Any], sections=tuple(INSIGHT_SECTION_MODELS)) -> Dict[str, int]:
+    """
+    Estimated size of the insights prompt for a profile.
+    
+    Returns:
+        Dictionary with prefix, profile and total token estimates plus the number of fields sent
+    """
+    prefix = insight_instruction_prefix(tuple(sections))
+    profile_text = encode_profile_for_prompt(profile_data)
+    return {
+        "prefix_tokens": estimate_tokens(prefix),
+        "profile_tokens": estimate_tokens(profile_text),
+        "total_tokens": estimate_tokens(prefix + profile_text),
+        "profile_fields": len(project_insight_fields(profile_data))
+    }
+
+def profile_insights_cache_key(profile_data: Dict[str, Any]) -> str:
+    """
+    Stable content hash of everything that determines a profile's AI insights.
+    
+    Args:
+        profile_data: Dictionary containing user profile information
+        
+    Returns:
+        Hex digest that changes only when the prompt inputs, prompt version or model change
+    """
+    payload = {
+        "profile": project_insight_fields(profile_data),
+        "prompt_version": PROMPT_VERSION,
+        "model": MODEL_NAME if AI_BACKEND == "gemini" else AI_BACKEND
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+# Articles are referred to by their position in the batch to keep prompts short
+NEWS_INSIGHTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "insights": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"id": {"type": "string"}, "insight": {"type": "string"}},
+                "required": ["id", "insight"]
+            }
+        }
+    },
+    "required": ["insights"]
+}
+
+NEWS_INSIGHTS_PREFIX = (
+    "You are an industry analyst writing for working actors. For each entertainment news article below, "
+    "write one or two sentences on what it means for actors' careers and opportunities. "
+    "Return a JSON object whose \"insights\" list has one entry per article, with the article's \"id\".\n"
+    "Articles:\n"
+)
+
+def build_news_insights_prompt(articles: list) -> str:
+    """Static instruction prefix followed by the batch of articles as compact JSON"""
+    batch = [
+        {"id": str(number), "title": article.get("title", ""), "summary": article.get("summary") or ""}
+        for number, article in enumerate(articles, 1)
+    ]
+    return NEWS_INSIGHTS_PREFIX + json.dumps(batch, separators=(",", ":"), ensure_ascii=False)
+
+def record_prompt_usage(prompt: str, response: Any = None):
+    """Count prompt tokens per call: the local estimate, plus Gemini's reported usage when available"""
+    ai_metrics.increment("prompts")
+    ai_metrics.increment("prompt_tokens_estimated", estimate_tokens(prompt))
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None:
+        prompt_tokens = usage.prompt_token_count or 0
+        output_tokens = usage.candidates_token_count or 0
+        ai_metrics.increment("prompt_tokens", prompt_tokens)
+        ai_metrics.increment("cached_prompt_tokens", getattr(usage, "cached_content_token_count", 0) or 0)
+        ai_metrics.increment("output_tokens", output_tokens)
+        ai_metrics.observe("prompt_tokens_per_call", prompt_tokens, ai_metrics.TOKEN_BUCKETS)
+        ai_metrics.observe("output_tokens_per_call", output_tokens, ai_metrics.TOKEN_BUCKETS)
+
 class AIService:
     """Service class for handling AI-powered profile insights using Google Gemini API"""
     
-    def __init__(self):
-        """Initialize the AI service with Gemini API configuration"""
-        self.api_key = os.getenv("GEMINI_API_KEY")
-        if not self.api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables.")
+    def __init__(self, backend=None):
+        """
+        Initialize the AI service.
+        
+        Args:
+            backend: LLM backend to call; defaults to the one selected by AI_BACKEND
+                (Gemini, or the offline stub for load tests)
+        """
+        self.backend = backend or create_backend(MODEL_NAME)
         
-        # Configure the Gemini API
-        genai.configure(api_key=self.api_key)
+        # Ask for schema-constrained JSON instead of free text
+        self.response_schema = insights_response_schema(list(INSIGHT_SECTION_MODELS))
         
-        # Initialize the generative model
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+        # Call limits; the semaphore is created lazily inside the running event loop
+        self.call_timeout = AI_CALL_TIMEOUT_SECONDS
+        self.max_retries = AI_MAX_RETRIES
+        self.retry_base_delay = AI_RETRY_BASE_DELAY_SECONDS
+        self.max_concurrency = AI_MAX_CONCURRENCY
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.circuit_breaker = CircuitBreaker()
     
     def _serialize_profile_data(self, profile_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -59,36 +352,17 @@ class AIService:
             Dictionary containing AI-generated insights with structured format
         """
         try:
-            prompt = self._create_prompt(profile_data)
-            
-            # Generate content without JSON mode first, then parse manually
-            response = self.model.generate_content(prompt)
-            
-            # Try to extract JSON from the response
-            response_text = response.text.strip()
+            prompt = build_insight_prompt(profile_data)
             
-            # Look for JSON content between ```json and ``` or just try to parse directly
-            if "```json" in response_text:
-                start = response_text.find("```json") + 7
-                end = response_text.find("```", start)
-                if end != -1:
-                    json_text = response_text[start:end].strip()
-                else:
-                    json_text = response_text[start:].strip()
-            elif response_text.startswith("{") and response_text.endswith("}"):
-                json_text = response_text
-            else:
-                # Try to find JSON-like content
-                import re
-                json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                if json_match:
-                    json_text = json_match.group()
-                else:
-                    raise ValueError("No valid JSON found in response")
+            ai_metrics.increment("gemini_calls")
+            with ai_metrics.timer("gemini_call_latency_ms"):
+                response = self.backend.generate(prompt, self.response_schema)
+            record_prompt_usage(prompt, response)
             
-            return json.loads(json_text)
+            return self._parse_response_text(response.text)
             
         except Exception as e:
+            ai_metrics.increment("gemini_errors")
             print(f"Error generating AI insights: {e}")
             return {
                 "error": "Failed to generate AI insights.",
@@ -99,68 +373,243 @@ class AIService:
                 "careerAdvice": []
             }
     
-    def _create_prompt(self, profile_data: Dict[str, Any]) -> str:
+    def count_prompt_tokens(self, profile_data: Dict[str, Any]) -> Dict[str, int]:
+        """Prompt size report for a profile, including Gemini's exact token count"""
+        report = prompt_token_report(profile_data)
+        report["counted_tokens"] = self.backend.count_tokens(build_insight_prompt(profile_data))
+        return report
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    async def _generate_text(self, prompt: str, response_schema: Dict[str, Any]) -> str:
         """
-        Creates the prompt to be sent to the LLM.
+        Calls Gemini without blocking the event loop, retrying transient errors.
+        
+        Each attempt holds a slot of the global concurrency semaphore and is
+        bounded by the per-call timeout; retries back off exponentially with
+        full jitter.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                queued_at = time.perf_counter()
+                async with self._get_semaphore():
+                    # Time spent waiting for a slot shows whether AI_MAX_CONCURRENCY is too low
+                    ai_metrics.observe("gemini_queue_wait_ms", (time.perf_counter() - queued_at) * 1000)
+                    ai_metrics.increment("gemini_calls")
+                    with ai_metrics.timer("gemini_call_latency_ms"):
+                        response = await asyncio.wait_for(
+                            self.backend.generate_async(prompt, response_schema),
+                            timeout=self.call_timeout
+                        )
+                record_prompt_usage(prompt, response)
+                return response.text
+            except transient_errors() as e:
+                ai_metrics.increment("gemini_errors")
+                if isinstance(e, asyncio.TimeoutError):
+                    ai_metrics.increment("gemini_timeouts")
+                if attempt >= self.max_retries:
+                    raise
+                ai_metrics.increment("gemini_retries")
+                delay = random.uniform(0, self.retry_base_delay * (2 ** attempt))
+                print(f"Transient Gemini error ({type(e).__name__}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+            except Exception:
+                ai_metrics.increment("gemini_errors")
+                raise
+    
+    async def generate_profile_insights_async(self, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generates AI-powered insights for a user profile without blocking the event loop.
         
         Args:
             profile_data: Dictionary containing user profile information
             
         Returns:
-            Formatted prompt string for the AI model
-        """
-        # Serialize the profile data to handle ObjectId and datetime objects
-        serialized_data = self._serialize_profile_data(profile_data)
-        
-        prompt = f"""
-You are an AI casting director and career advisor for actors. Your task is to analyze the provided actor profile and generate a JSON object with personalized insights.
-
-**Instructions:**
-
-1. **Analyze the Profile:** Carefully review the following actor profile data:
-   ```json
-   {json.dumps(serialized_data, indent=2)}
-   ```
-
-2. **Generate Insights:** Based on the profile, provide the following insights in a JSON object with the specified structure.
-
-   * **`lookalikes`**: Suggest 3 well-known actors the user might be compared to based on their physical attributes, age range, and type. Each should include "name" and "reason" fields.
-   * **`scripts`**: Recommend 3 specific monologues or scenes that would showcase their strengths. Each should include "title" and "reason" fields.
-   * **`headshots`**: Provide 3 actionable tips for their next headshot session based on their physical attributes and career goals. Each should include "tip" and "reason" fields.
-   * **`careerAdvice`**: Offer 3 pieces of personalized career advice based on their experience, skills, and goals. Each should include "advice" and "reason" fields.
-
-3. **Output Format:** The final output must be a valid JSON object with this exact structure:
-   ```json
-   {{
-     "lookalikes": [
-       {{"name": "Actor Name", "reason": "Explanation of similarity"}},
-       {{"name": "Actor Name", "reason": "Explanation of similarity"}},
-       {{"name": "Actor Name", "reason": "Explanation of similarity"}}
-     ],
-     "scripts": [
-       {{"title": "Script/Monologue Title", "reason": "Why this is recommended"}},
-       {{"title": "Script/Monologue Title", "reason": "Why this is recommended"}},
-       {{"title": "Script/Monologue Title", "reason": "Why this is recommended"}}
-     ],
-     "headshots": [
-       {{"tip": "Specific headshot tip", "reason": "Why this tip is important"}},
-       {{"tip": "Specific headshot tip", "reason": "Why this tip is important"}},
-       {{"tip": "Specific headshot tip", "reason": "Why this tip is important"}}
-     ],
-     "careerAdvice": [
-       {{"advice": "Career advice", "reason": "Why this advice is relevant"}},
-       {{"advice": "Career advice", "reason": "Why this advice is relevant"}},
-       {{"advice": "Career advice", "reason": "Why this advice is relevant"}}
-     ]
-   }}
-   ```
-
-**Important Guidelines:**
-- Base recommendations on the actual profile data provided
-- Be specific and actionable in your suggestions
-- Consider the actor's experience level, physical attributes, and stated goals
-- Ensure all recommendations are professional and industry-appropriate
-- If certain profile fields are missing, work with available information
-- Make recommendations that are realistic and achievable
-"""
-        return prompt
\ No newline at end of file
+            Dictionary containing AI-generated insights with structured format
+            
+        Raises:
+            AIServiceUnavailable: If Gemini is degraded (circuit open) or the call failed,
+                so the caller can fall back to rule-based insights
+        """
+        prompt = build_insight_prompt(profile_data)
+        response_text = await self._call_gemini(prompt, self.response_schema)
+        insights, missing_sections = self._validate_response(response_text, list(INSIGHT_SECTION_MODELS))
+        
+        # Ask again for just the sections that were missing or malformed
+        if missing_sections:
+            ai_metrics.increment("repair_attempts")
+            repair_prompt = build_insight_prompt(profile_data, missing_sections)
+            repair_text = await self._call_gemini(repair_prompt, insights_response_schema(missing_sections))
+            repaired, still_missing = self._validate_response(repair_text, missing_sections)
+            insights.update(repaired)
+            if still_missing:
+                ai_metrics.increment("repair_failures")
+                raise AIServiceUnavailable(f"Gemini response missing sections: {', '.join(still_missing)}")
+        
+        # Keep the canonical section order
+        return {section: insights[section] for section in INSIGHT_SECTION_MODELS}
+    
+    async def generate_news_insights_async(self, articles: list) -> list:
+        """
+        Generates actor-focused insights for several news articles in one call.
+        
+        Args:
+            articles: Article dictionaries with title and summary
+            
+        Returns:
+            List aligned with articles holding each insight, or None where the
+            model returned nothing usable for that article
+            
+        Raises:
+            AIServiceUnavailable: If Gemini is degraded or the call failed
+        """
+        prompt = build_news_insights_prompt(articles)
+        response_text = await self._call_gemini(prompt, NEWS_INSIGHTS_SCHEMA)
+        ai_metrics.increment("responses_parsed")
+        try:
+            items = self._parse_response_text(response_text).get("insights")
+        except ValueError:
+            ai_metrics.increment("parse_failures")
+            items = None
+        
+        insights = [None] * len(articles)
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict) or not isinstance(item.get("insight"), str):
+                continue
+            position = str(item.get("id", "")).strip()
+            if position.isdigit() and 1 <= int(position) <= len(articles) and item["insight"].strip():
+                insights[int(position) - 1] = item["insight"].strip()
+        return insights
+    
+    async def _call_gemini(self, prompt: str, response_schema: Dict[str, Any]) -> str:
+        """Make one Gemini call through the circuit breaker"""
+        if not self.circuit_breaker.allow_request():
+            ai_metrics.increment("breaker_rejections")
+            raise AIServiceUnavailable("Gemini circuit breaker is open")
+        try:
+            response_text = await self._generate_text(prompt, response_schema)
+        except Exception as e:
+            self.circuit_breaker.record_failure()
+            raise AIServiceUnavailable(f"Gemini call failed: {e}") from e
+        except BaseException:
+            self.circuit_breaker.release()
+            raise
+        self.circuit_breaker.record_success()
+        return response_text
+    
+    def _validate_response(self, response_text: str, sections: list) -> Tuple[Dict[str, Any], list]:
+        """
+        Parses a response and validates the expected sections against the typed schema.
+        
+        Returns:
+            Tuple of (valid sections, names of sections that are missing or invalid)
+        """
+        ai_metrics.increment("responses_parsed")
+        try:
+            data = self._parse_response_text(response_text)
+        except ValueError:
+            ai_metrics.increment("parse_failures")
+            data = {}
+        
+        valid_sections = {}
+        missing_sections = []
+        for section in sections:
+            items = validate_insight_section(section, data.get(section))
+            if items is None:
+                missing_sections.append(section)
+            else:
+                valid_sections[section] = items
+        if missing_sections:
+            ai_metrics.increment("invalid_sections", len(missing_sections))
+        return valid_sections, missing_sections
+    
+    async def stream_profile_insights(self, profile_data: Dict[str, Any]) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Streams AI-generated insights section by section.
+        
+        Uses Gemini's streaming response and yields each top-level section of the
+        insights object as soon as its JSON value is complete.
+        
+        Args:
+            profile_data: Dictionary containing user profile information
+            
+        Yields:
+            Tuples of (section name, section value)
+            
+        Raises:
+            AIServiceUnavailable: If Gemini is degraded or the stream failed; sections
+                already yielded remain valid
+        """
+        if not self.circuit_breaker.allow_request():
+            ai_metrics.increment("breaker_rejections")
+            raise AIServiceUnavailable("Gemini circuit breaker is open")
+        
+        prompt = build_insight_prompt(profile_data)
+        parser = IncrementalObjectParser()
+        try:
+            async with self._get_semaphore():
+                ai_metrics.increment("gemini_streams")
+                started = time.perf_counter()
+                first_section = True
+                deadline = time.monotonic() + self.call_timeout
+                response = await asyncio.wait_for(
+                    self.backend.stream_async(prompt, self.response_schema),
+                    timeout=self.call_timeout
+                )
+                chunks = response.__aiter__()
+                usage_chunk = None
+                while not parser.finished:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError("Gemini stream exceeded the call deadline")
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), timeout=remaining)
+                    except StopAsyncIteration:
+                        break
+                    # Every chunk carries the running usage totals; the last one is final
+                    usage_chunk = chunk
+                    for section, value in parser.feed(chunk.text):
+                        items = validate_insight_section(section, value)
+                        if items is None:
+                            ai_metrics.increment("invalid_sections")
+                            continue
+                        if first_section:
+                            ai_metrics.observe("gemini_stream_first_section_ms", (time.perf_counter() - started) * 1000)
+                            first_section = False
+                        yield section, items
+                ai_metrics.observe("gemini_stream_latency_ms", (time.perf_counter() - started) * 1000)
+            record_prompt_usage(prompt, usage_chunk)
+        except Exception as e:
+            ai_metrics.increment("gemini_stream_errors")
+            self.circuit_breaker.record_failure()
+            raise AIServiceUnavailable(f"Gemini stream failed: {e}") from e
+        except BaseException:
+            # Client went away mid-stream; that says nothing about Gemini's health
+            self.circuit_breaker.release()
+            raise
+        self.circuit_breaker.record_success()
+    
+    def _parse_response_text(self, text: str) -> Dict[str, Any]:
+        """
+        Extracts the insights JSON object from the model's response text.
+        
+        Surrounding prose or code fences are skipped, and members that completed
+        before a truncated or malformed tail are kept.
+        
+        Args:
+            text: Raw response text from the model
+            
+        Returns:
+            Parsed top-level members of the insights object
+            
+        Raises:
+            ValueError: If no JSON object could be found
+        """
+        parser = IncrementalObjectParser()
+        parser.feed(text)
+        if not parser.started or (not parser.members and not parser.finished):
+            raise ValueError("No valid JSON found in response")
+        return parser.members
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Offline load test of the insights path the profile endpoints serve: cache
+lookup, enqueue_insight_job, then process_insight_job on the job workers
+(coalescing, retries, timeouts and backoff) against the stub LLM backend.
+
+Usage:
+    python bench_ai_insights.py [request_count] [distinct_profiles] [concurrency] [workers] [--mongo]
+
+The stub is configured through the AI_STUB_* environment variables, e.g.
+    AI_STUB_LATENCY_MS=1500 AI_STUB_ERROR_RATE=0.05 python bench_ai_insights.py 2000 200 100 8
+Latency runs from the request until its job completes or fails. Profiles and jobs
+live in an in-memory database unless --mongo uses the configured MongoDB (the
+synthetic profiles are removed afterwards).
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import asyncio
+
+import mongomock
+import numpy as np
+from fastapi.responses import JSONResponse
+
+# Force the offline backend before the AI modules read their configuration
+os.environ["AI_BACKEND"] = "stub"
+# Scale the breaker reset and job retry backoff down so failed jobs retry within a run
+os.environ.setdefault("AI_BREAKER_RESET_SECONDS", "1")
+os.environ.setdefault("AI_INSIGHT_JOB_RETRY_BASE_SECONDS", "1")
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import ai_metrics
+from bson import ObjectId
+from main import (
+    claim_insight_job,
+    ensure_indexes,
+    get_db,
+    get_insight_job,
+    process_insight_job,
+    resolve_profile_ai_insights,
+)
+
+# How often requests check on their job and idle workers look for one; well below the stub latency
+JOB_CHECK_SECONDS = 0.01
+
+AGE_RANGES = ["18-25", "26-35", "36-45", "46-55"]
+EYE_COLORS = ["Blue", "Brown", "Green", "Hazel"]
+
+def synthetic_profile(number: int) -> dict:
+    rng = random.Random(number)
+    return {
+        "_id": ObjectId(),
+        "user_id": ObjectId(),
+        "name": f"Bench Actor {number}",
+        "age_range": rng.choice(AGE_RANGES),
+        "eye_color": rng.choice(EYE_COLORS),
+        "stage_experience": rng.random() < 0.5,
+    }
+
+async def run_benchmark(request_count: int, distinct_profiles: int, concurrency: int, workers: int, db):
+    # Skewed popularity, so hot profiles are requested concurrently
+    rng = random.Random(42)
+    profiles = [synthetic_profile(number) for number in range(distinct_profiles)]
+    db.profiles.insert_many(profiles)
+    weights = [1 / (rank + 1) for rank in range(distinct_profiles)]
+    requests = rng.choices(profiles, weights=weights, k=request_count)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failed_jobs = 0
+
+    async def one_request(profile):
+        nonlocal failed_jobs
+        async with semaphore:
+            start = time.perf_counter()
+            response = await asyncio.to_thread(resolve_profile_ai_insights, db, profile)
+            if isinstance(response, JSONResponse):
+                job_id = json.loads(response.body)["job_id"]
+                while True:
+                    job = await asyncio.to_thread(get_insight_job, db, job_id)
+                    if job["status"] in ("completed", "failed"):
+                        failed_jobs += job["status"] == "failed"
+                        break
+                    await asyncio.sleep(JOB_CHECK_SECONDS)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    stop_event = asyncio.Event()
+
+    async def job_worker(worker_id: str):
+        # The same claim/process cycle as run_insight_job_worker, against the benchmark database
+        while not stop_event.is_set():
+            job = await asyncio.to_thread(claim_insight_job, db, worker_id)
+            if job:
+                await process_insight_job(db, job)
+            else:
+                await asyncio.sleep(JOB_CHECK_SECONDS)
+
+    ai_metrics.reset()
+    worker_tasks = [asyncio.create_task(job_worker(f"bench-{number}")) for number in range(workers)]
+    start = time.perf_counter()
+    await asyncio.gather(*(one_request(profile) for profile in requests))
+    elapsed = time.perf_counter() - start
+    stop_event.set()
+    await asyncio.gather(*worker_tasks)
+    db.profiles.delete_many({"_id": {"$in": [profile["_id"] for profile in profiles]}})
+
+    latencies = np.array(latencies)
+    metrics = ai_metrics.snapshot()
+    counters = metrics["counters"]
+    print(f"{request_count:,} requests over {distinct_profiles:,} profiles at concurrency {concurrency} "
+          f"with {workers} job workers: "
+          f"{request_count / elapsed:,.0f} req/s, "
+          f"p50={np.percentile(latencies, 50):.0f}ms p95={np.percentile(latencies, 95):.0f}ms "
+          f"max={latencies.max():.0f}ms")
+    print(f"LLM calls: {counters.get('gemini_calls', 0)}, "
+          f"jobs: {counters.get('ai_insight_generation_calls', 0)}, "
+          f"coalesced: {counters.get('ai_insight_generation_coalesced', 0)}, "
+          f"cache hits: {counters.get('insights_served_cache', 0)}, "
+          f"failed jobs: {failed_jobs}, "
+          f"retries: {counters.get('gemini_retries', 0)}, "
+          f"timeouts: {counters.get('gemini_timeouts', 0)}, "
+          f"breaker rejections: {counters.get('breaker_rejections', 0)}")
+    print(json.dumps(metrics["rates"]))
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    request_count = int(args[0]) if len(args) > 0 else 1_000
+    distinct_profiles = int(args[1]) if len(args) > 1 else 100
+    concurrency = int(args[2]) if len(args) > 2 else 50
+    workers = int(args[3]) if len(args) > 3 else 4
+    db = get_db() if "--mongo" in sys.argv else mongomock.MongoClient().db
+    ensure_indexes(db)
+    asyncio.run(run_benchmark(request_count, distinct_profiles, concurrency, workers, db))
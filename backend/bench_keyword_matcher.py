@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark of keyword insight generation over synthetic news articles,
+comparing the previous plain substring scans with the word-start matcher.
+Both check one article at a time.
+
+Usage:
+    python bench_keyword_matcher.py [article_count]
+"""
+
+import sys
+import os
+import time
+import random
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from keyword_matcher import (
+    INSIGHT_KEYWORDS,
+    INSIGHT_TEXT,
+    DEFAULT_INSIGHT,
+    generate_keyword_insights_for_articles,
+)
+from train_news_classifier import categorize_articles
+
+WORDS = ["studio", "announced", "today", "the", "new", "project", "actors", "casting", "netflix", "festival",
+         "series", "director", "audition", "virtual", "inclusion", "season", "premiere", "award", "producer",
+         "contract", "release", "schedule", "production", "budget", "critics", "audience", "streaming"]
+
+def random_article(rng: random.Random) -> dict:
+    return {
+        "title": " ".join(rng.choices(WORDS, k=8)).title(),
+        "summary": " ".join(rng.choices(WORDS, k=60)),
+    }
+
+def substring_insights(title: str, summary: str) -> str:
+    """Insight generation as it was before the shared matcher (plain substring hits)"""
+    text = f"{title} {summary}".lower()
+    insights = [
+        INSIGHT_TEXT[name] for name, keywords in INSIGHT_KEYWORDS.items()
+        if any(keyword in text for keyword in keywords)
+    ]
+    return " ".join(insights) if insights else DEFAULT_INSIGHT
+
+def run_benchmark(article_count: int = 10_000):
+    rng = random.Random(42)
+    articles = [random_article(rng) for _ in range(article_count)]
+
+    start = time.perf_counter()
+    for article in articles:
+        substring_insights(article["title"], article["summary"])
+    substring_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    generate_keyword_insights_for_articles(articles)
+    matcher_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    categorize_articles(articles)
+    category_seconds = time.perf_counter() - start
+
+    print(f"{article_count:,} articles: substring scans {substring_seconds * 1000:.1f}ms, "
+          f"keyword matcher {matcher_seconds * 1000:.1f}ms, "
+          f"categories {category_seconds * 1000:.1f}ms")
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    run_benchmark(count)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark of news full-text search latency against the configured MongoDB.
+
+Synthetic articles are written to a separate database (next_cinema_bench),
+which is dropped afterwards unless --keep is given.
+
+Usage:
+    python bench_news_search.py [article_count] [query_count] [--keep]
+"""
+
+import sys
+import os
+import time
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import get_db, ensure_indexes, search_news_articles
+
+BENCH_DATABASE = "next_cinema_bench"
+SOURCES = ["Variety", "Deadline", "The Hollywood Reporter", "IMDb", "Backstage"]
+WORDS = ["casting", "audition", "netflix", "streaming", "festival", "premiere", "director", "series", "season",
+         "studio", "box", "office", "award", "nomination", "drama", "comedy", "thriller", "sequel", "franchise",
+         "showrunner", "producer", "actor", "actress", "ensemble", "pilot", "renewal", "cancelled", "budget",
+         "animation", "documentary", "broadway", "musical", "biopic", "horror", "remake", "trailer", "release"]
+QUERIES = ["casting netflix", "festival premiere", "horror sequel", "broadway musical", "showrunner renewal",
+           "documentary", "\"box office\"", "award nomination drama"]
+
+def random_article(rng: random.Random, number: int, now: datetime) -> dict:
+    published_at = now - timedelta(minutes=rng.randrange(60 * 24 * 365))
+    return {
+        "title": " ".join(rng.choices(WORDS, k=8)).title(),
+        "summary": " ".join(rng.choices(WORDS, k=40)),
+        "source": rng.choice(SOURCES),
+        "url": f"https://example.com/bench/{number}",
+        "image_url": None,
+        "category": "entertainment",
+        "published_at": published_at,
+        "fetched_at": published_at,
+        "ai_insights": None
+    }
+
+def run_benchmark(db, article_count: int = 100_000, query_count: int = 200, limit: int = 20):
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    db.news_articles.drop()
+    ensure_indexes(db)
+
+    start = time.perf_counter()
+    for offset in range(0, article_count, 5_000):
+        db.news_articles.insert_many(
+            [random_article(rng, number, now) for number in range(offset, min(offset + 5_000, article_count))]
+        )
+    print(f"Inserted {article_count:,} articles in {time.perf_counter() - start:.1f}s")
+
+    def measure(label, **kwargs):
+        latencies = []
+        for _ in range(query_count):
+            query = rng.choice(QUERIES)
+            start = time.perf_counter()
+            search_news_articles(db, query, limit, **kwargs)
+            latencies.append((time.perf_counter() - start) * 1000)
+        latencies = np.array(latencies)
+        print(f"{label}: p50={np.percentile(latencies, 50):.1f}ms "
+              f"p95={np.percentile(latencies, 95):.1f}ms max={latencies.max():.1f}ms")
+
+    measure("First page")
+    measure("Last 30 days", published_from=now - timedelta(days=30))
+
+    # Follow cursors through the first pages of one query
+    cursor = None
+    latencies = []
+    for _ in range(10):
+        start = time.perf_counter()
+        _, cursor = search_news_articles(db, QUERIES[0], limit, cursor=cursor)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if cursor is None:
+            break
+    print("Pages 1-10 by cursor: " + " ".join(f"{latency:.1f}ms" for latency in latencies))
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    count = int(args[0]) if len(args) > 0 else 100_000
+    queries = int(args[1]) if len(args) > 1 else 200
+    bench_db = get_db().client.get_database(BENCH_DATABASE)
+    try:
+        run_benchmark(bench_db, count, queries)
+    finally:
+        if "--keep" not in sys.argv:
+            bench_db.client.drop_database(BENCH_DATABASE)
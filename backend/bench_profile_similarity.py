@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the profile similarity index with synthetic profiles.
+
+Usage:
+    python bench_profile_similarity.py [profile_count] [query_count]
+"""
+
+import sys
+import os
+import time
+import random
+
+import numpy as np
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from profile_similarity import (
+    ProfileSimilarityIndex,
+    AGE_RANGES,
+    BUILDS,
+    EYE_COLORS,
+    HAIR_COLORS,
+)
+
+GENRES = ["Drama", "Comedy", "Action", "Horror", "Thriller", "Romance", "Sci-Fi", "Musical", "Documentary", "Fantasy"]
+SKILLS = ["Singing", "Dancing", "Martial Arts", "Piano", "Guitar", "Stunts", "Horse Riding",
+          "Spanish", "French", "Accents", "Juggling", "Swimming", "Fencing", "Improv", "Stage Combat"]
+
+def random_profile(rng: random.Random) -> dict:
+    return {
+        "age_range": rng.choice(AGE_RANGES),
+        "build": rng.choice(BUILDS).title(),
+        "eye_color": rng.choice(EYE_COLORS).title(),
+        "hair_color": rng.choice(HAIR_COLORS).title(),
+        "preferred_genres": rng.sample(GENRES, rng.randint(0, 3)),
+        "special_skills": rng.sample(SKILLS, rng.randint(0, 4)),
+        "stage_experience": rng.random() < 0.5,
+        "film_experience": rng.random() < 0.5,
+        "willing_to_relocate": rng.random() < 0.3,
+    }
+
+def run_benchmark(profile_count: int = 100_000, query_count: int = 1_000, k: int = 10):
+    rng = random.Random(42)
+    profiles = [random_profile(rng) for _ in range(profile_count)]
+
+    index = ProfileSimilarityIndex(initial_capacity=1024)
+    start = time.perf_counter()
+    index.upsert_many((str(i), profile) for i, profile in enumerate(profiles))
+    build_seconds = time.perf_counter() - start
+    print(f"Indexed {len(index):,} profiles in {build_seconds:.2f}s "
+          f"({profile_count / build_seconds:,.0f} profiles/s)")
+
+    latencies = []
+    for _ in range(query_count):
+        query_id = str(rng.randrange(profile_count))
+        start = time.perf_counter()
+        index.query(profiles[int(query_id)], k=k, exclude_id=query_id)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies = np.array(latencies)
+    print(f"Top-{k} over {profile_count:,} profiles, {query_count:,} queries: "
+          f"p50={np.percentile(latencies, 50):.2f}ms "
+          f"p95={np.percentile(latencies, 95):.2f}ms "
+          f"max={latencies.max():.2f}ms")
+
+    refresh_count = 1_000
+    refreshed = [random_profile(rng) for _ in range(refresh_count)]
+    start = time.perf_counter()
+    for i, profile in enumerate(refreshed):
+        index.upsert(str(i), profile)
+    refresh_ms = (time.perf_counter() - start) * 1000 / refresh_count
+    print(f"Incremental refresh: {refresh_ms:.3f}ms per profile write")
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    run_benchmark(count, queries)
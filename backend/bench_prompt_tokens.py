@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Report insights prompt sizes for synthetic stored profiles, comparing the
+compact prompt with the previous full-document, indent=2 encoding.
+
+Usage:
+    python bench_prompt_tokens.py [profile_count] [--exact]
+
+--exact also asks Gemini for the token count of each prompt (needs GEMINI_API_KEY).
+"""
+
+import sys
+import os
+import json
+import random
+import statistics
+from datetime import datetime
+
+from bson import ObjectId
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_service import build_insight_prompt, estimate_tokens, prompt_token_report
+
+GENRES = ["Drama", "Comedy", "Action", "Horror", "Thriller", "Romance", "Sci-Fi", "Musical"]
+SKILLS = ["Singing", "Dancing", "Martial Arts", "Piano", "Guitar", "Stunts", "Spanish", "Accents", "Improv"]
+
+def random_stored_profile(rng: random.Random) -> dict:
+    """A profile document shaped like the ones stored in MongoDB"""
+    return {
+        "_id": ObjectId(),
+        "user_id": ObjectId(),
+        "name": rng.choice(["Alex Rivera", "Sam Lee", "Jordan Smith", "Taylor Brooks"]),
+        "pronouns": rng.choice(["", "she/her", "he/him", "they/them"]),
+        "age_range": rng.choice(["18-25", "26-35", "36-45"]),
+        "location": rng.choice(["Los Angeles, CA", "New York, NY", ""]),
+        "willing_to_relocate": rng.random() < 0.3,
+        "height": rng.choice(["5'6\"", "5'10\"", ""]),
+        "build": rng.choice(["Athletic", "Slim", "Average", ""]),
+        "eye_color": rng.choice(["Blue", "Brown", "Green"]),
+        "hair_color": rng.choice(["Blonde", "Brown", "Black", "Red"]),
+        "ethnicity": rng.choice(["", "Hispanic", "Asian", "White"]),
+        "acting_schools": rng.sample(["Juilliard", "Yale School of Drama", "RADA"], rng.randint(0, 2)),
+        "workshops": rng.sample(["Meisner Intensive", "On-Camera Audition"], rng.randint(0, 2)),
+        "coaches": [],
+        "stage_experience": rng.random() < 0.5,
+        "film_experience": rng.random() < 0.5,
+        "special_skills": rng.sample(SKILLS, rng.randint(0, 4)),
+        "union_status": rng.choice(["Non-Union", "SAG-AFTRA Eligible", "SAG-AFTRA"]),
+        "preferred_genres": rng.sample(GENRES, rng.randint(0, 3)),
+        "career_goals": rng.choice(["", "Recurring role on a network drama", "Break into feature films"]),
+        "headshots": [f"https://cdn.example.com/headshots/{ObjectId()}.jpg" for _ in range(rng.randint(0, 3))],
+        "resume": rng.choice(["", f"https://cdn.example.com/resumes/{ObjectId()}.pdf"]),
+        "demo_reel": rng.choice(["", "https://vimeo.com/123456789"]),
+        "social_links": {"instagram": "https://instagram.com/example"} if rng.random() < 0.5 else {},
+        "bio": rng.choice(["", "Classically trained actor with a passion for character work and physical comedy."]),
+        "tagline": rng.choice(["", "Grounded, versatile, camera-ready"]),
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow(),
+        "completion_percentage": rng.randint(20, 100),
+        "profile_url": "alex-rivera-1a2b3c4d",
+        "version": 1,
+    }
+
+def legacy_profile_payload(profile: dict) -> str:
+    """The profile part of the previous prompt: the whole document, indent=2"""
+    return json.dumps(profile, indent=2, default=str)
+
+def run_report(profile_count: int = 1_000, exact: bool = False):
+    rng = random.Random(42)
+    profiles = [random_stored_profile(rng) for _ in range(profile_count)]
+
+    legacy_tokens = [estimate_tokens(legacy_profile_payload(profile)) for profile in profiles]
+    reports = [prompt_token_report(profile) for profile in profiles]
+    profile_tokens = [report["profile_tokens"] for report in reports]
+    total_tokens = [report["total_tokens"] for report in reports]
+
+    print(f"Static instruction prefix: ~{reports[0]['prefix_tokens']} tokens (shared by every prompt)")
+    print(f"Profile payload over {profile_count:,} profiles: "
+          f"legacy mean ~{statistics.mean(legacy_tokens):.0f} tokens, "
+          f"compact mean ~{statistics.mean(profile_tokens):.0f} tokens "
+          f"({1 - sum(profile_tokens) / sum(legacy_tokens):.0%} smaller)")
+    print(f"Full prompt: mean ~{statistics.mean(total_tokens):.0f} tokens, max ~{max(total_tokens)} tokens")
+
+    if exact:
+        from ai_service import AIService
+        service = AIService()
+        sample = profiles[:min(20, profile_count)]
+        for profile in sample:
+            report = service.count_prompt_tokens(profile)
+            print(f"{len(build_insight_prompt(profile))} chars: estimated {report['total_tokens']}, "
+                  f"counted {report['counted_tokens']} tokens")
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    count = int(args[0]) if args else 1_000
+    run_report(count, exact="--exact" in sys.argv)
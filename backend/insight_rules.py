@@ -0,0 +1,182 @@
+import os
+import re
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+DEFAULT_RULES_PATH = Path(__file__).resolve().parent / "insight_rules.json"
+
+SECTIONS = ["lookalikes", "scripts", "headshots", "careerAdvice"]
+
+_WORD_PATTERN = re.compile(r"[a-z]+")
+
+class _SafeFormatDict(dict):
+    """Leaves unknown placeholders intact instead of raising KeyError"""
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+class InsightRuleEngine:
+    """
+    Rule-based profile insights compiled from a declarative rule table.
+
+    Each rule fires on a single normalized profile feature such as
+    "age_group:young" or "skill_group:music". At compile time rules are
+    indexed by feature per section, so evaluating a profile is a dict lookup
+    per profile feature rather than a scan over every rule.
+    """
+
+    def __init__(self, rule_table: Dict[str, Any]):
+        self.section_limit = rule_table.get("section_limit", 3)
+        self.age_groups = {k.lower(): v for k, v in rule_table.get("age_groups", {}).items()}
+        self.skill_groups = {k.lower(): v for k, v in rule_table.get("skill_groups", {}).items()}
+        self.goal_keywords = {k.lower(): v for k, v in rule_table.get("goal_keywords", {}).items()}
+
+        # section -> feature -> [(position, rule)]
+        self.indexes: Dict[str, Dict[str, list]] = {section: {} for section in SECTIONS}
+        for section, rules in rule_table.get("sections", {}).items():
+            section_index = self.indexes.setdefault(section, {})
+            for position, rule in enumerate(rules):
+                if "when" not in rule or not rule.get("items"):
+                    raise ValueError(f"Rule {position} in section '{section}' needs 'when' and 'items'")
+                section_index.setdefault(rule["when"].lower(), []).append((position, rule))
+
+    @classmethod
+    def from_file(cls, path: Optional[str] = None) -> "InsightRuleEngine":
+        rules_path = Path(path or os.getenv("INSIGHT_RULES_PATH") or DEFAULT_RULES_PATH)
+        with open(rules_path, "r", encoding="utf-8") as rules_file:
+            return cls(json.load(rules_file))
+
+    def profile_features(self, profile_data: Dict[str, Any]) -> tuple[set, Dict[str, str]]:
+        """
+        Normalize a profile into the feature keys the rule indexes are keyed by.
+
+        Returns:
+            Tuple of (feature keys, template values used to format rule text)
+        """
+        def text(field):
+            value = profile_data.get(field)
+            return value.strip().lower() if isinstance(value, str) else ""
+
+        age_range = text("age_range")
+        eye_color = text("eye_color")
+        hair_color = text("hair_color")
+        build = text("build")
+        stage = bool(profile_data.get("stage_experience"))
+        film = bool(profile_data.get("film_experience"))
+
+        features = set()
+        if age_range:
+            features.add(f"age_range:{age_range}")
+            age_group = self.age_groups.get(age_range)
+            if age_group:
+                features.add(f"age_group:{age_group}")
+        if eye_color:
+            features.add(f"eye_color:{eye_color}")
+        if hair_color:
+            features.add(f"hair_color:{hair_color}")
+        if eye_color and hair_color:
+            features.add(f"coloring:{eye_color}/{hair_color}")
+        if build:
+            features.add(f"build:{build}")
+
+        for genre in profile_data.get("preferred_genres") or []:
+            if isinstance(genre, str) and genre.strip():
+                features.add(f"genre:{genre.strip().lower()}")
+
+        for skill in profile_data.get("special_skills") or []:
+            if isinstance(skill, str):
+                skill_group = self.skill_groups.get(skill.strip().lower())
+                if skill_group:
+                    features.add(f"skill_group:{skill_group}")
+
+        if stage:
+            features.add("experience:stage")
+        if film:
+            features.add("experience:film")
+        if stage and film:
+            features.add("experience:stage_and_film")
+        elif stage:
+            features.add("experience:stage_only")
+        elif film:
+            features.add("experience:film_only")
+
+        for word in _WORD_PATTERN.findall(text("career_goals")):
+            goal = self.goal_keywords.get(word)
+            if goal:
+                features.add(f"goal:{goal}")
+
+        template_values = _SafeFormatDict(
+            age_range=age_range,
+            eye_color=eye_color,
+            hair_color=hair_color,
+            build=build,
+        )
+        return features, template_values
+
+    def generate(self, profile_data: Dict[str, Any]) -> Dict[str, list]:
+        """
+        Generate rule-based insights for a profile.
+
+        Args:
+            profile_data: Dictionary containing user profile information
+
+        Returns:
+            Dictionary with lookalikes, scripts, headshots and careerAdvice lists
+        """
+        features, template_values = self.profile_features(profile_data)
+        insights = {}
+
+        for section, section_index in self.indexes.items():
+            matched = []
+            for feature in features:
+                matched.extend(section_index.get(feature, ()))
+            # Keep the rule table's declaration order
+            matched.sort(key=lambda entry: entry[0])
+
+            items = []
+            seen_items = set()
+            fired_groups = set()
+            for _, rule in matched:
+                group = rule.get("group")
+                if group:
+                    if group in fired_groups:
+                        continue
+                    fired_groups.add(group)
+                for item in rule["items"]:
+                    rendered = {
+                        key: value.format_map(template_values) if isinstance(value, str) else value
+                        for key, value in item.items()
+                    }
+                    item_key = next(iter(rendered.values()), None)
+                    if item_key in seen_items:
+                        continue
+                    seen_items.add(item_key)
+                    items.append(rendered)
+                if len(items) >= self.section_limit:
+                    break
+
+            insights[section] = items[:self.section_limit]
+
+        return insights
+
+# Rule engine instance, loaded once and swapped atomically on reload
+_rule_engine = None
+_rule_engine_lock = threading.Lock()
+
+def get_insight_rules() -> InsightRuleEngine:
+    """Get the compiled rule engine, loading the rule table on first use"""
+    global _rule_engine
+    if _rule_engine is None:
+        with _rule_engine_lock:
+            if _rule_engine is None:
+                _rule_engine = InsightRuleEngine.from_file()
+    return _rule_engine
+
+def reload_insight_rules(path: Optional[str] = None) -> InsightRuleEngine:
+    """Recompile the rule table from disk, keeping the old rules if the new table is invalid"""
+    global _rule_engine
+    engine = InsightRuleEngine.from_file(path)
+    with _rule_engine_lock:
+        _rule_engine = engine
+    return engine
@@ -0,0 +1,104 @@
+import json
+from typing import Any, Dict, List, Tuple
+
+class IncrementalObjectParser:
+    """
+    Incremental parser for a JSON object arriving in chunks.
+
+    Text before the opening brace (such as a ```json fence) is skipped. Each
+    top-level member is decoded as soon as its value is complete, so callers
+    can act on early sections while the rest of the object is still arriving.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key_start = None
+        self._key = None
+        self._value_start = None
+        self.started = False
+        self.finished = False
+        self.members: Dict[str, Any] = {}
+        self.errors: List[str] = []
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Consume the next chunk of text.
+
+        Args:
+            chunk: Next piece of the streamed response
+
+        Returns:
+            List of (key, value) pairs for top-level members completed by this chunk
+        """
+        completed = []
+        self._buffer += chunk
+        buffer = self._buffer
+
+        while self._pos < len(buffer) and not self.finished:
+            ch = buffer[self._pos]
+
+            if not self.started:
+                if ch == "{":
+                    self.started = True
+                    self._depth = 1
+                self._pos += 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._key is None and self._key_start is not None:
+                        self._key = json.loads(buffer[self._key_start:self._pos + 1])
+                self._pos += 1
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._key is None:
+                    self._key_start = self._pos
+                elif self._depth == 1 and self._value_start is None:
+                    self._value_start = self._pos
+            elif ch in "{[":
+                if self._depth == 1 and self._value_start is None:
+                    self._value_start = self._pos
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._complete_member(self._pos, completed)
+                    self.finished = True
+            elif ch == "," and self._depth == 1:
+                self._complete_member(self._pos, completed)
+            elif (self._depth == 1 and self._key is not None and self._value_start is None
+                  and ch != ":" and not ch.isspace()):
+                # Start of a number, true, false or null
+                self._value_start = self._pos
+            self._pos += 1
+
+        # Drop text that no pending key or value still refers to
+        if self._key_start is None and self._value_start is None:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+
+        return completed
+
+    def _complete_member(self, end: int, completed: List[Tuple[str, Any]]):
+        if self._key is not None and self._value_start is not None:
+            value_text = self._buffer[self._value_start:end]
+            try:
+                value = json.loads(value_text)
+                self.members[self._key] = value
+                completed.append((self._key, value))
+            except json.JSONDecodeError as e:
+                self.errors.append(f"Invalid value for '{self._key}': {e}")
+        self._key_start = None
+        self._key = None
+        self._value_start = None
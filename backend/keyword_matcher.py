@@ -0,0 +1,78 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Keyword insights for news articles, in the order they are reported
+INSIGHT_KEYWORDS = {
+    "casting": ["casting", "audition", "role"],
+    "streaming": ["streaming", "netflix", "hulu", "amazon"],
+    "remote": ["self-tape", "virtual", "remote"],
+    "diversity": ["diversity", "inclusion", "representation"],
+}
+
+INSIGHT_TEXT = {
+    "casting": "This could present new opportunities for actors seeking roles.",
+    "streaming": "Streaming platforms continue to drive demand for diverse content.",
+    "remote": "The industry continues to embrace remote audition processes.",
+    "diversity": "Industry focus on diversity creates more opportunities for underrepresented actors.",
+}
+
+DEFAULT_INSIGHT = "Stay informed about industry trends that may impact your career."
+
+DEFAULT_CATEGORY = "entertainment"
+
+def _contains_word_start(text: str, keyword: str) -> bool:
+    """Whether keyword occurs in text at the start of a word"""
+    start = text.find(keyword)
+    while start > 0 and (text[start - 1].isalnum() or text[start - 1] == "_"):
+        start = text.find(keyword, start + 1)
+    return start != -1
+
+class KeywordMatcher:
+    """
+    Matches several named keyword sets against text.
+
+    Not a compiled automaton: each call lowercases the text once and checks
+    the keywords of each set by substring search, stopping at the set's first
+    hit. A keyword matches the start of a word ("role" matches "roles" but not
+    "controlled").
+
+    This is slower than the plain substring checks it replaced (about 1.4x
+    in bench_keyword_matcher.py), because of the word-start verification. It
+    exists for that word-start matching and for sharing one keyword table,
+    not for speed.
+    """
+
+    def __init__(self, keyword_sets: Dict[str, Iterable[str]]):
+        self.keyword_sets: Dict[str, Tuple[str, ...]] = {
+            name: tuple(keyword.lower() for keyword in keywords) for name, keywords in keyword_sets.items()
+        }
+
+    def match(self, text: Optional[str]) -> List[str]:
+        """Names of the keyword sets with at least one keyword in text, in declaration order"""
+        text = (text or "").lower()
+        return [
+            name for name, keywords in self.keyword_sets.items()
+            if any(keyword in text and _contains_word_start(text, keyword) for keyword in keywords)
+        ]
+
+    def first(self, text: Optional[str]) -> Optional[str]:
+        """Name of the first keyword set, in declaration order, with a keyword in text"""
+        text = (text or "").lower()
+        for name, keywords in self.keyword_sets.items():
+            if any(keyword in text and _contains_word_start(text, keyword) for keyword in keywords):
+                return name
+        return None
+
+_insight_matcher = KeywordMatcher(INSIGHT_KEYWORDS)
+
+def article_text(title: Optional[str], summary: Optional[str]) -> str:
+    """Title and summary joined into the text keywords are matched against"""
+    return f"{title or ''} {summary or ''}"
+
+def generate_keyword_insights(title: str, summary: str) -> str:
+    """Keyword-based insight text for an article"""
+    insights = [INSIGHT_TEXT[name] for name in _insight_matcher.match(article_text(title, summary))]
+    return " ".join(insights) if insights else DEFAULT_INSIGHT
+
+def generate_keyword_insights_for_articles(articles: List[dict]) -> List[str]:
+    """Keyword-based insight text for each article dictionary with title and summary, one article at a time"""
+    return [generate_keyword_insights(article.get("title"), article.get("summary")) for article in articles]
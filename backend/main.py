@@ -1,27 +1,84 @@
-from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File
+from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, DuplicateKeyError
-from typing import Optional
-from pydantic import BaseModel, EmailStr
+from fastapi.responses import FileResponse, StreamingResponse, JSONResponse, Response
+from fastapi.concurrency import run_in_threadpool
+from pymongo import MongoClient, ReturnDocument, UpdateOne, TEXT
+from pymongo.errors import ConnectionFailure, DuplicateKeyError, BulkWriteError
+from bson import json_util
+from typing import Optional, TYPE_CHECKING
+from pydantic import BaseModel, EmailStr, TypeAdapter
 from passlib.context import CryptContext
 from jose import JWTError, jwt
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import os
+import json
 import uuid
+import base64
 import shutil
-import requests
+import socket
+import asyncio
+import time
+import threading
+import ai_metrics
 from pathlib import Path
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
-from ai_service import AIService
+from ai_service import AIService, profile_insights_cache_key, AI_BREAKER_RESET_SECONDS
+from insight_rules import get_insight_rules, reload_insight_rules, SECTIONS as INSIGHT_SECTIONS
+from single_flight import SingleFlight
+from response_cache import ResponseCache
+from keyword_matcher import generate_keyword_insights_for_articles, DEFAULT_CATEGORY
+from news_classifier import get_news_classifier, reload_news_classifier
+from news_dedup import DuplicateIndex, article_fingerprint, simhash_bands, NEWS_DUPLICATE_WINDOW_DAYS
+
+if TYPE_CHECKING:
+    # For annotations only; numpy is loaded on first similar-profile lookup
+    from profile_similarity import ProfileSimilarityIndex
 
 # Load environment variables from .env file
 load_dotenv()
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown"""
+    # Make sure the indexes the query paths rely on exist
+    try:
+        ensure_indexes(get_db())
+    except Exception as e:
+        print(f"Failed to ensure database indexes: {e}")
+    
+    # Compile the fallback insight rules and load the news classifier once up front
+    get_insight_rules()
+    get_news_classifier()
+    
+    # Start in-process workers for queued AI insight jobs
+    stop_event = asyncio.Event()
+    worker_prefix = f"{socket.gethostname()}-{os.getpid()}"
+    workers = [
+        asyncio.create_task(run_insight_job_worker(f"{worker_prefix}-{i}", stop_event))
+        for i in range(AI_INSIGHT_WORKERS)
+    ]
+    
+    # Periodic news ingestion; every worker runs the loop, the lease lock lets one ingest per interval
+    if NEWS_INGEST_INTERVAL_SECONDS > 0:
+        workers.append(asyncio.create_task(run_news_scheduler(f"{worker_prefix}-news", stop_event)))
+    
+    # Similar-profile index rebuilds, so other workers' profile writes show up
+    if PROFILE_SIMILARITY_REBUILD_SECONDS > 0:
+        workers.append(asyncio.create_task(run_similarity_index_refresher(stop_event)))
+    
+    yield
+    
+    # Shutdown: let workers finish their current job, then stop them
+    stop_event.set()
+    if workers:
+        _, pending = await asyncio.wait(workers, timeout=AI_INSIGHT_WORKER_SHUTDOWN_SECONDS)
+        for task in pending:
+            task.cancel()
+
+app = FastAPI(lifespan=lifespan)
 
 # Mount static files for serving uploaded content
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
@@ -33,6 +90,8 @@ app.mount("/worksheets", StaticFiles(directory="worksheets"), name="worksheets")
 SECRET_KEY = os.environ.get("JWT_SECRET", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.environ.get("JWT_EXPIRES_IN", "30"))
+# Comma-separated emails allowed to use admin-only endpoints; none when unset
+ADMIN_EMAILS = {email.strip().lower() for email in os.environ.get("ADMIN_EMAILS", "").split(",") if email.strip()}
 
 # File upload configuration
 UPLOAD_DIR = Path("uploads")
@@ -41,6 +100,60 @@ MAX_VIDEO_SIZE = 50 * 1024 * 1024  # 50MB
 ALLOWED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp"}
 ALLOWED_VIDEO_TYPES = {"video/mp4", "video/mpeg", "video/quicktime", "video/x-msvideo"}
 
+# Bulk profile transfer configuration
+PROFILE_EXPORT_BATCH_SIZE = int(os.environ.get("PROFILE_EXPORT_BATCH_SIZE", "500"))
+PROFILE_IMPORT_BATCH_SIZE = int(os.environ.get("PROFILE_IMPORT_BATCH_SIZE", "1000"))
+MAX_IMPORT_ERRORS_REPORTED = 1000
+
+# Similar profiles configuration: each worker rebuilds its index this often so
+# other workers' profile writes show up (0 disables rebuilds)
+PROFILE_SIMILARITY_REBUILD_SECONDS = int(os.environ.get("PROFILE_SIMILARITY_REBUILD_SECONDS", "300"))
+
+# AI insights cache configuration
+AI_INSIGHTS_CACHE_TTL_SECONDS = int(os.environ.get("AI_INSIGHTS_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# AI insight job queue configuration
+AI_INSIGHT_WORKERS = int(os.environ.get("AI_INSIGHT_WORKERS", "2"))
+AI_INSIGHT_JOB_POLL_SECONDS = float(os.environ.get("AI_INSIGHT_JOB_POLL_SECONDS", "1.0"))
+AI_INSIGHT_JOB_LEASE_SECONDS = int(os.environ.get("AI_INSIGHT_JOB_LEASE_SECONDS", "120"))
+AI_INSIGHT_JOB_MAX_ATTEMPTS = 3
+# Delay before the first retry of a failed job, doubling after each further failure. It
+# never drops below the circuit breaker's reset window, so retries can't burn through
+# their attempts while the breaker is still open.
+AI_INSIGHT_JOB_RETRY_BASE_SECONDS = max(
+    AI_BREAKER_RESET_SECONDS, float(os.environ.get("AI_INSIGHT_JOB_RETRY_BASE_SECONDS", "30"))
+)
+# At most one job per profile content may be in these statuses
+AI_INSIGHT_JOB_ACTIVE_STATUSES = ["queued", "running"]
+AI_INSIGHT_JOB_RETENTION_SECONDS = 24 * 3600
+AI_INSIGHT_WORKER_SHUTDOWN_SECONDS = 10
+
+# Scheduled news ingestion configuration (an interval of 0 disables the scheduler)
+NEWS_INGEST_INTERVAL_SECONDS = int(os.environ.get("NEWS_INGEST_INTERVAL_SECONDS", str(30 * 60)))
+NEWS_INGEST_LEASE_SECONDS = int(os.environ.get("NEWS_INGEST_LEASE_SECONDS", "300"))
+NEWS_SCHEDULER_POLL_SECONDS = float(os.environ.get("NEWS_SCHEDULER_POLL_SECONDS", "60"))
+NEWS_INGEST_LOCK = "news_ingest"
+# Checkpoint holding the NewsAPI fetch watermark
+NEWS_FETCH_CHECKPOINT_ID = "news_fetch"
+# Marks articles stored by ingestion, as opposed to created through the API
+NEWS_API_ORIGIN = "newsapi"
+
+# News enrichment configuration
+NEWS_ENRICHMENT_SCAN_BATCH_SIZE = int(os.environ.get("NEWS_ENRICHMENT_SCAN_BATCH_SIZE", "100"))
+NEWS_ENRICHMENT_ARTICLES_PER_CALL = int(os.environ.get("NEWS_ENRICHMENT_ARTICLES_PER_CALL", "8"))
+NEWS_ENRICHMENT_CONCURRENCY = int(os.environ.get("NEWS_ENRICHMENT_CONCURRENCY", "2"))
+
+# News list response cache (the TTL only bounds staleness if a version bump is missed)
+NEWS_CACHE_MAX_ENTRIES = int(os.environ.get("NEWS_CACHE_MAX_ENTRIES", "256"))
+NEWS_CACHE_TTL_SECONDS = int(os.environ.get("NEWS_CACHE_TTL_SECONDS", "600"))
+NEWS_CACHE_VERSION_KEY = "news"
+# How long a worker reuses the news version it last read before checking the database again
+NEWS_CACHE_VERSION_CHECK_SECONDS = float(os.environ.get("NEWS_CACHE_VERSION_CHECK_SECONDS", "2"))
+
+# News search: relative weight of each text-indexed field, and the largest page size
+NEWS_SEARCH_WEIGHTS = {"title": 10, "summary": 4, "source": 2}
+NEWS_SEARCH_MAX_LIMIT = 50
+
 # CORS configuration
 origins = [
     "http://localhost:5173",  # Local development frontend (Vite)
@@ -207,6 +320,8 @@ class ProfileUpdate(BaseModel):
     tagline: Optional[str] = None
     is_public: Optional[bool] = None
     isPublic: Optional[bool] = None  # Accept camelCase from frontend
+    expected_version: Optional[int] = None  # Version the client last read, for conflict detection
+    expectedVersion: Optional[int] = None  # Accept camelCase from frontend
     
     def model_post_init(self, __context) -> None:
         """Convert camelCase fields to snake_case after validation"""
@@ -239,6 +354,11 @@ class ProfileUpdate(BaseModel):
             self.social_links = self.socialLinks
         if self.isPublic is not None and self.is_public is None:
             self.is_public = self.isPublic
+        if self.expectedVersion is not None and self.expected_version is None:
+            self.expected_version = self.expectedVersion
+
+# camelCase aliases, copied into their snake_case fields above and never stored themselves
+PROFILE_UPDATE_CAMEL_CASE_FIELDS = {field for field in ProfileUpdate.model_fields if field != field.lower()}
 
 class ProfileResponse(BaseModel):
     id: str
@@ -271,9 +391,20 @@ class ProfileResponse(BaseModel):
     is_public: bool
     completion_percentage: Optional[int] = None
     profile_url: Optional[str] = None
+    version: int = 0
     created_at: datetime
     updated_at: datetime
 
+class SimilarProfileResponse(BaseModel):
+    id: str
+    user_id: str
+    name: str
+    age_range: Optional[str] = None
+    location: Optional[str] = None
+    headshot: Optional[str] = None
+    profile_url: Optional[str] = None
+    similarity: float
+
 # Community Feed Models
 class PostCreate(BaseModel):
     content: str
@@ -376,13 +507,17 @@ class NewsArticleResponse(BaseModel):
     fetched_at: datetime
     ai_insights: Optional[str] = None
 
+class NewsSearchResponse(BaseModel):
+    articles: list[NewsArticleResponse]
+    next_cursor: Optional[str] = None
+
 class NewsArticleCreate(BaseModel):
     title: str
     summary: str
     source: str
     url: str
     image_url: Optional[str] = None
-    category: str = "entertainment"
+    category: Optional[str] = None  # Assigned by the news classifier when not given
     published_at: datetime
     ai_insights: Optional[str] = None
 
@@ -404,6 +539,45 @@ def get_db():
     db = client.get_database("next_cinema_db")
     return db
 
+def ensure_indexes(db):
+    """
+    Create the indexes used by the query paths (no-op when they already exist).
+    
+    Each index is created on its own, so one the server rejects (e.g. the
+    partial filter on active insight jobs needs MongoDB 6.0+) doesn't stop the
+    rest. Returns the names of the indexes that failed.
+    """
+    indexes = [
+        (db.users, "email", {"unique": True}),
+        (db.profiles, "user_id", {"unique": True}),
+        (db.profile_insights_cache, "expires_at", {"expireAfterSeconds": 0}),
+        (db.ai_insight_jobs, [("status", 1), ("created_at", 1)], {}),
+        (db.ai_insight_jobs, "cache_key", {
+            "unique": True,
+            "partialFilterExpression": {"status": {"$in": AI_INSIGHT_JOB_ACTIVE_STATUSES}},
+            "name": "cache_key_active_unique"
+        }),
+        (db.ai_insight_jobs, "expires_at", {"expireAfterSeconds": 0}),
+        (db.news_articles, "url", {"unique": True}),
+        (db.news_articles, [("published_at", -1)], {}),
+        (db.news_articles, [("category", 1), ("published_at", -1)], {}),
+        (db.news_articles, [("origin", 1), ("published_at", -1)], {}),
+        (db.news_articles, [("simhash_bands", 1), ("published_at", -1)], {}),
+        (db.news_articles, [("title", TEXT), ("summary", TEXT), ("source", TEXT)], {
+            "weights": NEWS_SEARCH_WEIGHTS,
+            "name": "news_text_search"
+        }),
+    ]
+    failed = []
+    for collection, keys, options in indexes:
+        try:
+            collection.create_index(keys, **options)
+        except Exception as e:
+            label = f"{collection.name} {options.get('name', keys)}"
+            print(f"Failed to create index {label}: {e}")
+            failed.append(label)
+    return failed
+
 # Password utilities
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -464,6 +638,37 @@ def get_profile_by_user_id(db, user_id: str):
     except:
         return None
 
+def get_user_with_profile(db, user_id: str):
+    """
+    Fetch a user together with their profile (or None) in a single round-trip.
+    
+    Returns None for an invalid or unknown user id; database errors propagate.
+    """
+    users_collection = db.users
+    from bson import ObjectId
+    from bson.errors import InvalidId
+    try:
+        user_object_id = ObjectId(user_id)
+    except (InvalidId, TypeError):
+        return None
+    # A plain localField/foreignField lookup (no sub-pipeline) runs on any MongoDB version
+    results = list(users_collection.aggregate([
+        {"$match": {"_id": user_object_id}},
+        {"$limit": 1},
+        {"$lookup": {
+            "from": "profiles",
+            "localField": "_id",
+            "foreignField": "user_id",
+            "as": "profile"
+        }},
+        {"$project": {"password_hash": 0}}
+    ]))
+    if not results:
+        return None
+    user = results[0]
+    user["profile"] = user["profile"][0] if user["profile"] else None
+    return user
+
 def get_profile_by_id(db, profile_id: str):
     profiles_collection = db.profiles
     from bson import ObjectId
@@ -481,18 +686,25 @@ def create_profile(db, profile_data: dict) -> Optional[str]:
         print(f"Error creating profile: {e}")
         return None
 
-def update_profile(db, profile_id: str, profile_data: dict) -> bool:
+def update_profile(db, profile_id: str, profile_data: dict, expected_version: int) -> bool:
+    """Apply profile_data only if the stored version still matches expected_version.
+    
+    Returns False when another write got there first. Database errors
+    propagate, so they surface as server errors rather than conflicts.
+    """
     profiles_collection = db.profiles
     from bson import ObjectId
-    try:
-        result = profiles_collection.update_one(
-            {"_id": ObjectId(profile_id)},
-            {"$set": profile_data}
-        )
-        return result.modified_count > 0
-    except Exception as e:
-        print(f"Error updating profile: {e}")
-        return False
+    # Profiles created before versioning have no version field and count as version 0
+    version_filter = expected_version if expected_version else {"$in": [0, None]}
+    result = profiles_collection.update_one(
+        {"_id": ObjectId(profile_id), "version": version_filter},
+        {"$set": profile_data, "$inc": {"version": 1}}
+    )
+    return result.matched_count > 0
+
+def diff_profile_update(profile: dict, profile_update: dict) -> dict:
+    """Return only the update fields whose value differs from the stored profile"""
+    return {k: v for k, v in profile_update.items() if v is not None and profile.get(k) != v}
 
 def calculate_completion_percentage(profile_data: dict) -> int:
     """Calculate profile completion percentage based on filled fields"""
@@ -539,6 +751,214 @@ def generate_profile_url(name: str) -> str:
     slug = re.sub(r'\s+', '-', slug.strip())
     return slug
 
+def build_profile_document(profile_data: ProfileCreate, user_id) -> dict:
+    """Build the profile document stored in MongoDB from validated profile data"""
+    profile_dict = profile_data.dict()
+    profile_dict.update({
+        "user_id": user_id,
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow(),
+        "completion_percentage": calculate_completion_percentage(profile_dict),
+        "profile_url": generate_profile_url(profile_data.name),
+        "version": 1
+    })
+    return profile_dict
+
+# Bulk profile transfer helper functions
+def iter_profiles_ndjson(db, batch_size: int = PROFILE_EXPORT_BATCH_SIZE):
+    """Yield every profile as one NDJSON line, reading through a batched cursor"""
+    profiles_collection = db.profiles
+    cursor = profiles_collection.find({}, batch_size=batch_size).sort("_id", 1)
+    try:
+        for profile in cursor:
+            yield json_util.dumps(profile, json_options=json_util.RELAXED_JSON_OPTIONS) + "\n"
+    finally:
+        cursor.close()
+
+def profile_document_from_ndjson(line: str) -> dict:
+    """Parse and validate one exported NDJSON line into a profile document"""
+    from bson import ObjectId
+    record = json_util.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError("Line is not a JSON object")
+    
+    user_id = record.pop("user_id", None)
+    if not user_id:
+        raise ValueError("user_id is required")
+    profile_id = record.pop("_id", None)
+    created_at = record.pop("created_at", None)
+    updated_at = record.pop("updated_at", None)
+    
+    # Derived fields (completion_percentage, profile_url) are ignored by the model and recomputed
+    profile_data = ProfileCreate(**record)
+    profile_dict = build_profile_document(profile_data, ObjectId(str(user_id)))
+    
+    # Keep identity and timestamps so an export can be re-imported as-is
+    if profile_id:
+        profile_dict["_id"] = ObjectId(str(profile_id))
+    if created_at:
+        profile_dict["created_at"] = created_at
+    if updated_at:
+        profile_dict["updated_at"] = updated_at
+    return profile_dict
+
+def import_profiles_ndjson(db, lines, batch_size: int = PROFILE_IMPORT_BATCH_SIZE) -> dict:
+    """Validate NDJSON profile lines and insert them in unordered batches.
+    
+    Lines that fail validation, reference a user that does not exist or that
+    already has a profile, or fail insertion are reported by line number without
+    stopping the rest of the import.
+    """
+    profiles_collection = db.profiles
+    users_collection = db.users
+    result = {"total_lines": 0, "inserted_count": 0, "error_count": 0, "errors": []}
+    batch = []
+    batch_line_numbers = []
+    imported_user_ids = set()
+    
+    def record_error(line_number: int, message: str):
+        result["error_count"] += 1
+        if len(result["errors"]) < MAX_IMPORT_ERRORS_REPORTED:
+            result["errors"].append({"line": line_number, "error": message})
+    
+    def flush_batch():
+        if not batch:
+            return
+
+        # Profiles can only be imported for users that exist in this database
+        batch_user_ids = [doc["user_id"] for doc in batch]
+        existing_user_ids = {
+            user["_id"] for user in users_collection.find({"_id": {"$in": batch_user_ids}}, {"_id": 1})
+        }
+        # Each user has at most one profile, whether stored already or earlier in this import
+        users_with_profiles = {
+            profile["user_id"] for profile in profiles_collection.find({"user_id": {"$in": batch_user_ids}}, {"user_id": 1})
+        }
+        docs = []
+        line_numbers = []
+        for doc, line_number in zip(batch, batch_line_numbers):
+            if doc["user_id"] not in existing_user_ids:
+                record_error(line_number, f"User {doc['user_id']} not found")
+            elif doc["user_id"] in imported_user_ids:
+                record_error(line_number, f"User {doc['user_id']} appears more than once in this import")
+            elif doc["user_id"] in users_with_profiles:
+                record_error(line_number, f"User {doc['user_id']} already has a profile")
+            else:
+                imported_user_ids.add(doc["user_id"])
+                docs.append(doc)
+                line_numbers.append(line_number)
+        batch.clear()
+        batch_line_numbers.clear()
+        if not docs:
+            return
+
+        failed_indexes = set()
+        try:
+            inserted = profiles_collection.insert_many(docs, ordered=False)
+            result["inserted_count"] += len(inserted.inserted_ids)
+        except BulkWriteError as e:
+            result["inserted_count"] += e.details.get("nInserted", 0)
+            for write_error in e.details.get("writeErrors", []):
+                failed_indexes.add(write_error["index"])
+                record_error(line_numbers[write_error["index"]], write_error.get("errmsg", "Insert failed"))
+
+        # Mark owners of the inserted profiles as having completed their profile
+        inserted_docs = [doc for i, doc in enumerate(docs) if i not in failed_indexes]
+        user_ids = [doc["user_id"] for doc in inserted_docs]
+        if user_ids:
+            users_collection.update_many(
+                {"_id": {"$in": user_ids}},
+                {"$set": {"profile_completed": True}}
+            )
+        for doc in inserted_docs:
+            refresh_profile_similarity(str(doc["_id"]), doc)
+    
+    for line_number, raw_line in enumerate(lines, start=1):
+        if isinstance(raw_line, bytes):
+            raw_line = raw_line.decode("utf-8")
+        raw_line = raw_line.strip()
+        if not raw_line:
+            continue
+        result["total_lines"] += 1
+        
+        try:
+            profile_dict = profile_document_from_ndjson(raw_line)
+        except Exception as e:
+            record_error(line_number, str(e))
+            continue
+        
+        batch.append(profile_dict)
+        batch_line_numbers.append(line_number)
+        if len(batch) >= batch_size:
+            flush_batch()
+    
+    flush_batch()
+    return result
+
+# Similar profile helper functions
+# Each worker keeps its own index: built from the database on first use,
+# refreshed incrementally by the profile writes it handles, and rebuilt every
+# PROFILE_SIMILARITY_REBUILD_SECONDS so writes handled by other workers show up.
+similarity_index = None
+similarity_index_lock = threading.Lock()
+
+def build_similarity_index(db) -> "ProfileSimilarityIndex":
+    """Load every public profile into a new similarity index (blocking)"""
+    # numpy is only loaded once similar-profile lookups are used
+    from profile_similarity import ProfileSimilarityIndex, SIMILARITY_FIELDS
+    index = ProfileSimilarityIndex()
+    projection = {field: 1 for field in SIMILARITY_FIELDS}
+    cursor = db.profiles.find({"is_public": {"$ne": False}}, projection, batch_size=1000)
+    try:
+        index.upsert_many((str(profile["_id"]), profile) for profile in cursor)
+    finally:
+        cursor.close()
+    return index
+
+def get_similarity_index(db) -> "ProfileSimilarityIndex":
+    """Get the in-memory similarity index of public profiles, building it on first use (blocking)"""
+    global similarity_index
+    if similarity_index is None:
+        with similarity_index_lock:
+            if similarity_index is None:
+                similarity_index = build_similarity_index(db)
+    return similarity_index
+
+def rebuild_similarity_index(db) -> bool:
+    """Replace an index that is in use with a fresh build; returns whether there was one"""
+    global similarity_index
+    if similarity_index is None:
+        return False  # Not used in this worker yet
+    with similarity_index_lock:
+        similarity_index = build_similarity_index(db)
+    return True
+
+async def run_similarity_index_refresher(stop_event: asyncio.Event):
+    """Rebuild this worker's similarity index every PROFILE_SIMILARITY_REBUILD_SECONDS until shutdown"""
+    db = None
+    while True:
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=PROFILE_SIMILARITY_REBUILD_SECONDS)
+            return
+        except asyncio.TimeoutError:
+            pass
+        try:
+            if similarity_index is not None:
+                if db is None:
+                    db = await asyncio.to_thread(get_db)
+                await asyncio.to_thread(rebuild_similarity_index, db)
+        except Exception as e:
+            print(f"Similarity index rebuild failed: {e}")
+
+def refresh_profile_similarity(profile_id: str, profile: dict):
+    """Keep the similarity index in step with a profile write"""
+    if similarity_index is None:
+        return  # Will be built from the database on first use
+    if profile.get("is_public", True):
+        similarity_index.upsert(profile_id, profile)
+    else:
+        similarity_index.remove(profile_id)
+
 # Community Feed helper functions
 def create_post(db, post_data: dict) -> Optional[str]:
     posts_collection = db.posts
@@ -820,9 +1240,8 @@ def get_user_completed_guides(db, user_id: str):
 def create_news_article(db, article_data: dict) -> Optional[str]:
     news_collection = db.news_articles
     try:
-        # Create unique index on URL if it doesn't exist
-        news_collection.create_index("url", unique=True)
         result = news_collection.insert_one(article_data)
+        bump_news_cache_version(db)
         return str(result.inserted_id)
     except Exception as e:
         print(f"Error creating news article: {e}")
@@ -842,6 +1261,38 @@ def get_news_articles(db, skip: int = 0, limit: int = 20, category: Optional[str
         print(f"Error fetching news articles: {e}")
         return []
 
+def get_news_cache_version(db) -> int:
+    """Current version of the stored news, bumped by every write to news_articles"""
+    versions_collection = db.cache_versions
+    version = versions_collection.find_one({"_id": NEWS_CACHE_VERSION_KEY})
+    return version["version"] if version else 0
+
+# This worker's last read of the news version. Writes made here reset it so they
+# show up on the next request; other workers' writes show up within the check interval.
+news_cache_version = {"version": 0, "checked_at": None, "local_bumps": 0}
+
+async def current_news_cache_version(db) -> int:
+    """News version for response cache keys, re-read in the threadpool once the last read is stale"""
+    checked_at = news_cache_version["checked_at"]
+    if checked_at is not None and time.monotonic() - checked_at < NEWS_CACHE_VERSION_CHECK_SECONDS:
+        return news_cache_version["version"]
+    local_bumps = news_cache_version["local_bumps"]
+    version = await run_in_threadpool(get_news_cache_version, db)
+    # A local write during the read may not be reflected in it, so only keep it if there was none
+    if news_cache_version["local_bumps"] == local_bumps:
+        news_cache_version.update(version=version, checked_at=time.monotonic())
+    return version
+
+def bump_news_cache_version(db):
+    """Invalidate cached news responses in every worker"""
+    versions_collection = db.cache_versions
+    try:
+        versions_collection.update_one({"_id": NEWS_CACHE_VERSION_KEY}, {"$inc": {"version": 1}}, upsert=True)
+    except Exception as e:
+        print(f"Error bumping news cache version: {e}")
+    news_cache_version["local_bumps"] += 1
+    news_cache_version["checked_at"] = None
+
 def get_news_article_by_id(db, article_id: str):
     news_collection = db.news_articles
     from bson import ObjectId
@@ -850,87 +1301,299 @@ def get_news_article_by_id(db, article_id: str):
     except:
         return None
 
-def fetch_news_from_api(api_key: str, query: str = "acting OR actor OR actress OR film industry", page_size: int = 20) -> list:
-    """Fetch news from NewsAPI.org"""
+def latest_news_published_at(db) -> Optional[datetime]:
+    """
+    Publish time of the newest article fetched from NewsAPI, the watermark until a fetch is recorded.
+    
+    Manually created articles and future publish times are ignored, so
+    neither can hold back fetching.
+    """
+    news_collection = db.news_articles
+    latest = news_collection.find_one(
+        {"origin": NEWS_API_ORIGIN, "published_at": {"$lte": datetime.utcnow()}},
+        {"published_at": 1},
+        sort=[("published_at", -1)]
+    )
+    return latest["published_at"] if latest else None
+
+def load_news_fetch_window(db) -> dict:
+    """
+    The watermark, and any unfinished backfill, that the next NewsAPI fetch continues from.
+    
+    Before the first recorded fetch the newest stored article stands in for
+    the watermark.
+    """
+    window = db.batch_checkpoints.find_one({"_id": NEWS_FETCH_CHECKPOINT_ID})
+    if window is None:
+        return {"watermark": latest_news_published_at(db), "backfill_until": None, "backfill_watermark": None}
+    return window
+
+def record_news_fetch(db, window: dict, articles: list, complete: bool):
+    """
+    Move the fetch window on after a successful fetch.
+    
+    Only a complete fetch advances the watermark, to the newest article it
+    returned. A fetch cut short by the page cap lacks its oldest articles, so
+    the watermark stays put and the next fetch backfills from it up to the
+    oldest article returned; once a backfill completes, the watermark jumps
+    to the newest article seen before it started.
+    """
+    now = datetime.utcnow()
+    published = []
+    for article in articles:
+        try:
+            published_at = datetime.fromisoformat(article["publishedAt"].replace("Z", "+00:00"))
+        except (KeyError, AttributeError, ValueError):
+            continue
+        published_at = published_at.astimezone(timezone.utc).replace(tzinfo=None)
+        if published_at <= now:
+            published.append(published_at)
+    
+    watermark = window.get("watermark")
+    newest = max(published + [seen for seen in (watermark, window.get("backfill_watermark")) if seen], default=None)
+    
+    if complete:
+        update = {"watermark": newest, "backfill_until": None, "backfill_watermark": None}
+    else:
+        backfill_until = min(published, default=window.get("backfill_until"))
+        update = {"watermark": watermark, "backfill_until": backfill_until, "backfill_watermark": newest}
+    update["updated_at"] = now
+    db.batch_checkpoints.update_one({"_id": NEWS_FETCH_CHECKPOINT_ID}, {"$set": update}, upsert=True)
+
+def encode_news_search_cursor(score: float, article_id) -> str:
+    """Opaque cursor for the search result after (score, article_id)"""
+    return base64.urlsafe_b64encode(json.dumps([score, str(article_id)]).encode("utf-8")).decode("ascii")
+
+def decode_news_search_cursor(cursor: str) -> tuple:
+    """
+    Decode a search cursor into (score, ObjectId).
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    from bson import ObjectId
+    try:
+        score, article_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return float(score), ObjectId(article_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def search_news_articles(db, query: str, limit: int = 20, published_from: Optional[datetime] = None,
+                         published_to: Optional[datetime] = None, cursor: Optional[str] = None) -> tuple:
+    """
+    Full-text search over article title, summary and source, most relevant first.
+    
+    Results are ordered by (text score, _id) descending, so a cursor holding
+    the last pair returned continues exactly where the previous page ended.
+    Every page still scores and sorts all matching articles; the cursor keeps
+    pages consistent, it does not make later pages cheaper.
+    
+    Returns:
+        The page of articles with their score, and the cursor for the next page or None
+    """
+    match = {"$text": {"$search": query}}
+    if published_from or published_to:
+        match["published_at"] = {}
+        if published_from:
+            match["published_at"]["$gte"] = published_from
+        if published_to:
+            match["published_at"]["$lte"] = published_to
+    
+    pipeline = [{"$match": match}, {"$addFields": {"score": {"$meta": "textScore"}}}]
+    if cursor:
+        score, article_id = decode_news_search_cursor(cursor)
+        pipeline.append({"$match": {"$or": [
+            {"score": {"$lt": score}},
+            {"score": score, "_id": {"$lt": article_id}}
+        ]}})
+    pipeline += [
+        {"$sort": {"score": -1, "_id": -1}},
+        {"$limit": limit + 1},
+        {"$project": {"simhash": 0, "simhash_bands": 0}}
+    ]
+    
+    news_collection = db.news_articles
+    articles = list(news_collection.aggregate(pipeline))
+    next_cursor = None
+    if len(articles) > limit:
+        articles = articles[:limit]
+        next_cursor = encode_news_search_cursor(articles[-1]["score"], articles[-1]["_id"])
+    return articles, next_cursor
+
+async def fetch_news_from_api(api_key: str, since: Optional[datetime] = None, until: Optional[datetime] = None) -> tuple:
+    """
+    Fetch news from NewsAPI.org, only articles published between since and until when given.
+    
+    Returns:
+        The articles, and whether they are all the articles in that window
+    """
+    # httpx is only loaded once news is actually fetched
+    from news_client import NewsAPIClient
     try:
         # Check if we have a valid API key
         if not api_key or api_key == "your-news-api-key-here":
             raise ValueError("No valid NewsAPI key configured")
         
-        url = "https://newsapi.org/v2/everything"
-        params = {
-            "q": query,
-            "domains": "variety.com,hollywoodreporter.com,deadline.com,imdb.com,backstage.com",
-            "language": "en",
-            "sortBy": "publishedAt",
-            "pageSize": page_size,
-            "apiKey": api_key
-        }
-        
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        return data.get("articles", [])
+        async with NewsAPIClient(api_key) as client:
+            return await client.fetch_articles(since=since, until=until)
     except Exception as e:
         print(f"Error fetching news from API: {e}")
         raise e
 
+# Fields refreshed when NewsAPI returns an article we already store
+NEWS_MUTABLE_FIELDS = ("title", "summary", "source", "image_url", "published_at", "simhash", "simhash_bands")
+
+def normalize_news_article(article: dict, fetched_at: datetime) -> Optional[dict]:
+    """Convert a NewsAPI article into an article document, or None if it lacks required fields"""
+    if not article.get("title") or not article.get("url") or not article.get("publishedAt"):
+        return None
+    summary = (article.get("description") or "")[:500]  # Limit summary length
+    source = (article.get("source") or {}).get("name") or "Unknown"
+    fingerprint = article_fingerprint(article["title"], summary, source)
+    return {
+        "title": article["title"],
+        "summary": summary,
+        "source": source,
+        "url": article["url"],
+        "image_url": article.get("urlToImage"),
+        "category": DEFAULT_CATEGORY,
+        "published_at": datetime.fromisoformat(article["publishedAt"].replace("Z", "+00:00")),
+        "fetched_at": fetched_at,
+        "origin": NEWS_API_ORIGIN,
+        "simhash": fingerprint,
+        "simhash_bands": simhash_bands(fingerprint),
+        "ai_insights": None  # Filled in by the enrichment stage
+    }
 
-def process_and_store_news_articles(db, articles: list) -> int:
-    """Process and store news articles from API response"""
-    stored_count = 0
+def cluster_news_duplicates(db, documents: dict) -> dict:
+    """
+    Find near-duplicates among new articles in a normalized batch keyed by url.
+    
+    Articles not stored yet are compared, oldest first, against recent stored
+    articles sharing a SimHash band and against earlier articles in the batch.
     
+    Returns:
+        Canonical article url for each url that duplicates another article
+    """
+    published = [document["published_at"] for document in documents.values()]
+    since = min(published) - timedelta(days=NEWS_DUPLICATE_WINDOW_DAYS)
+    bands = list({band for document in documents.values() for band in document["simhash_bands"]})
+    
+    news_collection = db.news_articles
+    candidates = news_collection.find(
+        {"$or": [
+            {"url": {"$in": list(documents)}},
+            {"simhash_bands": {"$in": bands}, "published_at": {"$gte": since}}
+        ]},
+        {"url": 1, "simhash": 1}
+    )
+    
+    index = DuplicateIndex()
+    stored_urls = set()
+    for candidate in candidates:
+        stored_urls.add(candidate["url"])
+        if candidate.get("simhash") is not None:
+            index.add(candidate["url"], candidate["simhash"])
+    
+    canonical_urls = {}
+    for document in sorted(documents.values(), key=lambda document: document["published_at"]):
+        if document["url"] in stored_urls:
+            continue
+        canonical_url = index.find(document["simhash"])
+        if canonical_url is None:
+            index.add(document["url"], document["simhash"])
+        else:
+            canonical_urls[document["url"]] = canonical_url
+    return canonical_urls
+
+def store_news_duplicates(db, operations: list):
+    """Record clustered duplicates on their stored canonical articles"""
+    if not operations:
+        return
+    news_collection = db.news_articles
+    try:
+        news_collection.bulk_write(operations, ordered=False)
+    except Exception as e:
+        print(f"Error recording news duplicates: {e}")
+
+def process_and_store_news_articles(db, articles: list) -> dict:
+    """
+    Normalize a batch of NewsAPI articles and upsert it keyed by url in one bulk write.
+    
+    New articles are inserted whole; articles already stored only get their
+    mutable fields refreshed, keeping their category, fetch time and insights.
+    New articles that near-duplicate a stored or earlier article are not
+    inserted, but pushed onto that article's duplicates once it is written.
+    
+    Returns:
+        Counts of inserted, updated, unchanged, clustered and skipped (invalid
+        or duplicate in the batch) articles, plus failed writes
+    """
+    report = {"inserted": 0, "updated": 0, "unchanged": 0, "clustered": 0, "skipped": 0, "errors": 0}
+    fetched_at = datetime.utcnow()
+    documents = {}
     for article in articles:
         try:
-            # Skip articles without required fields
-            if not article.get("title") or not article.get("url"):
-                continue
-            
-            # Prepare article data
-            article_data = {
-                "title": article["title"],
-                "summary": article.get("description", "")[:500],  # Limit summary length
-                "source": article.get("source", {}).get("name", "Unknown"),
-                "url": article["url"],
-                "image_url": article.get("urlToImage"),
-                "category": "entertainment",
-                "published_at": datetime.fromisoformat(article["publishedAt"].replace("Z", "+00:00")),
-                "fetched_at": datetime.utcnow(),
-                "ai_insights": None  # Will be populated later with AI analysis
-            }
-            
-            # Try to store the article
-            if create_news_article(db, article_data):
-                stored_count += 1
+            document = normalize_news_article(article, fetched_at)
         except Exception as e:
             print(f"Error processing article: {e}")
+            document = None
+        if document is None or document["url"] in documents:
+            report["skipped"] += 1
             continue
+        documents[document["url"]] = document
     
-    return stored_count
-
-def generate_ai_insights(article_title: str, article_summary: str) -> str:
-    """Generate AI insights for an article (placeholder for now)"""
-    # This is a placeholder - in a real implementation, you would use an AI service
-    # like OpenAI GPT, Google's AI, or similar to generate insights
-    insights = []
-    
-    # Simple keyword-based insights
-    content = f"{article_title} {article_summary}".lower()
+    if not documents:
+        return report
     
-    if any(word in content for word in ["casting", "audition", "role"]):
-        insights.append("This could present new opportunities for actors seeking roles.")
-    
-    if any(word in content for word in ["streaming", "netflix", "hulu", "amazon"]):
-        insights.append("Streaming platforms continue to drive demand for diverse content.")
+    try:
+        canonical_urls = cluster_news_duplicates(db, documents)
+    except Exception as e:
+        print(f"Error checking news duplicates: {e}")
+        canonical_urls = {}
+    
+    # Duplicates are pushed onto their canonical article once per url after the
+    # upsert, whether it is inserted in this batch or already stored (a re-fetched
+    # stored article would ignore them in $setOnInsert)
+    duplicate_operations = []
+    for url, canonical_url in canonical_urls.items():
+        duplicate = documents.pop(url)
+        entry = {"url": url, "source": duplicate["source"], "published_at": duplicate["published_at"]}
+        duplicate_operations.append(
+            UpdateOne({"url": canonical_url, "duplicates.url": {"$ne": url}}, {"$push": {"duplicates": entry}})
+        )
+    report["clustered"] = len(canonical_urls)
+    if not documents:
+        store_news_duplicates(db, duplicate_operations)
+        return report
     
-    if any(word in content for word in ["self-tape", "virtual", "remote"]):
-        insights.append("The industry continues to embrace remote audition processes.")
+    categories = get_news_classifier().classify_batch(list(documents.values()))
+    for document, category in zip(documents.values(), categories):
+        document["category"] = category
     
-    if any(word in content for word in ["diversity", "inclusion", "representation"]):
-        insights.append("Industry focus on diversity creates more opportunities for underrepresented actors.")
+    operations = []
+    for url, document in documents.items():
+        mutable = {field: document[field] for field in NEWS_MUTABLE_FIELDS}
+        on_insert = {field: value for field, value in document.items() if field not in mutable}
+        operations.append(UpdateOne({"url": url}, {"$set": mutable, "$setOnInsert": on_insert}, upsert=True))
     
-    return " ".join(insights) if insights else "Stay informed about industry trends that may impact your career."
+    news_collection = db.news_articles
+    try:
+        result = news_collection.bulk_write(operations, ordered=False)
+        report["inserted"] = result.upserted_count
+        report["updated"] = result.modified_count
+        report["unchanged"] = result.matched_count - result.modified_count
+    except BulkWriteError as e:
+        details = e.details
+        report["inserted"] = details.get("nUpserted", 0)
+        report["updated"] = details.get("nModified", 0)
+        report["unchanged"] = details.get("nMatched", 0) - details.get("nModified", 0)
+        report["errors"] = len(details.get("writeErrors", []))
+        print(f"Error storing news articles: {report['errors']} failed writes")
+    store_news_duplicates(db, duplicate_operations)
+    if report["inserted"] or report["updated"]:
+        bump_news_cache_version(db)
+    return report
 
 # Initialize AI service instance
 ai_service = None
@@ -947,257 +1610,332 @@ def get_ai_service():
     return ai_service
 
 # Profile AI Insights helper functions
-def generate_profile_ai_insights(profile_data: dict) -> dict:
-    """Generate AI insights based on profile data using Gemini API"""
-    # Try to use AI service first
-    service = get_ai_service()
-    if service:
-        try:
-            return service.generate_profile_insights(profile_data)
-        except Exception as e:
-            print(f"AI service failed, falling back to rule-based insights: {e}")
-    
-    # Fallback to rule-based insights if AI service is unavailable
-    insights = {
-        "lookalikes": [],
-        "scripts": [],
-        "headshots": [],
-        "careerAdvice": []
-    }
-    
-    # Extract profile information
-    age_range = profile_data.get("age_range", "")
-    eye_color = profile_data.get("eye_color", "")
-    hair_color = profile_data.get("hair_color", "")
-    build = profile_data.get("build", "")
-    ethnicity = profile_data.get("ethnicity", "")
-    preferred_genres = profile_data.get("preferred_genres", [])
-    special_skills = profile_data.get("special_skills", [])
-    stage_experience = profile_data.get("stage_experience", False)
-    film_experience = profile_data.get("film_experience", False)
-    career_goals = profile_data.get("career_goals", "")
-    
-    # Generate lookalike recommendations based on physical attributes and age
-    lookalikes = generate_lookalike_recommendations(age_range, eye_color, hair_color, build, ethnicity)
-    insights["lookalikes"] = lookalikes
-    
-    # Generate script recommendations based on experience and preferences
-    scripts = generate_script_recommendations(preferred_genres, stage_experience, film_experience, age_range)
-    insights["scripts"] = scripts
-    
-    # Generate headshot recommendations based on physical attributes
-    headshots = generate_headshot_recommendations(eye_color, hair_color, build, age_range)
-    insights["headshots"] = headshots
-    
-    # Generate career advice based on experience and goals
-    career_advice = generate_career_advice(stage_experience, film_experience, special_skills, career_goals, age_range)
-    insights["careerAdvice"] = career_advice
-    
+def get_cached_profile_insights(db, cache_key: str) -> Optional[dict]:
+    """
+    Return unexpired cached insights for a profile content hash, if any.
+    
+    Rule-based entries written by the precompute job when the AI failed are
+    skipped, so members get AI insights again as soon as Gemini recovers.
+    """
+    cache_collection = db.profile_insights_cache
+    try:
+        cached = cache_collection.find_one(
+            {"_id": cache_key, "source": {"$ne": "rules"}, "expires_at": {"$gt": datetime.utcnow()}},
+            {"insights": 1}
+        )
+    except Exception as e:
+        print(f"Error reading cached insights: {e}")
+        cached = None
+    ai_metrics.increment("insights_cache_hits" if cached else "insights_cache_misses")
+    return cached["insights"] if cached else None
+
+def store_profile_insights(db, cache_key: str, profile_id, insights: dict, source: str = "ai",
+                           ttl_seconds: int = AI_INSIGHTS_CACHE_TTL_SECONDS) -> bool:
+    """Cache generated insights under the profile content hash"""
+    cache_collection = db.profile_insights_cache
+    now = datetime.utcnow()
+    try:
+        cache_collection.update_one(
+            {"_id": cache_key},
+            {"$set": {
+                "profile_id": profile_id,
+                "insights": insights,
+                "source": source,
+                "created_at": now,
+                "expires_at": now + timedelta(seconds=ttl_seconds)
+            }},
+            upsert=True
+        )
+        return True
+    except Exception as e:
+        print(f"Error caching insights: {e}")
+        return False
+
+async def generate_cached_ai_insights(service, profile_data: dict, db=None) -> dict:
+    """AI insights for a profile, without falling back to rule-based insights.
+    
+    When a database is given, results are cached by a hash of the prompt inputs
+    so unchanged profiles don't trigger another Gemini call. Concurrent requests
+    for the same hash share one insight job (see enqueue_insight_job). AI failures
+    are raised.
+    """
+    cache_key = profile_insights_cache_key(profile_data)
+    if db is not None:
+        # pymongo blocks, so cache reads and writes stay off the event loop
+        cached_insights = await asyncio.to_thread(get_cached_profile_insights, db, cache_key)
+        if cached_insights:
+            ai_metrics.increment("insights_served_cache")
+            return cached_insights
+    insights = await service.generate_profile_insights_async(profile_data)
+    if db is not None:
+        await asyncio.to_thread(store_profile_insights, db, cache_key, profile_data.get("_id"), insights)
+    ai_metrics.increment("insights_served_ai")
     return insights
 
-def generate_lookalike_recommendations(age_range: str, eye_color: str, hair_color: str, build: str, ethnicity: str) -> list:
-    """Generate actor lookalike recommendations based on physical attributes"""
-    lookalikes = []
-    
-    # Age-based recommendations
-    if "18-25" in age_range or "16-20" in age_range:
-        young_actors = [
-            {"name": "Zendaya", "reason": "Versatile young performer with strong screen presence"},
-            {"name": "Timothée Chalamet", "reason": "Acclaimed young actor with dramatic range"},
-            {"name": "Anya Taylor-Joy", "reason": "Rising star with distinctive features and versatility"},
-            {"name": "Jacob Elordi", "reason": "Popular young actor with strong dramatic skills"}
-        ]
-        lookalikes.extend(young_actors[:2])
-    elif "25-35" in age_range:
-        mid_career_actors = [
-            {"name": "Emma Stone", "reason": "Versatile performer with comedy and drama experience"},
-            {"name": "Michael B. Jordan", "reason": "Strong leading man with action and drama credentials"},
-            {"name": "Margot Robbie", "reason": "Charismatic performer with range across genres"},
-            {"name": "Oscar Isaac", "reason": "Character actor with strong dramatic presence"}
-        ]
-        lookalikes.extend(mid_career_actors[:2])
-    elif "35-50" in age_range:
-        established_actors = [
-            {"name": "Ryan Gosling", "reason": "Established actor with indie and mainstream appeal"},
-            {"name": "Amy Adams", "reason": "Versatile performer with strong dramatic and musical skills"},
-            {"name": "Idris Elba", "reason": "Commanding presence across multiple genres"},
-            {"name": "Cate Blanchett", "reason": "Award-winning actress with incredible range"}
+# AI insight job queue helper functions
+def insight_job_status(job: dict) -> dict:
+    """Format an insight job for API responses"""
+    job_status = {
+        "job_id": str(job["_id"]),
+        "profile_id": str(job["profile_id"]),
+        "status": job["status"],
+        "attempts": job.get("attempts", 0),
+        "created_at": job["created_at"].isoformat(),
+        "updated_at": job["updated_at"].isoformat()
+    }
+    if job["status"] == "completed":
+        job_status["result"] = job.get("result")
+    if job["status"] == "failed":
+        job_status["error"] = job.get("error")
+    return job_status
+
+def get_active_insight_job(db, cache_key: str):
+    """Find a queued or running (unexpired lease) job for the same profile content"""
+    jobs_collection = db.ai_insight_jobs
+    return jobs_collection.find_one({
+        "cache_key": cache_key,
+        "$or": [
+            {"status": "queued"},
+            {"status": "running", "lease_expires_at": {"$gt": datetime.utcnow()}}
         ]
-        lookalikes.extend(established_actors[:2])
-    
-    # Add physical attribute-based recommendations
-    if eye_color and hair_color:
-        if eye_color.lower() == "blue" and hair_color.lower() == "blonde":
-            lookalikes.append({"name": "Scarlett Johansson", "reason": f"Similar {eye_color.lower()} eyes and {hair_color.lower()} hair combination"})
-        elif eye_color.lower() == "brown" and hair_color.lower() == "brown":
-            lookalikes.append({"name": "Oscar Isaac", "reason": f"Similar {eye_color.lower()} eyes and {hair_color.lower()} hair combination"})
-    
-    return lookalikes[:3]  # Return top 3 recommendations
-
-def generate_script_recommendations(preferred_genres: list, stage_experience: bool, film_experience: bool, age_range: str) -> list:
-    """Generate script and monologue recommendations"""
-    scripts = []
-    
-    # Genre-based recommendations
-    if "Drama" in preferred_genres:
-        scripts.append({
-            "title": "Contemporary Monologue: 'Rabbit Hole' by David Lindsay-Abaire",
-            "reason": "Perfect for showcasing emotional depth and dramatic range"
-        })
-    
-    if "Comedy" in preferred_genres:
-        scripts.append({
-            "title": "Comedy Scene: 'The Marvelous Mrs. Maisel'",
-            "reason": "Great for demonstrating comedic timing and wit"
-        })
-    
-    if "Horror" in preferred_genres or "Thriller" in preferred_genres:
-        scripts.append({
-            "title": "Suspense Monologue: 'Black Swan'",
-            "reason": "Excellent for showing intensity and psychological depth"
-        })
-    
-    # Experience-based recommendations
-    if stage_experience:
-        scripts.append({
-            "title": "Classical Scene: 'Romeo and Juliet' by Shakespeare",
-            "reason": "Leverage your theater background with classical training"
-        })
-    
-    if film_experience:
-        scripts.append({
-            "title": "Contemporary Film Scene: 'Lady Bird'",
-            "reason": "Modern, relatable content perfect for screen work"
-        })
-    
-    # Age-appropriate recommendations
-    if "18-25" in age_range:
-        scripts.append({
-            "title": "Young Adult Monologue: 'Eighth Grade'",
-            "reason": "Age-appropriate content that showcases youthful authenticity"
-        })
-    
-    return scripts[:3]  # Return top 3 recommendations
+    })
 
-def generate_headshot_recommendations(eye_color: str, hair_color: str, build: str, age_range: str) -> list:
-    """Generate headshot styling recommendations"""
-    headshots = []
-    
-    # Eye color specific recommendations
-    if eye_color:
-        if eye_color.lower() in ["blue", "green"]:
-            headshots.append({
-                "tip": "Natural outdoor lighting",
-                "reason": f"Your {eye_color.lower()} eyes will pop beautifully in natural light"
-            })
-        elif eye_color.lower() == "brown":
-            headshots.append({
-                "tip": "Warm studio lighting",
-                "reason": f"Warm tones will enhance your {eye_color.lower()} eyes"
-            })
-    
-    # Hair color recommendations
-    if hair_color:
-        if hair_color.lower() in ["blonde", "light brown"]:
-            headshots.append({
-                "tip": "Soft, diffused lighting",
-                "reason": f"Gentle lighting will complement your {hair_color.lower()} hair"
-            })
-        elif hair_color.lower() in ["black", "dark brown"]:
-            headshots.append({
-                "tip": "High contrast lighting",
-                "reason": f"Strong lighting will create beautiful contrast with your {hair_color.lower()} hair"
-            })
-    
-    # Age-appropriate styling
-    if "18-25" in age_range:
-        headshots.append({
-            "tip": "Fresh, minimal makeup look",
-            "reason": "Showcase your youthful, natural beauty"
-        })
-    elif "25-35" in age_range:
-        headshots.append({
-            "tip": "Professional business casual wardrobe",
-            "reason": "Perfect for your age range and versatile casting opportunities"
-        })
-    
-    # Build-specific recommendations
-    if build:
-        if build.lower() in ["athletic", "muscular"]:
-            headshots.append({
-                "tip": "Action-ready casual look",
-                "reason": f"Highlight your {build.lower()} build for action/adventure roles"
-            })
-    
-    return headshots[:3]  # Return top 3 recommendations
+def get_insight_job(db, job_id: str):
+    jobs_collection = db.ai_insight_jobs
+    from bson import ObjectId
+    try:
+        return jobs_collection.find_one({"_id": ObjectId(job_id)})
+    except:
+        return None
 
-def generate_career_advice(stage_experience: bool, film_experience: bool, special_skills: list, career_goals: str, age_range: str) -> list:
-    """Generate personalized career advice"""
-    advice = []
-    
-    # Experience-based advice
-    if stage_experience and not film_experience:
-        advice.append({
-            "advice": "Transition to on-camera work",
-            "reason": "Your stage experience is valuable - now focus on self-tape skills and screen acting techniques"
-        })
-    elif film_experience and not stage_experience:
-        advice.append({
-            "advice": "Explore theater opportunities",
-            "reason": "Stage work will strengthen your craft and expand your network"
-        })
-    elif stage_experience and film_experience:
-        advice.append({
-            "advice": "Leverage your versatility",
-            "reason": "Your experience in both mediums makes you highly marketable"
-        })
-    
-    # Skills-based advice
-    if special_skills:
-        if any(skill.lower() in ["singing", "music", "piano", "guitar"] for skill in special_skills):
-            advice.append({
-                "advice": "Pursue musical theater and film opportunities",
-                "reason": "Your musical abilities open doors to specialized casting"
-            })
-        
-        if any(skill.lower() in ["martial arts", "stunts", "athletics", "sports"] for skill in special_skills):
-            advice.append({
-                "advice": "Consider action and stunt work",
-                "reason": "Your physical skills are valuable for action productions"
-            })
+def enqueue_insight_job(db, profile_id, cache_key: str) -> dict:
+    """
+    Queue insight generation for a profile, reusing an active job for the same content.
+    
+    The unique partial index on cache_key over active jobs makes this atomic:
+    of concurrent enqueues for the same content one inserts, the others get
+    its job back. This is what coalesces identical generations across workers,
+    so reused jobs are counted as coalesced calls.
+    """
+    jobs_collection = db.ai_insight_jobs
+    existing_job = get_active_insight_job(db, cache_key)
+    if existing_job:
+        ai_metrics.increment("ai_insight_generation_coalesced")
+        return existing_job
+    
+    now = datetime.utcnow()
+    job = {
+        "profile_id": profile_id,
+        "cache_key": cache_key,
+        "status": "queued",
+        "attempts": 0,
+        "result": None,
+        "error": None,
+        "worker_id": None,
+        "lease_expires_at": None,
+        "not_before": None,
+        "created_at": now,
+        "updated_at": now,
+        "expires_at": now + timedelta(seconds=AI_INSIGHT_JOB_RETENTION_SECONDS)
+    }
+    try:
+        job["_id"] = jobs_collection.insert_one(job).inserted_id
+        ai_metrics.increment("ai_insight_generation_calls")
+        return job
+    except DuplicateKeyError:
+        pass
+    
+    # Lost the race, or a job whose lease expired is still waiting to be reclaimed
+    active_job = jobs_collection.find_one({"cache_key": cache_key, "status": {"$in": AI_INSIGHT_JOB_ACTIVE_STATUSES}})
+    if active_job:
+        ai_metrics.increment("ai_insight_generation_coalesced")
+        return active_job
+    # The competing job finished in between, so this insert can't collide again
+    job.pop("_id", None)
+    job["_id"] = jobs_collection.insert_one(job).inserted_id
+    ai_metrics.increment("ai_insight_generation_calls")
+    return job
+
+def claim_insight_job(db, worker_id: str):
+    """Atomically take the oldest queued job due to run, or a running job whose worker's lease expired"""
+    jobs_collection = db.ai_insight_jobs
+    now = datetime.utcnow()
+    return jobs_collection.find_one_and_update(
+        {
+            "$or": [
+                {"status": "queued", "not_before": {"$not": {"$gt": now}}},
+                {"status": "running", "lease_expires_at": {"$lt": now}}
+            ],
+            "attempts": {"$lt": AI_INSIGHT_JOB_MAX_ATTEMPTS}
+        },
+        {
+            "$set": {
+                "status": "running",
+                "worker_id": worker_id,
+                "lease_expires_at": now + timedelta(seconds=AI_INSIGHT_JOB_LEASE_SECONDS),
+                "updated_at": now
+            },
+            "$inc": {"attempts": 1}
+        },
+        sort=[("created_at", 1)],
+        return_document=ReturnDocument.AFTER
+    )
+
+def fail_abandoned_insight_jobs(db) -> int:
+    """
+    Mark failed the running jobs whose worker died during their last attempt.
+    
+    claim_insight_job won't take them again, so without this they would stay
+    running, and keep being handed back to new enqueues, until retention.
+    """
+    jobs_collection = db.ai_insight_jobs
+    now = datetime.utcnow()
+    result = jobs_collection.update_many(
+        {
+            "status": "running",
+            "lease_expires_at": {"$lt": now},
+            "attempts": {"$gte": AI_INSIGHT_JOB_MAX_ATTEMPTS}
+        },
+        {"$set": {
+            "status": "failed",
+            "error": "Worker lease expired on the final attempt",
+            "lease_expires_at": None,
+            "updated_at": now
+        }}
+    )
+    return result.modified_count
+
+def insight_job_retry_delay(attempts: int) -> float:
+    """Seconds to wait before retrying a job that has failed attempts times"""
+    return AI_INSIGHT_JOB_RETRY_BASE_SECONDS * 2 ** (max(1, attempts) - 1)
+
+def finish_insight_job(db, job: dict, result: Optional[dict] = None, error: Optional[str] = None):
+    """
+    Record a job's outcome.
+    
+    Failed attempts are re-queued with exponential backoff until attempts run
+    out, so a retry isn't claimed again before the AI has had time to recover.
+    """
+    jobs_collection = db.ai_insight_jobs
+    if error is None:
+        update = {"status": "completed", "result": result, "error": None}
+    elif job.get("attempts", 0) < AI_INSIGHT_JOB_MAX_ATTEMPTS:
+        retry_at = datetime.utcnow() + timedelta(seconds=insight_job_retry_delay(job.get("attempts", 0)))
+        update = {"status": "queued", "error": error, "not_before": retry_at}
+    else:
+        update = {"status": "failed", "error": error}
+    update.update({"lease_expires_at": None, "updated_at": datetime.utcnow()})
+    jobs_collection.update_one({"_id": job["_id"], "worker_id": job["worker_id"]}, {"$set": update})
+
+async def process_insight_job(db, job: dict):
+    """Generate (and cache) insights for a claimed job"""
+    profile = await asyncio.to_thread(get_profile_by_id, db, str(job["profile_id"]))
+    if not profile:
+        job["attempts"] = AI_INSIGHT_JOB_MAX_ATTEMPTS  # Retrying won't help
+        await asyncio.to_thread(finish_insight_job, db, job, None, "Profile not found")
+        return
+    service = get_ai_service()
+    if service is None:
+        job["attempts"] = AI_INSIGHT_JOB_MAX_ATTEMPTS  # Retrying won't help
+        await asyncio.to_thread(finish_insight_job, db, job, None, "AI service unavailable")
+        return
+    # AI failures are retried by the queue rather than completed with rule-based insights
+    try:
+        insights = await generate_cached_ai_insights(service, profile, db)
+    except Exception as e:
+        await asyncio.to_thread(finish_insight_job, db, job, None, str(e))
+        return
+    await asyncio.to_thread(finish_insight_job, db, job, insights)
+
+async def run_insight_job_worker(worker_id: str, stop_event: asyncio.Event):
+    """Poll the job collection and process insight jobs until shutdown"""
+    db = None
+    while not stop_event.is_set():
+        try:
+            if db is None:
+                db = await asyncio.to_thread(get_db)
+            job = await asyncio.to_thread(claim_insight_job, db, worker_id)
+            if job:
+                await process_insight_job(db, job)
+                continue
+            await asyncio.to_thread(fail_abandoned_insight_jobs, db)
+        except Exception as e:
+            print(f"Insight job worker {worker_id} error: {e}")
         
-        if any(skill.lower() in ["languages", "accents", "dialects"] for skill in special_skills):
-            advice.append({
-                "advice": "Market your linguistic abilities",
-                "reason": "Multilingual actors are in high demand for diverse productions"
-            })
-    
-    # Age-specific advice
-    if "18-25" in age_range:
-        advice.append({
-            "advice": "Build your reel with student films",
-            "reason": "Collaborate with film students to build experience and footage"
-        })
-    elif "25-35" in age_range:
-        advice.append({
-            "advice": "Focus on leading roles",
-            "reason": "You're in the prime age range for protagonist roles"
-        })
-    
-    # Goals-based advice
-    if career_goals:
-        if "television" in career_goals.lower():
-            advice.append({
-                "advice": "Study current TV shows in your demographic",
-                "reason": "Understanding current television trends will help you target the right opportunities"
-            })
-        elif "film" in career_goals.lower():
-            advice.append({
-                "advice": "Attend film festivals and industry events",
-                "reason": "Networking in the film community is crucial for breaking into cinema"
-            })
-    
-    return advice[:3]  # Return top 3 recommendations
+        # Nothing to do (or an error): wait for the next poll or shutdown
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=AI_INSIGHT_JOB_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+def ai_generation_available() -> bool:
+    """Whether an insight job queued now could reach the AI (there is a service and its breaker isn't open)"""
+    service = get_ai_service()
+    return service is not None and service.circuit_breaker.state != "open"
+
+def resolve_profile_ai_insights(db, profile: dict):
+    """
+    Insights for a profile page without waiting on Gemini.
+    
+    Returns the cached insights, or the 202 status of the job generating them,
+    queueing one if none is active. Without an AI service, or while its circuit
+    breaker is open, the rule-based insights are returned directly.
+    """
+    if not ai_generation_available():
+        ai_metrics.increment("insights_served_rules")
+        return get_insight_rules().generate(profile)
+    
+    cache_key = profile_insights_cache_key(profile)
+    cached_insights = get_cached_profile_insights(db, cache_key)
+    if cached_insights:
+        ai_metrics.increment("insights_served_cache")
+        return cached_insights
+    
+    job = enqueue_insight_job(db, profile["_id"], cache_key)
+    return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=insight_job_status(job))
+
+def format_sse(event: str, data) -> str:
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+async def stream_profile_ai_insights(db, profile: dict):
+    """Yield insight sections as Server-Sent Events as soon as each one is available"""
+    cache_key = profile_insights_cache_key(profile)
+    cached_insights = await asyncio.to_thread(get_cached_profile_insights, db, cache_key)
+    if cached_insights:
+        for section in INSIGHT_SECTIONS:
+            yield format_sse(section, cached_insights.get(section, []))
+        ai_metrics.increment("insights_served_cache")
+        yield format_sse("done", {"source": "cache"})
+        return
+    
+    sections = {}
+    source = "rules"
+    service = get_ai_service()
+    if service:
+        try:
+            async for section, items in service.stream_profile_insights(profile):
+                if section in INSIGHT_SECTIONS and section not in sections:
+                    sections[section] = items
+                    yield format_sse(section, items)
+            source = "ai"
+        except Exception as e:
+            print(f"AI insight stream failed, falling back to rule-based insights: {e}")
+            source = "partial" if sections else "rules"
+    
+    # Fill in whatever the model didn't deliver from the rule-based insights
+    missing_sections = [section for section in INSIGHT_SECTIONS if section not in sections]
+    if missing_sections:
+        fallback_insights = get_insight_rules().generate(profile)
+        for section in missing_sections:
+            yield format_sse(section, fallback_insights[section])
+        if source == "ai":
+            source = "partial"
+    elif source == "ai":
+        await asyncio.to_thread(store_profile_insights, db, cache_key, profile["_id"], sections)
+    
+    ai_metrics.increment(f"insights_served_{source}")
+    yield format_sse("done", {"source": source})
 
 # Membership check helper
 def check_membership(current_user: UserResponse):
@@ -1207,6 +1945,16 @@ def check_membership(current_user: UserResponse):
             detail="This feature requires an active membership"
         )
 
+def is_admin(current_user: UserResponse) -> bool:
+    return current_user.email.lower() in ADMIN_EMAILS
+
+def check_admin(current_user: UserResponse):
+    if not is_admin(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="This feature is restricted to administrators"
+        )
+
 def get_post_likes_info(db, post_id: str, user_id: str) -> dict:
     likes_collection = db.likes
     from bson import ObjectId
@@ -1454,14 +2202,7 @@ async def create_user_profile(profile_data: ProfileCreate, current_user: UserRes
     
     # Prepare profile data
     from bson import ObjectId
-    profile_dict = profile_data.dict()
-    profile_dict.update({
-        "user_id": ObjectId(current_user.id),
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow(),
-        "completion_percentage": calculate_completion_percentage(profile_dict),
-        "profile_url": generate_profile_url(profile_data.name)
-    })
+    profile_dict = build_profile_document(profile_data, ObjectId(current_user.id))
     
     # Create profile
     profile_id = create_profile(db, profile_dict)
@@ -1478,6 +2219,8 @@ async def create_user_profile(profile_data: ProfileCreate, current_user: UserRes
         {"$set": {"profile_completed": True}}
     )
     
+    refresh_profile_similarity(profile_id, profile_dict)
+    
     return {"id": profile_id}
 
 @app.get("/api/v1/profiles/{profile_id}", response_model=ProfileResponse)
@@ -1529,6 +2272,7 @@ async def get_profile(profile_id: str, current_user: UserResponse = Depends(get_
         is_public=profile.get("is_public", True),
         completion_percentage=profile.get("completion_percentage"),
         profile_url=profile.get("profile_url"),
+        version=profile.get("version", 0),
         created_at=profile["created_at"],
         updated_at=profile["updated_at"]
     )
@@ -1552,42 +2296,114 @@ async def update_user_profile(profile_id: str, profile_data: ProfileUpdate, curr
             detail="Access denied"
         )
     
-    # Prepare update data (only include non-None fields)
-    update_dict = {k: v for k, v in profile_data.dict().items() if v is not None}
-    if update_dict:
-        update_dict["updated_at"] = datetime.utcnow()
-        
-        # Recalculate completion percentage with updated data
-        merged_data = {**profile, **update_dict}
-        update_dict["completion_percentage"] = calculate_completion_percentage(merged_data)
-        
-        # Update profile URL if name changed
-        if "name" in update_dict:
-            update_dict["profile_url"] = generate_profile_url(update_dict["name"])
-        
-        # Update profile
-        if not update_profile(db, profile_id, update_dict):
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to update profile"
-            )
+    # Reject edits based on a stale copy of the profile
+    current_version = profile.get("version", 0)
+    expected_version = profile_data.expected_version
+    if expected_version is not None and expected_version != current_version:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Profile was modified by another request"
+        )
     
-    return {"id": profile_id}
+    # Prepare update data (only include snake_case fields that actually changed)
+    update_dict = diff_profile_update(
+        profile,
+        profile_data.dict(exclude={"expected_version"} | PROFILE_UPDATE_CAMEL_CASE_FIELDS)
+    )
+    if not update_dict:
+        # Nothing changed - skip the write and the recompute entirely
+        return {"id": profile_id, "version": current_version, "updated": False}
+    
+    update_dict["updated_at"] = datetime.utcnow()
+    
+    # Recalculate completion percentage with updated data
+    merged_data = {**profile, **update_dict}
+    completion_percentage = calculate_completion_percentage(merged_data)
+    if completion_percentage != profile.get("completion_percentage"):
+        update_dict["completion_percentage"] = completion_percentage
+    
+    # Update profile URL if name changed
+    if "name" in update_dict:
+        update_dict["profile_url"] = generate_profile_url(update_dict["name"])
+    
+    # Update profile, conditioned on the version we read
+    if not update_profile(db, profile_id, update_dict, current_version):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Profile was modified by another request"
+        )
+    
+    refresh_profile_similarity(profile_id, merged_data)
+    
+    return {"id": profile_id, "version": current_version + 1, "updated": True}
+
+@app.get("/api/v1/profiles/{profile_id}/similar", response_model=list[SimilarProfileResponse])
+async def get_similar_profiles(profile_id: str, limit: int = 5, current_user: UserResponse = Depends(get_current_user)):
+    """Get public profiles on the platform most similar to the given profile"""
+    db = get_db()
+    
+    profile = get_profile_by_id(db, profile_id)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    
+    # Check if profile is public or belongs to current user
+    if not profile.get("is_public", True) and str(profile["user_id"]) != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to private profile"
+        )
+    
+    limit = max(1, min(limit, 50))
+    # The first lookup in a worker builds the index from every public profile, so keep it off the event loop
+    index = await run_in_threadpool(get_similarity_index, db)
+    matches = await run_in_threadpool(index.query, profile, limit, profile_id)
+    if not matches:
+        return []
+    
+    # Load display fields for the matches in one query, then keep the ranking order
+    from bson import ObjectId
+    similar_profiles = db.profiles.find(
+        {"_id": {"$in": [ObjectId(match_id) for match_id, _ in matches]}},
+        {"user_id": 1, "name": 1, "age_range": 1, "location": 1, "headshots": 1, "profile_url": 1}
+    )
+    profiles_by_id = {str(similar["_id"]): similar for similar in similar_profiles}
+    
+    responses = []
+    for match_id, similarity in matches:
+        similar = profiles_by_id.get(match_id)
+        if not similar:
+            continue
+        headshots = similar.get("headshots") or []
+        responses.append(SimilarProfileResponse(
+            id=match_id,
+            user_id=str(similar["user_id"]),
+            name=similar["name"],
+            age_range=similar.get("age_range"),
+            location=similar.get("location"),
+            headshot=headshots[0] if headshots else None,
+            profile_url=similar.get("profile_url"),
+            similarity=round(similarity, 4)
+        ))
+    
+    return responses
 
 @app.get("/api/v1/profiles/user/{user_id}", response_model=ProfileResponse)
 async def get_user_profile(user_id: str, current_user: UserResponse = Depends(get_current_user)):
     """Get profile by user ID - useful for getting current user's profile"""
     db = get_db()
     
-    # First check if the user exists
-    user = get_user_by_id(db, user_id)
+    # Resolve the user and their profile in one query
+    user = get_user_with_profile(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    profile = get_profile_by_user_id(db, user_id)
+    profile = user["profile"]
     
     # If user exists but has no profile, create a default profile response
     if not profile:
@@ -1666,10 +2482,63 @@ async def get_user_profile(user_id: str, current_user: UserResponse = Depends(ge
         is_public=profile.get("is_public", True),
         completion_percentage=profile.get("completion_percentage"),
         profile_url=profile.get("profile_url"),
+        version=profile.get("version", 0),
         created_at=profile["created_at"],
         updated_at=profile["updated_at"]
     )
 
+# Bulk profile transfer endpoints
+@app.get("/api/v1/admin/profiles/export")
+async def export_profiles_endpoint(current_user: UserResponse = Depends(get_current_user)):
+    """Stream all profiles as NDJSON (Admins only)"""
+    # Exports include private profiles
+    check_admin(current_user)
+    
+    db = get_db()
+    return StreamingResponse(
+        iter_profiles_ndjson(db),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="profiles.ndjson"'}
+    )
+
+@app.post("/api/v1/admin/profiles/import")
+async def import_profiles_endpoint(file: UploadFile = File(...), current_user: UserResponse = Depends(get_current_user)):
+    """Import profiles from an NDJSON export (Admins only)"""
+    # Imports write profiles for other users
+    check_admin(current_user)
+    
+    db = get_db()
+    
+    # Read and insert in a worker thread so large imports don't block the event loop
+    return await run_in_threadpool(import_profiles_ndjson, db, file.file)
+
+@app.post("/api/v1/admin/insight-rules/reload")
+async def reload_insight_rules_endpoint(current_user: UserResponse = Depends(get_current_user)):
+    """Reload the fallback insight rule table from disk (Admins only)"""
+    check_admin(current_user)
+    
+    try:
+        engine = reload_insight_rules()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to load insight rules: {str(e)}"
+        )
+    
+    return {
+        "message": "Insight rules reloaded",
+        "rule_counts": {section: sum(len(rules) for rules in index.values()) for section, index in engine.indexes.items()}
+    }
+
+@app.get("/api/v1/metrics/ai")
+async def get_ai_metrics(current_user: UserResponse = Depends(get_current_user)):
+    """AI call latency, token, cache and fallback metrics for this worker (Admin only)"""
+    check_admin(current_user)
+    
+    metrics = ai_metrics.snapshot()
+    metrics["circuit_breaker"] = ai_service.circuit_breaker.state if ai_service else None
+    return metrics
+
 # File Upload endpoints
 @app.post("/api/v1/upload", response_model=dict)
 async def upload_file(file: UploadFile = File(...), current_user: UserResponse = Depends(get_current_user)):
@@ -2293,40 +3162,212 @@ async def download_worksheet(category: str, item_id: str, current_user: UserResp
         media_type="application/pdf"
     )
 
-# News endpoints
-@app.get("/api/v1/news", response_model=list[NewsArticleResponse])
-async def get_news_articles_endpoint(
-    skip: int = 0,
-    limit: int = 20,
-    category: Optional[str] = None,
-    current_user: UserResponse = Depends(get_current_user)
-):
-    """Get news articles (Members only)"""
-    db = get_db()
-    
-    # Check membership
-    check_membership(current_user)
-    
-    # Get articles
-    articles = get_news_articles(db, skip, limit, category)
-    
-    # If no articles exist, try to fetch from NewsAPI
-    if not articles and skip == 0:
-        print("No articles found in database, fetching from NewsAPI")
+# News enrichment helper functions
+# Only one enrichment pass runs per worker; the update filter keeps concurrent passes across workers idempotent.
+# A trigger that arrives mid-pass sets the rerun event, so articles inserted behind the running cursor get a pass too.
+news_enrichment_lock = asyncio.Lock()
+news_enrichment_rerun = asyncio.Event()
+
+async def generate_news_insights_batch(service, articles: list) -> list:
+    """Insights for a batch of articles as (text, source) pairs, falling back to keywords per article"""
+    ai_insights = [None] * len(articles)
+    if service:
         try:
-            news_api_key = os.environ.get("NEWS_API_KEY", "your-news-api-key-here")
-            fresh_articles = fetch_news_from_api(news_api_key)
-            if fresh_articles:
-                stored_count = process_and_store_news_articles(db, fresh_articles)
-                print(f"Fetched and stored {stored_count} articles from NewsAPI")
-                # Fetch articles again after storing
-                articles = get_news_articles(db, skip, limit, category)
-            else:
-                print("No articles returned from NewsAPI")
+            ai_insights = await service.generate_news_insights_async(articles)
+        except Exception as e:
+            print(f"AI news insights failed, falling back to keyword insights: {e}")
+    keyword_insights = generate_keyword_insights_for_articles(
+        [article for article, insight in zip(articles, ai_insights) if not insight]
+    )
+    fallback = iter(keyword_insights)
+    return [(insight, "ai") if insight else (next(fallback), "keywords") for insight in ai_insights]
+
+def find_unenriched_news_articles(db, last_id, batch_size: int) -> list:
+    """Next batch, in _id order after last_id, of articles still missing insights"""
+    news_collection = db.news_articles
+    query = {"ai_insights": None}
+    if last_id is not None:
+        query["_id"] = {"$gt": last_id}
+    return list(news_collection.find(query, {"title": 1, "summary": 1}).sort("_id", 1).limit(batch_size))
+
+def store_news_insights(db, operations: list) -> int:
+    """Write a batch of insight updates, returning how many articles were updated"""
+    news_collection = db.news_articles
+    try:
+        result = news_collection.bulk_write(operations, ordered=False)
+        updated = result.modified_count
+    except BulkWriteError as e:
+        updated = e.details.get("nModified", 0)
+        print(f"Error writing news insights: {len(e.details.get('writeErrors', []))} failed updates")
+    if updated:
+        bump_news_cache_version(db)
+    return updated
+
+async def enrich_news_articles(db, max_articles: Optional[int] = None) -> dict:
+    """
+    Fill in ai_insights for stored articles that don't have them yet.
+    
+    Articles are scanned in _id order, sent to the LLM several per call with
+    bounded concurrency, and written back with one unordered bulk_write per
+    scan batch. Updates only match articles whose insights are still missing,
+    so overlapping passes never overwrite each other. A call made while a pass
+    is running queues one more pass from the start instead of waiting.
+    """
+    report = {"scanned": 0, "ai": 0, "keywords": 0, "updated": 0}
+    if news_enrichment_lock.locked():
+        news_enrichment_rerun.set()
+        report["skipped"] = "Enrichment already running, rerun queued"
+        return report
+    
+    async with news_enrichment_lock:
+        service = get_ai_service()
+        semaphore = asyncio.Semaphore(NEWS_ENRICHMENT_CONCURRENCY)
+        
+        async def enrich_group(group):
+            async with semaphore:
+                return await generate_news_insights_batch(service, group)
+        
+        news_enrichment_rerun.clear()
+        last_id = None
+        while max_articles is None or report["scanned"] < max_articles:
+            batch_size = NEWS_ENRICHMENT_SCAN_BATCH_SIZE
+            if max_articles is not None:
+                batch_size = min(batch_size, max_articles - report["scanned"])
+            # pymongo blocks, so database work stays off the event loop
+            articles = await asyncio.to_thread(find_unenriched_news_articles, db, last_id, batch_size)
+            if not articles:
+                if not news_enrichment_rerun.is_set():
+                    break
+                # Rescan from the start for articles inserted behind the cursor during this pass
+                news_enrichment_rerun.clear()
+                last_id = None
+                continue
+            last_id = articles[-1]["_id"]
+            report["scanned"] += len(articles)
+            
+            per_call = max(1, NEWS_ENRICHMENT_ARTICLES_PER_CALL)
+            groups = [articles[i:i + per_call] for i in range(0, len(articles), per_call)]
+            results = await asyncio.gather(*(enrich_group(group) for group in groups))
+            
+            now = datetime.utcnow()
+            operations = []
+            for group, group_results in zip(groups, results):
+                for article, (insight, source) in zip(group, group_results):
+                    report[source] += 1
+                    operations.append(UpdateOne(
+                        {"_id": article["_id"], "ai_insights": None},
+                        {"$set": {"ai_insights": insight, "ai_insights_source": source, "enriched_at": now}}
+                    ))
+            report["updated"] += await asyncio.to_thread(store_news_insights, db, operations)
+        
+        ai_metrics.increment("news_insights_ai", report["ai"])
+        ai_metrics.increment("news_insights_keywords", report["keywords"])
+    return report
+
+async def run_news_enrichment(db):
+    """Background task wrapper that logs the enrichment report"""
+    try:
+        report = await enrich_news_articles(db)
+        print(f"News enrichment: {report}")
+    except Exception as e:
+        print(f"News enrichment failed: {e}")
+
+# Scheduled news ingestion helper functions
+def acquire_scheduler_lock(db, name: str, owner: str, lease_seconds: int) -> bool:
+    """
+    Take the named scheduler lease if its next run is due and no one else holds it.
+    
+    The lock document is upserted on _id, so when another worker holds the
+    lease (or the run isn't due yet) the insert collides and we back off.
+    Taking the lease marks the run due now, so if the holder dies before
+    releasing, the next worker takes over once the lease expires.
+    """
+    locks_collection = db.scheduler_locks
+    now = datetime.utcnow()
+    try:
+        locks_collection.find_one_and_update(
+            {"_id": name, "$and": [
+                {"$or": [{"next_run_at": {"$lte": now}}, {"next_run_at": {"$exists": False}}]},
+                {"$or": [{"lease_expires_at": {"$lt": now}}, {"lease_expires_at": {"$exists": False}}]}
+            ]},
+            {"$set": {
+                "owner": owner,
+                "acquired_at": now,
+                "next_run_at": now,
+                "lease_expires_at": now + timedelta(seconds=lease_seconds)
+            }},
+            upsert=True
+        )
+        return True
+    except DuplicateKeyError:
+        return False
+
+def release_scheduler_lock(db, name: str, owner: str, next_run_in_seconds: int):
+    """Release a held lease and schedule the next run"""
+    locks_collection = db.scheduler_locks
+    now = datetime.utcnow()
+    locks_collection.update_one(
+        {"_id": name, "owner": owner},
+        {"$set": {
+            "lease_expires_at": now,
+            "next_run_at": now + timedelta(seconds=next_run_in_seconds),
+            "released_at": now
+        }}
+    )
+
+async def ingest_news(db) -> dict:
+    """Fetch the latest articles from NewsAPI and store them"""
+    news_api_key = os.environ.get("NEWS_API_KEY", "your-news-api-key-here")
+    window = await run_in_threadpool(load_news_fetch_window, db)
+    articles, complete = await fetch_news_from_api(news_api_key, since=window["watermark"], until=window["backfill_until"])
+    report = {"fetched_count": len(articles), "complete": complete}
+    if articles:
+        # The bulk write is blocking, so keep it off the event loop
+        report.update(await run_in_threadpool(process_and_store_news_articles, db, articles))
+    await run_in_threadpool(record_news_fetch, db, window, articles, complete)
+    return report
+
+async def run_news_scheduler(owner: str, stop_event: asyncio.Event):
+    """
+    Ingest news every NEWS_INGEST_INTERVAL_SECONDS on whichever worker takes the lease first.
+    
+    Only fetching and storing happen under the lease. Enrichment can take much
+    longer than the lease, and is safe to overlap with other passes, so it runs
+    after the lease is released.
+    """
+    db = None
+    while not stop_event.is_set():
+        try:
+            if db is None:
+                db = await asyncio.to_thread(get_db)
+            if await asyncio.to_thread(acquire_scheduler_lock, db, NEWS_INGEST_LOCK, owner, NEWS_INGEST_LEASE_SECONDS):
+                report = {}
+                try:
+                    report = await ingest_news(db)
+                except Exception as e:
+                    print(f"Scheduled news ingestion failed: {e}")
+                finally:
+                    await asyncio.to_thread(release_scheduler_lock, db, NEWS_INGEST_LOCK, owner, NEWS_INGEST_INTERVAL_SECONDS)
+                if report.get("inserted"):
+                    report["enrichment"] = await enrich_news_articles(db)
+                if report:
+                    print(f"Scheduled news ingestion: {report}")
         except Exception as e:
-            print(f"Failed to fetch from NewsAPI: {e}")
-            # Return empty list instead of sample data
-            return []
+            print(f"News scheduler error: {e}")
+        
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=NEWS_SCHEDULER_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+# Rendered news list pages, keyed by (news version, category, skip, limit)
+news_list_cache = ResponseCache("news_list_cache", NEWS_CACHE_MAX_ENTRIES, NEWS_CACHE_TTL_SECONDS)
+news_list_flights = SingleFlight("news_list_render")
+news_list_adapter = TypeAdapter(list[NewsArticleResponse])
+
+def render_news_articles(db, skip: int, limit: int, category: Optional[str]) -> bytes:
+    """Query a page of news articles and serialize it to the JSON response body"""
+    articles = get_news_articles(db, skip, limit, category)
     
     # Convert to response format
     article_responses = []
@@ -2345,7 +3386,107 @@ async def get_news_articles_endpoint(
         )
         article_responses.append(article_response)
     
-    return article_responses
+    return news_list_adapter.dump_json(article_responses)
+
+# News endpoints
+@app.get("/api/v1/news", response_model=list[NewsArticleResponse])
+async def get_news_articles_endpoint(
+    skip: int = 0,
+    limit: int = 20,
+    category: Optional[str] = None,
+    current_user: UserResponse = Depends(get_current_user)
+):
+    """Get news articles (Members only)"""
+    db = get_db()
+    
+    # Check membership
+    check_membership(current_user)
+    
+    # Read-only: articles are ingested by the news scheduler. Pages are cached
+    # until the next write bumps the news version, which is itself re-read every
+    # NEWS_CACHE_VERSION_CHECK_SECONDS rather than on every request.
+    cache_key = (await current_news_cache_version(db), category, skip, limit)
+    body = news_list_cache.get(cache_key)
+    if body is None:
+        async def render():
+            rendered = await run_in_threadpool(render_news_articles, db, skip, limit, category)
+            # Empty pages are cheap to query and may come from a failed read, so they aren't kept
+            if rendered != b"[]":
+                news_list_cache.set(cache_key, rendered)
+            return rendered
+        body = await news_list_flights.do(cache_key, render)
+    
+    return Response(content=body, media_type="application/json")
+
+# Declared before /api/v1/news/{article_id} so "categories" isn't taken for an article id
+@app.get("/api/v1/news/categories")
+async def get_news_categories(current_user: UserResponse = Depends(get_current_user)):
+    """Get available news categories"""
+    # Check membership
+    check_membership(current_user)
+    
+    return {
+        "categories": [
+            {"value": "entertainment", "label": "Entertainment"},
+            {"value": "film", "label": "Film Industry"},
+            {"value": "television", "label": "Television"},
+            {"value": "streaming", "label": "Streaming"},
+            {"value": "casting", "label": "Casting News"},
+            {"value": "awards", "label": "Awards & Recognition"}
+        ]
+    }
+
+# Declared before /api/v1/news/{article_id} so "search" isn't taken for an article id
+@app.get("/api/v1/news/search", response_model=NewsSearchResponse)
+async def search_news_articles_endpoint(
+    q: str,
+    limit: int = 20,
+    published_from: Optional[datetime] = None,
+    published_to: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    current_user: UserResponse = Depends(get_current_user)
+):
+    """Search news articles by relevance, optionally within a publish date range (Members only)"""
+    db = get_db()
+    
+    # Check membership
+    check_membership(current_user)
+    
+    if not q.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search query must not be empty"
+        )
+    
+    limit = max(1, min(limit, NEWS_SEARCH_MAX_LIMIT))
+    try:
+        articles, next_cursor = await run_in_threadpool(
+            search_news_articles, db, q, limit, published_from, published_to, cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return NewsSearchResponse(
+        articles=[
+            NewsArticleResponse(
+                id=str(article["_id"]),
+                title=article["title"],
+                summary=article["summary"],
+                source=article["source"],
+                url=article["url"],
+                image_url=article.get("image_url"),
+                category=article["category"],
+                published_at=article["published_at"],
+                fetched_at=article["fetched_at"],
+                ai_insights=article.get("ai_insights")
+            )
+            for article in articles
+        ],
+        next_cursor=next_cursor
+    )
 
 @app.get("/api/v1/news/{article_id}", response_model=NewsArticleResponse)
 async def get_news_article_endpoint(article_id: str, current_user: UserResponse = Depends(get_current_user)):
@@ -2376,7 +3517,7 @@ async def get_news_article_endpoint(article_id: str, current_user: UserResponse
     )
 
 @app.post("/api/v1/news/fetch")
-async def fetch_news_endpoint(current_user: UserResponse = Depends(get_current_user)):
+async def fetch_news_endpoint(background_tasks: BackgroundTasks, current_user: UserResponse = Depends(get_current_user)):
     """Manually fetch news from external API (Admin only for now)"""
     db = get_db()
     
@@ -2388,30 +3529,38 @@ async def fetch_news_endpoint(current_user: UserResponse = Depends(get_current_u
     
     # Fetch articles from external API
     try:
-        articles = fetch_news_from_api(news_api_key)
-        if not articles:
-            return {
-                "message": "No articles available to fetch",
-                "fetched_count": 0,
-                "stored_count": 0
-            }
+        window = await run_in_threadpool(load_news_fetch_window, db)
+        articles, complete = await fetch_news_from_api(news_api_key, since=window["watermark"], until=window["backfill_until"])
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch news from API: {str(e)}"
         )
+    if not articles:
+        await run_in_threadpool(record_news_fetch, db, window, articles, complete)
+        return {
+            "message": "No articles available to fetch",
+            "fetched_count": 0,
+            "stored_count": 0
+        }
     
-    # Process and store articles
-    stored_count = process_and_store_news_articles(db, articles)
+    # Process and store articles off the event loop. Admins fill in their insights in the
+    # background; otherwise the next scheduled ingestion run's enrichment pass does
+    report = await run_in_threadpool(process_and_store_news_articles, db, articles)
+    await run_in_threadpool(record_news_fetch, db, window, articles, complete)
+    if report["inserted"] and is_admin(current_user):
+        background_tasks.add_task(run_news_enrichment, db)
     
     return {
-        "message": f"Successfully fetched and stored {stored_count} news articles",
+        "message": f"Successfully fetched and stored {report['inserted'] + report['updated']} news articles",
         "fetched_count": len(articles),
-        "stored_count": stored_count
+        "stored_count": report["inserted"] + report["updated"],
+        **report
     }
 
 @app.post("/api/v1/news", response_model=dict)
-async def create_news_article_endpoint(article_data: NewsArticleCreate, current_user: UserResponse = Depends(get_current_user)):
+async def create_news_article_endpoint(article_data: NewsArticleCreate, background_tasks: BackgroundTasks,
+                                       current_user: UserResponse = Depends(get_current_user)):
     """Create a news article manually (Admin only for now)"""
     db = get_db()
     
@@ -2424,12 +3573,13 @@ async def create_news_article_endpoint(article_data: NewsArticleCreate, current_
         "fetched_at": datetime.utcnow()
     })
     
-    # Generate AI insights if not provided
+    # Classify the article unless a category was chosen
+    if article_dict["category"] is None:
+        article_dict["category"] = get_news_classifier().classify(article_dict["title"], article_dict["summary"])
+    
+    # Insights not provided are generated by the enrichment stage
     if not article_dict.get("ai_insights"):
-        article_dict["ai_insights"] = generate_ai_insights(
-            article_dict["title"],
-            article_dict["summary"]
-        )
+        article_dict["ai_insights"] = None
     
     # Create article
     article_id = create_news_article(db, article_dict)
@@ -2439,25 +3589,38 @@ async def create_news_article_endpoint(article_data: NewsArticleCreate, current_
             detail="Failed to create news article"
         )
     
+    # Only admins start a paid enrichment pass; members' articles wait for the scheduled one
+    if article_dict["ai_insights"] is None and is_admin(current_user):
+        background_tasks.add_task(run_news_enrichment, db)
+    
     return {"id": article_id}
 
-@app.get("/api/v1/news/categories")
-async def get_news_categories(current_user: UserResponse = Depends(get_current_user)):
-    """Get available news categories"""
-    # Check membership
-    check_membership(current_user)
+@app.post("/api/v1/admin/news/classifier/reload")
+async def reload_news_classifier_endpoint(current_user: UserResponse = Depends(get_current_user)):
+    """Reload the news category model from disk (Admins only)"""
+    check_admin(current_user)
+    
+    try:
+        classifier = reload_news_classifier()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to load news classifier: {str(e)}"
+        )
     
     return {
-        "categories": [
-            {"value": "entertainment", "label": "Entertainment"},
-            {"value": "film", "label": "Film Industry"},
-            {"value": "television", "label": "Television"},
-            {"value": "streaming", "label": "Streaming"},
-            {"value": "casting", "label": "Casting News"},
-            {"value": "awards", "label": "Awards & Recognition"}
-        ]
+        "message": "News classifier reloaded",
+        "categories": sorted(classifier.categories)
     }
 
+@app.post("/api/v1/admin/news/enrich")
+async def enrich_news_endpoint(max_articles: Optional[int] = None, current_user: UserResponse = Depends(get_current_user)):
+    """Fill in missing AI insights for stored news articles (Admins only)"""
+    # Each pass makes paid LLM calls
+    check_admin(current_user)
+    
+    return await enrich_news_articles(get_db(), max_articles)
+
 # Profile AI Insights endpoints
 @app.get("/api/v1/profiles/{profile_id}/ai-insights")
 async def get_profile_ai_insights(profile_id: str, current_user: UserResponse = Depends(get_current_user)):
@@ -2479,10 +3642,93 @@ async def get_profile_ai_insights(profile_id: str, current_user: UserResponse =
             detail="Access denied to private profile"
         )
     
-    # Generate AI insights based on profile data
-    insights = generate_profile_ai_insights(profile)
+    # Return cached insights, or the status of the job generating them
+    return resolve_profile_ai_insights(db, profile)
+
+@app.post("/api/v1/profiles/{profile_id}/ai-insights")
+async def enqueue_profile_ai_insights(profile_id: str, current_user: UserResponse = Depends(get_current_user)):
+    """Queue AI insight generation for a profile and return the job (or cached insights)"""
+    db = get_db()
     
-    return insights
+    # Get the profile
+    profile = get_profile_by_id(db, profile_id)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    
+    # Check if profile is public or belongs to current user
+    if not profile.get("is_public", True) and str(profile["user_id"]) != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to private profile"
+        )
+    
+    cache_key = profile_insights_cache_key(profile)
+    cached_insights = get_cached_profile_insights(db, cache_key)
+    if cached_insights:
+        return {"status": "completed", "result": cached_insights}
+    
+    # A job queued now would only fail, so answer with the rule-based insights
+    if not ai_generation_available():
+        ai_metrics.increment("insights_served_rules")
+        return {"status": "completed", "result": get_insight_rules().generate(profile), "source": "rules"}
+    
+    job = enqueue_insight_job(db, profile["_id"], cache_key)
+    return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=insight_job_status(job))
+
+@app.get("/api/v1/ai-insight-jobs/{job_id}")
+async def get_ai_insight_job(job_id: str, current_user: UserResponse = Depends(get_current_user)):
+    """Get the status (and result, once completed) of an AI insight job"""
+    db = get_db()
+    
+    job = get_insight_job(db, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Insight job not found"
+        )
+    
+    # Jobs are only visible to users who can see the profile
+    profile = get_profile_by_id(db, str(job["profile_id"]))
+    if profile and not profile.get("is_public", True) and str(profile["user_id"]) != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to private profile"
+        )
+    
+    job_status = insight_job_status(job)
+    # Give the client something to show once the AI has given up
+    if job["status"] == "failed" and profile:
+        job_status["fallback"] = get_insight_rules().generate(profile)
+    return job_status
+
+@app.get("/api/v1/profiles/{profile_id}/ai-insights/stream")
+async def stream_profile_ai_insights_endpoint(profile_id: str, current_user: UserResponse = Depends(get_current_user)):
+    """Stream AI-generated insights for a profile as Server-Sent Events, one event per section"""
+    db = get_db()
+    
+    # Get the profile without blocking the event loop the stream runs on
+    profile = await asyncio.to_thread(get_profile_by_id, db, profile_id)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    
+    # Check if profile is public or belongs to current user
+    if not profile.get("is_public", True) and str(profile["user_id"]) != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to private profile"
+        )
+    
+    return StreamingResponse(
+        stream_profile_ai_insights(db, profile),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.get("/api/v1/profiles/user/{user_id}/ai-insights")
 async def get_user_profile_ai_insights(user_id: str, current_user: UserResponse = Depends(get_current_user)):
@@ -2504,10 +3750,8 @@ async def get_user_profile_ai_insights(user_id: str, current_user: UserResponse
             detail="Access denied to private profile"
         )
     
-    # Generate AI insights based on profile data
-    insights = generate_profile_ai_insights(profile)
-    
-    return insights
+    # Return cached insights, or the status of the job generating them
+    return resolve_profile_ai_insights(db, profile)
 
 # Add this at the end to make the file runnable directly
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+import os
+import re
+import json
+import math
+import threading
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from keyword_matcher import DEFAULT_CATEGORY
+
+DEFAULT_MODEL_PATH = Path(__file__).resolve().parent / "news_classifier.json"
+
+# Terms kept per category centroid; the long tail barely moves scores
+MAX_CENTROID_TERMS = 400
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+def tokenize(title: Optional[str], summary: Optional[str]) -> List[str]:
+    """Lowercased words and word pairs; title terms are counted twice"""
+    terms = []
+    for text, repeat in ((title, 2), (summary, 1)):
+        words = _WORD_PATTERN.findall((text or "").lower())
+        terms.extend((words + [f"{first} {second}" for first, second in zip(words, words[1:])]) * repeat)
+    return terms
+
+def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    return {term: weight / norm for term, weight in vector.items()} if norm else {}
+
+def _tf_idf(terms: Iterable[str], idf: Dict[str, float]) -> Dict[str, float]:
+    """L2-normalized sublinear TF-IDF vector, ignoring terms outside the vocabulary"""
+    counts = Counter(term for term in terms if term in idf)
+    return _normalize({term: (1 + math.log(count)) * idf[term] for term, count in counts.items()})
+
+def train_model(examples: List[Tuple[str, str, str]], min_score: float = 0.05,
+                default_category: str = DEFAULT_CATEGORY) -> dict:
+    """
+    Train a TF-IDF nearest-centroid model.
+
+    Args:
+        examples: (title, summary, category) tuples
+        min_score: Cosine similarity below which an article gets default_category
+
+    Returns:
+        The model as a JSON-serializable dictionary
+    """
+    documents = [(tokenize(title, summary), category) for title, summary, category in examples]
+    document_frequency = Counter(term for terms, _ in documents for term in set(terms))
+    # Terms seen in a single document are noise rather than signal for a category
+    idf = {
+        term: math.log((1 + len(documents)) / (1 + frequency)) + 1
+        for term, frequency in document_frequency.items() if frequency > 1
+    }
+
+    sums: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for terms, category in documents:
+        for term, weight in _tf_idf(terms, idf).items():
+            sums[category][term] += weight
+
+    centroids = {}
+    for category, vector in sums.items():
+        top_terms = sorted(vector.items(), key=lambda item: item[1], reverse=True)[:MAX_CENTROID_TERMS]
+        centroids[category] = {term: round(weight, 6) for term, weight in _normalize(dict(top_terms)).items()}
+
+    return {
+        "default_category": default_category,
+        "min_score": min_score,
+        "example_count": len(documents),
+        "idf": {term: round(weight, 6) for term, weight in sorted(idf.items())},
+        "centroids": centroids
+    }
+
+class NewsClassifier:
+    """
+    Assigns news categories with a TF-IDF nearest-centroid model trained offline.
+
+    Centroid weights are inverted into term -> [(category, weight)] at load
+    time, so scoring an article only touches the terms it contains.
+    """
+
+    def __init__(self, model: dict):
+        self.default_category = model.get("default_category", DEFAULT_CATEGORY)
+        self.min_score = model.get("min_score", 0.0)
+        self.idf = model["idf"]
+        self.categories = list(model["centroids"])
+        self.postings: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+        for category, centroid in model["centroids"].items():
+            for term, weight in centroid.items():
+                self.postings[term].append((category, weight))
+
+    @classmethod
+    def from_file(cls, path: Optional[str] = None) -> "NewsClassifier":
+        model_path = Path(path or os.getenv("NEWS_CLASSIFIER_MODEL_PATH") or DEFAULT_MODEL_PATH)
+        with open(model_path, "r", encoding="utf-8") as model_file:
+            return cls(json.load(model_file))
+
+    def scores(self, title: Optional[str], summary: Optional[str]) -> Dict[str, float]:
+        """Cosine similarity of the article to each category centroid it shares terms with"""
+        scores: Dict[str, float] = defaultdict(float)
+        for term, weight in _tf_idf(tokenize(title, summary), self.idf).items():
+            for category, centroid_weight in self.postings.get(term, ()):
+                scores[category] += weight * centroid_weight
+        return scores
+
+    def classify(self, title: Optional[str], summary: Optional[str]) -> str:
+        scores = self.scores(title, summary)
+        if not scores:
+            return self.default_category
+        category, score = max(scores.items(), key=lambda item: item[1])
+        return category if score >= self.min_score else self.default_category
+
+    def classify_batch(self, articles: List[dict]) -> List[str]:
+        """Category for each article dictionary with title and summary"""
+        return [self.classify(article.get("title"), article.get("summary")) for article in articles]
+
+# Classifier instance, loaded once and swapped atomically on reload
+_classifier = None
+_classifier_lock = threading.Lock()
+
+def get_news_classifier() -> NewsClassifier:
+    """Get the news classifier, loading the model on first use"""
+    global _classifier
+    if _classifier is None:
+        with _classifier_lock:
+            if _classifier is None:
+                _classifier = NewsClassifier.from_file()
+    return _classifier
+
+def reload_news_classifier(path: Optional[str] = None) -> NewsClassifier:
+    """Load the model from disk again, keeping the old one if the new model is invalid"""
+    global _classifier
+    classifier = NewsClassifier.from_file(path)
+    with _classifier_lock:
+        _classifier = classifier
+    return classifier
@@ -0,0 +1,162 @@
+import os
+import math
+import random
+import asyncio
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+import httpx
+
+NEWS_API_URL = "https://newsapi.org/v2/everything"
+NEWS_API_DOMAINS = "variety.com,hollywoodreporter.com,deadline.com,imdb.com,backstage.com"
+DEFAULT_NEWS_QUERY = "acting OR actor OR actress OR film industry"
+
+# Several queries can be fetched per run, separated by ";"
+NEWS_API_QUERIES = [
+    query.strip() for query in os.getenv("NEWS_API_QUERIES", DEFAULT_NEWS_QUERY).split(";") if query.strip()
+]
+NEWS_API_PAGE_SIZE = int(os.getenv("NEWS_API_PAGE_SIZE", "100"))
+NEWS_API_MAX_PAGES = int(os.getenv("NEWS_API_MAX_PAGES", "3"))
+NEWS_API_CONCURRENCY = int(os.getenv("NEWS_API_CONCURRENCY", "4"))
+NEWS_API_TIMEOUT_SECONDS = float(os.getenv("NEWS_API_TIMEOUT_SECONDS", "10"))
+NEWS_API_MAX_RETRIES = int(os.getenv("NEWS_API_MAX_RETRIES", "3"))
+NEWS_API_RETRY_BASE_DELAY_SECONDS = float(os.getenv("NEWS_API_RETRY_BASE_DELAY_SECONDS", "1.0"))
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# NewsAPI's answer for pages past the results cap of the plan
+PAGE_LIMIT_STATUS_CODE = 426
+
+class NewsAPIError(Exception):
+    """Raised when NewsAPI rejects a request or stays unavailable after retries"""
+
+class NewsAPIPageLimitError(NewsAPIError):
+    """Raised when a page lies past the number of results the plan may read"""
+
+class NewsAPIClient:
+    """
+    Async NewsAPI client with a pooled connection, explicit timeouts and retries.
+
+    Use as an async context manager; the pool lives for one ingestion run,
+    which is shared by every page and query fetched in it.
+    """
+
+    def __init__(self, api_key: str, concurrency: int = NEWS_API_CONCURRENCY,
+                 timeout_seconds: float = NEWS_API_TIMEOUT_SECONDS, max_retries: int = NEWS_API_MAX_RETRIES,
+                 retry_base_delay: float = NEWS_API_RETRY_BASE_DELAY_SECONDS,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._client = httpx.AsyncClient(
+            headers={"X-Api-Key": api_key},
+            timeout=httpx.Timeout(timeout_seconds, connect=min(5.0, timeout_seconds)),
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            transport=transport
+        )
+
+    async def __aenter__(self) -> "NewsAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._client.aclose()
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return random.uniform(0, self.retry_base_delay * (2 ** attempt))
+
+    async def _get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET one page, retrying rate limits, server errors and transport failures with backoff"""
+        for attempt in range(self.max_retries + 1):
+            response = None
+            try:
+                async with self._semaphore:
+                    response = await self._client.get(NEWS_API_URL, params=params)
+                if response.status_code == PAGE_LIMIT_STATUS_CODE:
+                    raise NewsAPIPageLimitError(f"NewsAPI page {params.get('page')} is past the plan's results cap")
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    if response.status_code != 200:
+                        raise NewsAPIError(f"NewsAPI returned {response.status_code}: {response.text[:200]}")
+                    return response.json()
+                error = NewsAPIError(f"NewsAPI returned {response.status_code}")
+            except httpx.TransportError as e:
+                error = NewsAPIError(f"NewsAPI request failed: {e}")
+            if attempt >= self.max_retries:
+                raise error
+            delay = self._retry_delay(attempt, response)
+            print(f"{error}, retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def fetch_query(self, query: str, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                          page_size: int = NEWS_API_PAGE_SIZE, max_pages: int = NEWS_API_MAX_PAGES) -> Tuple[List[dict], bool]:
+        """
+        Fetch up to max_pages pages for a query; pages after the first are requested concurrently.
+
+        Returns:
+            The articles, and whether they are every match; False when max_pages
+            or the plan's results cap cut the newest-first listing short
+
+        Raises:
+            NewsAPIError: If any page failed, so a partial fetch is never taken as complete
+        """
+        params = {
+            "q": query,
+            "domains": NEWS_API_DOMAINS,
+            "language": "en",
+            "sortBy": "publishedAt",
+            "pageSize": page_size,
+        }
+        if since is not None:
+            params["from"] = since.replace(tzinfo=None, microsecond=0).isoformat()
+        if until is not None:
+            params["to"] = until.replace(tzinfo=None, microsecond=0).isoformat()
+
+        first_page = await self._get({**params, "page": 1})
+        articles = list(first_page.get("articles", []))
+        total_pages = math.ceil(first_page.get("totalResults", 0) / page_size)
+        page_count = min(max_pages, total_pages)
+        complete = page_count == total_pages or total_pages == 0
+        if page_count > 1:
+            pages = await asyncio.gather(
+                *(self._get({**params, "page": page}) for page in range(2, page_count + 1)),
+                return_exceptions=True
+            )
+            for page in pages:
+                if isinstance(page, NewsAPIPageLimitError):
+                    complete = False
+                    continue
+                if isinstance(page, Exception):
+                    raise page
+                articles.extend(page.get("articles", []))
+        return articles, complete
+
+    async def fetch_articles(self, queries: Optional[List[str]] = None, since: Optional[datetime] = None,
+                             until: Optional[datetime] = None) -> Tuple[List[dict], bool]:
+        """
+        Fetch every query concurrently and merge the results, dropping repeated URLs.
+
+        Returns:
+            The articles, and whether every query fetched all of its matches
+
+        Raises:
+            NewsAPIError: If any query failed
+        """
+        queries = queries or NEWS_API_QUERIES
+        results = await asyncio.gather(*(self.fetch_query(query, since, until) for query in queries), return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+        articles = []
+        seen_urls = set()
+        complete = True
+        for result, query_complete in results:
+            complete = complete and query_complete
+            for article in result:
+                url = article.get("url")
+                if url and url not in seen_urls:
+                    seen_urls.add(url)
+                    articles.append(article)
+        return articles, complete
@@ -0,0 +1,108 @@
+import os
+import re
+import hashlib
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 8
+SIMHASH_BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+
+# Fingerprints within this many differing bits are near-duplicates. Syndicated
+# copies of a story measure 4-9 bits apart (source suffix, one reworded title
+# word, trimmed summary) and unrelated entertainment stories 15 or more. Pairs
+# up to SIMHASH_BANDS - 1 bits apart always share a band; at 10 bits about 95%
+# still do.
+NEWS_DUPLICATE_MAX_DISTANCE = int(os.getenv("NEWS_DUPLICATE_MAX_DISTANCE", "10"))
+# How far back, by publish time, a new article is compared against stored ones
+NEWS_DUPLICATE_WINDOW_DAYS = int(os.getenv("NEWS_DUPLICATE_WINDOW_DAYS", "3"))
+
+_WORD_PATTERN = re.compile(r"\w+")
+_BAND_MASK = (1 << SIMHASH_BAND_BITS) - 1
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+def _to_signed(value: int) -> int:
+    """MongoDB stores 64-bit integers signed"""
+    return value - (1 << SIMHASH_BITS) if value >= 1 << (SIMHASH_BITS - 1) else value
+
+def simhash(text: str) -> int:
+    """
+    64-bit SimHash of text, as a signed integer so it fits a BSON long.
+
+    Features are lowercased words weighted by count. Short texts are
+    sensitive to every word: a source suffix, trimmed summary or reworded
+    title moves a copy of a story up to about 10 bits.
+    """
+    features = Counter(_WORD_PATTERN.findall((text or "").lower()))
+
+    weights = [0] * SIMHASH_BITS
+    for feature, count in features.items():
+        feature_hash = _feature_hash(feature)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if feature_hash >> bit & 1 else -count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return _to_signed(fingerprint)
+
+def simhash_bands(fingerprint: int) -> List[int]:
+    """
+    Split a fingerprint into SIMHASH_BANDS keys for the banded index.
+
+    Each key carries its band number in the high bits, so equal values in
+    different bands don't collide.
+    """
+    unsigned = fingerprint & ((1 << SIMHASH_BITS) - 1)
+    return [
+        band << SIMHASH_BAND_BITS | (unsigned >> (band * SIMHASH_BAND_BITS) & _BAND_MASK)
+        for band in range(SIMHASH_BANDS)
+    ]
+
+def hamming_distance(first: int, second: int) -> int:
+    return bin((first ^ second) & ((1 << SIMHASH_BITS) - 1)).count("1")
+
+_SOURCE_SEPARATORS = (" - ", " | ", " — ")
+
+def strip_source_suffix(title: str, source: Optional[str]) -> str:
+    """Drop a trailing " - Source" style attribution naming the article's own source"""
+    if not title or not source:
+        return title
+    for separator in _SOURCE_SEPARATORS:
+        suffix = f"{separator}{source}"
+        if title.lower().endswith(suffix.lower()):
+            return title[:-len(suffix)]
+    return title
+
+def article_fingerprint(title: Optional[str], summary: Optional[str], source: Optional[str] = None) -> int:
+    """SimHash over an article's title, without its source attribution, and summary"""
+    return simhash(f"{strip_source_suffix(title or '', source)} {summary or ''}")
+
+class DuplicateIndex:
+    """
+    In-memory banded index of fingerprints.
+
+    A lookup only compares fingerprints sharing a band with the query, instead
+    of every fingerprint added so far.
+    """
+
+    def __init__(self, max_distance: int = NEWS_DUPLICATE_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._bands: Dict[int, List[Tuple[str, int]]] = {}
+
+    def add(self, key: str, fingerprint: int):
+        for band in simhash_bands(fingerprint):
+            self._bands.setdefault(band, []).append((key, fingerprint))
+
+    def find(self, fingerprint: int) -> Optional[str]:
+        """Key of the closest indexed fingerprint within max_distance, if any"""
+        best_key, best_distance = None, self.max_distance + 1
+        for band in simhash_bands(fingerprint):
+            for key, candidate in self._bands.get(band, ()):
+                distance = hamming_distance(fingerprint, candidate)
+                if distance < best_distance:
+                    best_key, best_distance = key, distance
+        return best_key
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Batch precompute of AI insights for every public profile, meant to run nightly.
+
+Profiles are streamed in _id order; those whose cached AI insights are missing
+or close to expiry are regenerated with bounded concurrency under a
+requests-per-minute limit. A failed generation leaves the cache entry as it
+was. Progress is checkpointed after every batch, so an interrupted run resumes
+where it stopped.
+
+Run from the backend directory:
+    python precompute_insights.py
+    python precompute_insights.py --concurrency 8 --rpm 300
+    python precompute_insights.py --restart
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import argparse
+from datetime import datetime, timedelta
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import (
+    get_db,
+    get_ai_service,
+    store_profile_insights,
+    profile_insights_cache_key,
+)
+from ai_service import INSIGHT_PROFILE_FIELDS
+
+PRECOMPUTE_BATCH_SIZE = int(os.environ.get("PRECOMPUTE_BATCH_SIZE", "100"))
+PRECOMPUTE_CONCURRENCY = int(os.environ.get("PRECOMPUTE_CONCURRENCY", "4"))
+PRECOMPUTE_REQUESTS_PER_MINUTE = int(os.environ.get("PRECOMPUTE_REQUESTS_PER_MINUTE", "60"))
+# Insights expiring within this window are refreshed ahead of time
+PRECOMPUTE_REFRESH_SECONDS = int(os.environ.get("PRECOMPUTE_REFRESH_SECONDS", str(24 * 3600)))
+
+CHECKPOINT_ID = "precompute_insights"
+
+class RateLimiter:
+    """
+    Token bucket allowing requests_per_minute acquisitions per minute.
+
+    The bucket holds at most one second's worth of tokens, so a run can't
+    front-load a burst of a minute's requests.
+    """
+
+    def __init__(self, requests_per_minute: int, clock=time.monotonic, sleep=asyncio.sleep):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated_at = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                # Tolerate float rounding; a sub-nanosecond nap can't move the clock
+                if self.tokens >= 1 - 1e-9:
+                    self.tokens = max(0.0, self.tokens - 1)
+                    return
+                await self.sleep((1 - self.tokens) / self.rate)
+
+def load_checkpoint(db) -> dict:
+    """Return the saved checkpoint, or an empty one"""
+    return db.batch_checkpoints.find_one({"_id": CHECKPOINT_ID}) or {}
+
+def save_checkpoint(db, last_id, stats: dict, completed: bool = False):
+    db.batch_checkpoints.update_one(
+        {"_id": CHECKPOINT_ID},
+        {"$set": {
+            "last_id": None if completed else last_id,
+            "stats": stats,
+            "completed": completed,
+            "updated_at": datetime.utcnow()
+        }},
+        upsert=True
+    )
+
+def iter_profile_batches(db, after_id, batch_size: int):
+    """Yield lists of public profiles with _id greater than after_id, in _id order"""
+    query = {"is_public": {"$ne": False}}
+    if after_id is not None:
+        query["_id"] = {"$gt": after_id}
+    projection = {field: 1 for field in INSIGHT_PROFILE_FIELDS}
+    cursor = db.profiles.find(query, projection, batch_size=batch_size).sort("_id", 1)
+    batch = []
+    try:
+        for profile in cursor:
+            batch.append(profile)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        cursor.close()
+
+def fresh_cache_keys(db, cache_keys: list) -> set:
+    """Cache keys holding AI insights that won't expire within the refresh window"""
+    refresh_before = datetime.utcnow() + timedelta(seconds=PRECOMPUTE_REFRESH_SECONDS)
+    cursor = db.profile_insights_cache.find(
+        {"_id": {"$in": cache_keys}, "source": {"$ne": "rules"}, "expires_at": {"$gt": refresh_before}},
+        {"_id": 1}
+    )
+    return {cached["_id"] for cached in cursor}
+
+async def precompute_profile(db, service, limiter: RateLimiter, semaphore: asyncio.Semaphore,
+                             profile: dict, cache_key: str) -> str:
+    """
+    Generate and cache AI insights for one profile; returns "ai" or "failed".
+
+    On failure the existing cache entry is left alone: insights close to
+    expiry are still better than none, and the next run retries them.
+    """
+    if service is None:
+        return "failed"
+    async with semaphore:
+        await limiter.acquire()
+        try:
+            insights = await service.generate_profile_insights_async(profile)
+        except Exception as e:
+            print(f"AI insights failed for profile {profile['_id']}: {e}", file=sys.stderr)
+            return "failed"
+        store_profile_insights(db, cache_key, profile["_id"], insights)
+        return "ai"
+
+async def precompute_insights(db, batch_size: int = PRECOMPUTE_BATCH_SIZE,
+                              concurrency: int = PRECOMPUTE_CONCURRENCY,
+                              requests_per_minute: int = PRECOMPUTE_REQUESTS_PER_MINUTE,
+                              restart: bool = False) -> dict:
+    """
+    Precompute insights for all public profiles with missing or stale cache entries.
+
+    Returns:
+        Run statistics: profiles scanned, skipped as fresh, generated by AI or
+        failed, elapsed seconds and throughput
+    """
+    checkpoint = {} if restart else load_checkpoint(db)
+    resume = bool(checkpoint.get("last_id")) and not checkpoint.get("completed")
+    last_id = checkpoint["last_id"] if resume else None
+    stats = dict(checkpoint.get("stats") or {}) if resume else {}
+    for counter in ("scanned", "fresh", "ai", "failed"):
+        stats.setdefault(counter, 0)
+    if resume:
+        print(f"Resuming after profile {last_id}", file=sys.stderr)
+
+    service = get_ai_service()
+    limiter = RateLimiter(requests_per_minute)
+    semaphore = asyncio.Semaphore(concurrency)
+    started = time.monotonic()
+    run_generated = 0
+
+    for batch in iter_profile_batches(db, last_id, batch_size):
+        cache_keys = [profile_insights_cache_key(profile) for profile in batch]
+        fresh = fresh_cache_keys(db, cache_keys)
+        pending = [(profile, key) for profile, key in zip(batch, cache_keys) if key not in fresh]
+
+        sources = await asyncio.gather(*(
+            precompute_profile(db, service, limiter, semaphore, profile, key) for profile, key in pending
+        ))
+
+        stats["scanned"] += len(batch)
+        stats["fresh"] += len(batch) - len(pending)
+        for source in sources:
+            stats[source] += 1
+        run_generated += sources.count("ai")
+        last_id = batch[-1]["_id"]
+        save_checkpoint(db, last_id, stats)
+
+        elapsed = time.monotonic() - started
+        print(f"{stats['scanned']} scanned, {stats['ai']} ai, {stats['failed']} failed, "
+              f"{stats['fresh']} fresh - {run_generated / elapsed * 60 if elapsed else 0:.1f} generated/min",
+              file=sys.stderr)
+
+    save_checkpoint(db, last_id, stats, completed=True)
+    elapsed = time.monotonic() - started
+    stats["elapsed_seconds"] = round(elapsed, 2)
+    stats["generated_per_minute"] = round(run_generated / elapsed * 60, 1) if elapsed else 0.0
+    return stats
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Precompute AI insights for public profiles")
+    parser.add_argument("--batch-size", type=int, default=PRECOMPUTE_BATCH_SIZE)
+    parser.add_argument("--concurrency", type=int, default=PRECOMPUTE_CONCURRENCY)
+    parser.add_argument("--rpm", type=int, default=PRECOMPUTE_REQUESTS_PER_MINUTE,
+                        help="Maximum Gemini generations started per minute")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start from the beginning")
+    args = parser.parse_args()
+
+    stats = asyncio.run(precompute_insights(
+        get_db(),
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        requests_per_minute=args.rpm,
+        restart=args.restart
+    ))
+    print(json.dumps(stats, indent=2), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+import zlib
+import threading
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+# Categorical vocabularies match the options offered by the profile builder
+AGE_RANGES = ["16-20", "18-25", "25-30", "30-35", "35-40", "40-50", "50-60", "60+"]
+BUILDS = ["petite", "slim", "athletic", "average", "curvy", "plus size", "muscular"]
+EYE_COLORS = ["brown", "blue", "green", "hazel", "gray", "amber"]
+HAIR_COLORS = ["black", "brown", "blonde", "red", "auburn", "gray", "white"]
+
+# Genres and skills are free text, so they are hashed into fixed-size buckets
+GENRE_BUCKETS = 32
+SKILL_BUCKETS = 64
+
+EXPERIENCE_FLAGS = ["stage_experience", "film_experience", "willing_to_relocate"]
+
+# Relative weight of each attribute block in the cosine similarity
+BLOCK_WEIGHTS = {
+    "age_range": 2.0,
+    "build": 1.0,
+    "eye_color": 0.75,
+    "hair_color": 0.75,
+    "preferred_genres": 1.5,
+    "special_skills": 1.0,
+    "experience": 1.0,
+}
+
+SIMILARITY_FIELDS = [
+    "age_range", "build", "eye_color", "hair_color",
+    "preferred_genres", "special_skills", *EXPERIENCE_FLAGS
+]
+
+def _block_layout() -> Dict[str, slice]:
+    sizes = [
+        ("age_range", len(AGE_RANGES)),
+        ("build", len(BUILDS)),
+        ("eye_color", len(EYE_COLORS)),
+        ("hair_color", len(HAIR_COLORS)),
+        ("preferred_genres", GENRE_BUCKETS),
+        ("special_skills", SKILL_BUCKETS),
+        ("experience", len(EXPERIENCE_FLAGS)),
+    ]
+    layout = {}
+    offset = 0
+    for name, size in sizes:
+        layout[name] = slice(offset, offset + size)
+        offset += size
+    return layout
+
+BLOCKS = _block_layout()
+VECTOR_WIDTH = max(block.stop for block in BLOCKS.values())
+
+_AGE_INDEX = {value: i for i, value in enumerate(AGE_RANGES)}
+_BUILD_INDEX = {value: i for i, value in enumerate(BUILDS)}
+_EYE_INDEX = {value: i for i, value in enumerate(EYE_COLORS)}
+_HAIR_INDEX = {value: i for i, value in enumerate(HAIR_COLORS)}
+
+def _normalize(value) -> str:
+    return value.strip().lower() if isinstance(value, str) else ""
+
+def _bucket(term: str, buckets: int) -> int:
+    # crc32 is stable across processes, unlike hash()
+    return zlib.crc32(term.encode("utf-8")) % buckets
+
+def encode_profile(profile: Dict[str, Any]) -> np.ndarray:
+    """
+    Encode profile attributes into a fixed-width, L2-normalized vector.
+
+    Args:
+        profile: Profile document (only SIMILARITY_FIELDS are read)
+
+    Returns:
+        float32 vector of length VECTOR_WIDTH; all zeros when nothing is known
+    """
+    vector = np.zeros(VECTOR_WIDTH, dtype=np.float32)
+
+    # Neighbouring age ranges get partial credit so 25-30 is close to 30-35
+    age_index = _AGE_INDEX.get(_normalize(profile.get("age_range")))
+    if age_index is not None:
+        age_block = vector[BLOCKS["age_range"]]
+        age_block[age_index] = 1.0
+        if age_index > 0:
+            age_block[age_index - 1] = 0.5
+        if age_index < len(AGE_RANGES) - 1:
+            age_block[age_index + 1] = 0.5
+
+    for field, index in (("build", _BUILD_INDEX), ("eye_color", _EYE_INDEX), ("hair_color", _HAIR_INDEX)):
+        position = index.get(_normalize(profile.get(field)))
+        if position is not None:
+            vector[BLOCKS[field]][position] = 1.0
+
+    for field, buckets in (("preferred_genres", GENRE_BUCKETS), ("special_skills", SKILL_BUCKETS)):
+        terms = {_normalize(term) for term in profile.get(field) or []}
+        terms.discard("")
+        if terms:
+            block = vector[BLOCKS[field]]
+            for term in terms:
+                block[_bucket(term, buckets)] += 1.0
+            block /= np.sqrt(len(terms))
+
+    experience_block = vector[BLOCKS["experience"]]
+    for i, flag in enumerate(EXPERIENCE_FLAGS):
+        if profile.get(flag):
+            experience_block[i] = 1.0
+
+    for name, weight in BLOCK_WEIGHTS.items():
+        vector[BLOCKS[name]] *= weight
+
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+class ProfileSimilarityIndex:
+    """Memory-resident matrix of encoded profiles answering top-k cosine similarity queries"""
+
+    def __init__(self, initial_capacity: int = 1024):
+        self._matrix = np.zeros((max(1, initial_capacity), VECTOR_WIDTH), dtype=np.float32)
+        self._ids: list[str] = []
+        self._rows: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, profile_id: str) -> bool:
+        return profile_id in self._rows
+
+    def _ensure_capacity(self, size: int):
+        capacity = self._matrix.shape[0]
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        grown = np.zeros((capacity, VECTOR_WIDTH), dtype=np.float32)
+        grown[:len(self._ids)] = self._matrix[:len(self._ids)]
+        self._matrix = grown
+
+    def upsert(self, profile_id: str, profile: Dict[str, Any]):
+        """Insert or refresh a single profile's vector"""
+        vector = encode_profile(profile)
+        with self._lock:
+            row = self._rows.get(profile_id)
+            if row is None:
+                row = len(self._ids)
+                self._ensure_capacity(row + 1)
+                self._ids.append(profile_id)
+                self._rows[profile_id] = row
+            self._matrix[row] = vector
+
+    def upsert_many(self, profiles):
+        """Insert or refresh (profile_id, profile) pairs"""
+        for profile_id, profile in profiles:
+            self.upsert(profile_id, profile)
+
+    def remove(self, profile_id: str):
+        """Drop a profile by moving the last row into its slot"""
+        with self._lock:
+            row = self._rows.pop(profile_id, None)
+            if row is None:
+                return
+            last_row = len(self._ids) - 1
+            last_id = self._ids.pop()
+            if row != last_row:
+                self._matrix[row] = self._matrix[last_row]
+                self._ids[row] = last_id
+                self._rows[last_id] = row
+            self._matrix[last_row] = 0.0
+
+    def query(self, profile: Dict[str, Any], k: int = 5, exclude_id: Optional[str] = None) -> list[tuple[str, float]]:
+        """
+        Find the k indexed profiles most similar to the given profile.
+
+        Args:
+            profile: Profile document to compare against
+            k: Number of results to return
+            exclude_id: Profile id to leave out (usually the query profile itself)
+
+        Returns:
+            List of (profile_id, cosine similarity) pairs, most similar first
+        """
+        vector = encode_profile(profile)
+        with self._lock:
+            size = len(self._ids)
+            if size == 0 or k <= 0:
+                return []
+
+            # Single matrix-vector product scores every profile at once
+            scores = self._matrix[:size] @ vector
+            exclude_row = self._rows.get(exclude_id) if exclude_id is not None else None
+            if exclude_row is not None:
+                scores[exclude_row] = -np.inf
+
+            k = min(k, size if exclude_row is None else size - 1)
+            if k <= 0:
+                return []
+            top_rows = np.argpartition(-scores, k - 1)[:k]
+            top_rows = top_rows[np.argsort(-scores[top_rows])]
+            return [(self._ids[row], float(scores[row])) for row in top_rows]
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Command-line tool to move profiles between environments as NDJSON.
+
+Run from the backend directory:
+    python profile_transfer.py export --output profiles.ndjson
+    python profile_transfer.py import profiles.ndjson
+"""
+
+import sys
+import os
+import json
+import argparse
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import (
+    get_db,
+    iter_profiles_ndjson,
+    import_profiles_ndjson,
+    PROFILE_EXPORT_BATCH_SIZE,
+    PROFILE_IMPORT_BATCH_SIZE,
+)
+
+def export_profiles(output_path: str, batch_size: int) -> int:
+    """Write every profile to output_path (or stdout for '-') and return the count"""
+    db = get_db()
+    count = 0
+    output = sys.stdout if output_path == "-" else open(output_path, "w", encoding="utf-8")
+    try:
+        for line in iter_profiles_ndjson(db, batch_size=batch_size):
+            output.write(line)
+            count += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return count
+
+def import_profiles(input_path: str, batch_size: int) -> dict:
+    """Import profiles from input_path (or stdin for '-') and return the import report"""
+    db = get_db()
+    if input_path == "-":
+        return import_profiles_ndjson(db, sys.stdin, batch_size=batch_size)
+    with open(input_path, "r", encoding="utf-8") as input_file:
+        return import_profiles_ndjson(db, input_file, batch_size=batch_size)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk export/import of profiles as NDJSON")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Stream all profiles to an NDJSON file")
+    export_parser.add_argument("--output", "-o", default="-", help="Output file (default: stdout)")
+    export_parser.add_argument("--batch-size", type=int, default=PROFILE_EXPORT_BATCH_SIZE)
+
+    import_parser = subparsers.add_parser("import", help="Insert profiles from an NDJSON file")
+    import_parser.add_argument("input", help="Input file ('-' for stdin)")
+    import_parser.add_argument("--batch-size", type=int, default=PROFILE_IMPORT_BATCH_SIZE)
+
+    args = parser.parse_args()
+
+    if args.command == "export":
+        count = export_profiles(args.output, args.batch_size)
+        print(f"Exported {count} profiles", file=sys.stderr)
+        return 0
+
+    report = import_profiles(args.input, args.batch_size)
+    print(json.dumps(report, indent=2), file=sys.stderr)
+    return 0 if report["error_count"] == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
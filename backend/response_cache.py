@@ -0,0 +1,44 @@
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+import ai_metrics
+
+class ResponseCache:
+    """
+    Bounded in-process LRU cache of serialized response bodies.
+
+    Keys should include a version that writers bump, so stale entries are
+    never looked up again and simply age out; the TTL only bounds how long a
+    missed bump can serve stale data. Hits and misses are counted as
+    {name}_hits and {name}_misses.
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl_seconds: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple[float, bytes]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            ai_metrics.increment(f"{self.name}_hits")
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        ai_metrics.increment(f"{self.name}_misses")
+        return None
+
+    def set(self, key: Hashable, body: bytes):
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,42 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+import ai_metrics
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one execution.
+
+    The first caller for a key starts the work; callers arriving while it is in
+    flight await the same task and share its result or exception. The shared
+    task is shielded, so a caller that disconnects doesn't cancel the work for
+    the others. Coalescing is per process.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn() for key unless a call for the same key is already in flight.
+
+        Args:
+            key: Identity of the work, e.g. a content hash
+            fn: Zero-argument coroutine function performing the work
+
+        Returns:
+            The result of the single shared execution
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _, key=key: self._inflight.pop(key, None))
+            ai_metrics.increment(f"{self.name}_calls")
+        else:
+            ai_metrics.increment(f"{self.name}_coalesced")
+        return await asyncio.shield(task)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import json
+import asyncio
+import tempfile
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_backends import StubBackend
+from ai_service import AIService, AIServiceUnavailable, INSIGHT_SECTION_MODELS
+
+def test_ai_backends():
+    """Test the insights pipeline end to end against the offline stub backend"""
+
+    sample_profile = {"name": "John Actor", "age_range": "25-35", "eye_color": "Brown"}
+
+    print("Testing AIService with the stub backend...")
+
+    service = AIService(StubBackend(latency_ms=1, latency_sigma=0))
+    insights = asyncio.run(service.generate_profile_insights_async(sample_profile))
+    assert list(insights) == list(INSIGHT_SECTION_MODELS)
+    assert all(len(items) == 3 for items in insights.values())
+    assert "John Actor" in insights["lookalikes"][0]["name"]
+
+    # Output is stable for the same prompt
+    again = asyncio.run(AIService(StubBackend(latency_ms=1, latency_sigma=0)).generate_profile_insights_async(sample_profile))
+    assert again == insights
+    print(f"✅ Stub insights: {insights['scripts'][0]}")
+
+    async def stream():
+        return [section async for section, _ in service.stream_profile_insights(sample_profile)]
+    assert asyncio.run(stream()) == list(INSIGHT_SECTION_MODELS)
+    print("✅ Stub stream yields every section")
+
+    # Templated outputs can use profile fields
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as template_file:
+        json.dump({"lookalikes": [{"name": "Lookalike of {name}", "reason": "{age_range} range"}]}, template_file)
+    try:
+        templated = AIService(StubBackend(latency_ms=1, latency_sigma=0, template_path=template_file.name))
+        lookalikes = asyncio.run(templated.generate_profile_insights_async(sample_profile))["lookalikes"]
+        assert lookalikes == [{"name": "Lookalike of John Actor", "reason": "25-35 range"}]
+    finally:
+        os.unlink(template_file.name)
+    print("✅ Templated stub output")
+
+    # Injected failures are retried, then surface as AIServiceUnavailable
+    failing = AIService(StubBackend(latency_ms=1, latency_sigma=0, error_rate=1.0))
+    failing.retry_base_delay = 0
+    try:
+        asyncio.run(failing.generate_profile_insights_async(sample_profile))
+        assert False, "Expected AIServiceUnavailable"
+    except AIServiceUnavailable:
+        pass
+
+    # Hung calls hit the call timeout
+    hanging = AIService(StubBackend(latency_ms=1, latency_sigma=0, timeout_rate=1.0))
+    hanging.call_timeout = 0.05
+    hanging.max_retries = 0
+    try:
+        asyncio.run(hanging.generate_profile_insights_async(sample_profile))
+        assert False, "Expected AIServiceUnavailable"
+    except AIServiceUnavailable:
+        pass
+
+    # Malformed output goes through the repair call
+    malformed = AIService(StubBackend(latency_ms=1, latency_sigma=0, malformed_rate=0.5, seed=3))
+    results = []
+    for _ in range(5):
+        try:
+            results.append(asyncio.run(malformed.generate_profile_insights_async(sample_profile)))
+        except AIServiceUnavailable:
+            results.append(None)
+    assert any(result == insights for result in results)
+    print("✅ Failure, timeout and malformed-output injection")
+
+if __name__ == "__main__":
+    test_ai_backends()
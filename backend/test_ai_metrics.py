@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+
+from fastapi.testclient import TestClient
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import ai_metrics
+import main
+
+def test_ai_metrics():
+    """Test the AI metrics histograms and derived rates"""
+
+    print("Testing AI metrics...")
+
+    ai_metrics.reset()
+    for latency in [40, 80, 90, 300, 700, 900, 1200, 3000, 6000, 60000]:
+        ai_metrics.observe("test_latency_ms", latency)
+    ai_metrics.observe("test_tokens", 320, ai_metrics.TOKEN_BUCKETS)
+    with ai_metrics.timer("test_block_ms"):
+        pass
+
+    histograms = ai_metrics.snapshot()["histograms"]
+    latency = histograms["test_latency_ms"]
+    assert latency["count"] == 10 and latency["max"] == 60000
+    assert latency["buckets"]["le_100"] == 2 and latency["buckets"]["le_inf"] == 1
+    assert latency["p50"] == 1000 and latency["p95"] == 60000
+    assert histograms["test_tokens"]["buckets"]["le_500"] == 1
+    assert histograms["test_block_ms"]["count"] == 1
+    print(f"✅ Latency p50={latency['p50']}ms p95={latency['p95']}ms")
+
+    ai_metrics.increment("insights_cache_hits", 3)
+    ai_metrics.increment("insights_cache_misses")
+    ai_metrics.increment("insights_served_ai", 6)
+    ai_metrics.increment("insights_served_rules", 1)
+    ai_metrics.increment("insights_served_partial", 1)
+    ai_metrics.increment("responses_parsed", 10)
+    ai_metrics.increment("parse_failures")
+
+    rates = ai_metrics.snapshot()["rates"]
+    assert rates == {
+        "cache_hit_ratio": 0.75,
+        "fallback_rate": 0.25,
+        "parse_failure_rate": 0.1,
+        "gemini_error_rate": None,
+    }
+    print(f"✅ Rates: {rates}")
+    ai_metrics.reset()
+
+def test_metrics_endpoint_admin_only():
+    """Test that only admins can read the AI metrics"""
+
+    print("Testing AI metrics endpoint access...")
+
+    original_admins = main.ADMIN_EMAILS
+    main.ADMIN_EMAILS = {"admin@example.com"}
+    try:
+        client = TestClient(main.app)
+        for email, expected_status in [("member@example.com", 403), ("admin@example.com", 200)]:
+            main.app.dependency_overrides[main.get_current_user] = lambda email=email: main.UserResponse(
+                id="507f1f77bcf86cd799439011", email=email, name="User", is_member=True, profile_completed=True
+            )
+            assert client.get("/api/v1/metrics/ai").status_code == expected_status
+        print("✅ Members get 403, admins get the metrics")
+    finally:
+        main.ADMIN_EMAILS = original_admins
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+
+if __name__ == "__main__":
+    test_ai_metrics()
+    test_metrics_endpoint_admin_only()
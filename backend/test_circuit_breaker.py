@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import time
+import asyncio
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_backends import StubBackend
+from ai_service import AIService, AIServiceUnavailable, CircuitBreaker
+
+def test_circuit_breaker_states():
+    """Test the closed, open and half-open transitions of the circuit breaker"""
+
+    print("Testing circuit breaker states...")
+
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=0.05)
+    assert breaker.state == "closed" and breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    # A success resets the failure count
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow_request()
+    print("✅ Consecutive failures open the breaker")
+
+    time.sleep(0.06)
+    assert breaker.state == "half_open"
+    assert breaker.allow_request()
+    # Only one trial call is let through at a time
+    assert not breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow_request()
+    print("✅ A failed trial call re-opens the breaker")
+
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow_request() and breaker.allow_request()
+    print("✅ A successful trial call closes the breaker")
+
+    breaker.record_failure()
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.release()
+    assert breaker.state == "half_open" and breaker.allow_request()
+    print("✅ A released trial call frees the half-open slot")
+
+def test_cancelled_trial_call():
+    """Test that cancelling the half-open trial call doesn't leave the breaker stuck"""
+
+    print("Testing cancelled half-open trial call...")
+
+    service = AIService(StubBackend(latency_ms=1, latency_sigma=0))
+    service.circuit_breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.01)
+    service.circuit_breaker.record_failure()
+    time.sleep(0.02)
+    assert service.circuit_breaker.state == "half_open"
+
+    async def cancel_trial():
+        service.backend = StubBackend(latency_ms=1000, latency_sigma=0)
+        trial = asyncio.ensure_future(service.generate_profile_insights_async({"name": "John Actor"}))
+        await asyncio.sleep(0.05)
+        assert service.circuit_breaker.trial_in_flight
+        trial.cancel()
+        try:
+            await trial
+            assert False, "Expected the trial call to be cancelled"
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(cancel_trial())
+    assert not service.circuit_breaker.trial_in_flight
+    print("✅ Cancelled trial call gives back the half-open slot")
+
+    service.backend = StubBackend(latency_ms=1, latency_sigma=0)
+    insights = asyncio.run(service.generate_profile_insights_async({"name": "John Actor"}))
+    assert insights and service.circuit_breaker.state == "closed"
+    print("✅ The next trial call goes through and closes the breaker")
+
+    service.backend = StubBackend(latency_ms=1, latency_sigma=0, error_rate=1.0)
+    service.retry_base_delay = 0
+    try:
+        asyncio.run(service.generate_profile_insights_async({"name": "John Actor"}))
+        assert False, "Expected AIServiceUnavailable"
+    except AIServiceUnavailable:
+        pass
+    assert service.circuit_breaker.state == "open"
+    print("✅ Failed calls open the breaker again")
+
+if __name__ == "__main__":
+    test_circuit_breaker_states()
+    test_cancelled_trial_call()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import json
+import subprocess
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Cold `import main` must stay within this many seconds on a worker boot
+IMPORT_TIME_BUDGET_SECONDS = float(os.environ.get("IMPORT_TIME_BUDGET_SECONDS", "2.0"))
+
+# Optional integrations that must only be loaded on first use
+LAZY_MODULES = ["google.generativeai", "google.api_core", "grpc", "numpy", "httpx", "profile_similarity"]
+
+def test_import_time():
+    """Test that importing the app is fast and doesn't load optional integrations"""
+
+    print("Testing cold import of main...")
+
+    # A fresh interpreter so modules imported by other tests don't hide the cost
+    script = (
+        "import sys, time, json\n"
+        "start = time.perf_counter()\n"
+        "import main\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(json.dumps({{'elapsed': elapsed, 'loaded': [m for m in {LAZY_MODULES!r} if m in sys.modules]}}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert report["loaded"] == [], f"Imported eagerly: {report['loaded']}"
+    print("✅ No optional integrations loaded at import")
+
+    assert report["elapsed"] < IMPORT_TIME_BUDGET_SECONDS, (
+        f"import main took {report['elapsed']:.2f}s, budget is {IMPORT_TIME_BUDGET_SECONDS:.2f}s"
+    )
+    print(f"✅ import main took {report['elapsed']:.2f}s (budget {IMPORT_TIME_BUDGET_SECONDS:.2f}s)")
+
+if __name__ == "__main__":
+    test_import_time()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import asyncio
+from datetime import datetime, timedelta
+
+import mongomock
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+from fastapi.testclient import TestClient
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+import ai_metrics
+from ai_backends import StubBackend
+from ai_service import AIService, CircuitBreaker, profile_insights_cache_key
+from main import (
+    ProfileCreate,
+    build_profile_document,
+    process_insight_job,
+    ensure_indexes,
+    enqueue_insight_job,
+    claim_insight_job,
+    finish_insight_job,
+    fail_abandoned_insight_jobs,
+    insight_job_retry_delay,
+    AI_INSIGHT_JOB_MAX_ATTEMPTS,
+    AI_INSIGHT_JOB_RETRY_BASE_SECONDS,
+)
+from ai_service import AI_BREAKER_RESET_SECONDS
+
+def expire_lease(db, job):
+    db.ai_insight_jobs.update_one({"_id": job["_id"]}, {"$set": {"lease_expires_at": datetime.utcnow() - timedelta(seconds=1)}})
+
+def make_due(db, job):
+    """Skip the backoff of a re-queued job"""
+    db.ai_insight_jobs.update_one({"_id": job["_id"]}, {"$set": {"not_before": datetime.utcnow() - timedelta(seconds=1)}})
+
+def test_insight_jobs():
+    """Test enqueue deduplication, claiming, retries and abandoned job cleanup"""
+
+    print("Testing insight job queue...")
+
+    db = mongomock.MongoClient().db
+    ensure_indexes(db)
+    ai_metrics.reset()
+
+    job = enqueue_insight_job(db, "profile-1", "key-1")
+    assert enqueue_insight_job(db, "profile-1", "key-1")["_id"] == job["_id"]
+
+    # A concurrent enqueue that missed the active job collides on the unique index and reuses it
+    original_get_active = main.get_active_insight_job
+    main.get_active_insight_job = lambda db, cache_key: None
+    try:
+        assert enqueue_insight_job(db, "profile-1", "key-1")["_id"] == job["_id"]
+    finally:
+        main.get_active_insight_job = original_get_active
+    assert db.ai_insight_jobs.count_documents({"cache_key": "key-1"}) == 1
+    counters = ai_metrics.snapshot()["counters"]
+    assert counters["ai_insight_generation_calls"] == 1 and counters["ai_insight_generation_coalesced"] == 2
+    print("✅ One active job per profile content, reused enqueues counted as coalesced")
+
+    claimed = claim_insight_job(db, "worker-a")
+    assert claimed["_id"] == job["_id"] and claimed["status"] == "running" and claimed["attempts"] == 1
+    assert claim_insight_job(db, "worker-b") is None
+
+    # A failed attempt is re-queued after a backoff; only the lease holder's outcome counts
+    finish_insight_job(db, claimed, error="Gemini unavailable")
+    stored = db.ai_insight_jobs.find_one({"_id": job["_id"]})
+    assert stored["status"] == "queued"
+    backoff = (stored["not_before"] - datetime.utcnow()).total_seconds()
+    assert AI_INSIGHT_JOB_RETRY_BASE_SECONDS >= AI_BREAKER_RESET_SECONDS
+    assert AI_INSIGHT_JOB_RETRY_BASE_SECONDS - 1 < backoff <= AI_INSIGHT_JOB_RETRY_BASE_SECONDS
+    assert claim_insight_job(db, "worker-b") is None
+    make_due(db, job)
+    claimed = claim_insight_job(db, "worker-b")
+    finish_insight_job(db, {**claimed, "worker_id": "worker-a"}, result={"scripts": []})
+    assert db.ai_insight_jobs.find_one({"_id": job["_id"]})["status"] == "running"
+    finish_insight_job(db, claimed, result={"scripts": []})
+    assert db.ai_insight_jobs.find_one({"_id": job["_id"]})["status"] == "completed"
+    assert enqueue_insight_job(db, "profile-1", "key-1")["_id"] != job["_id"]
+    assert insight_job_retry_delay(2) == 2 * insight_job_retry_delay(1) == 2 * AI_INSIGHT_JOB_RETRY_BASE_SECONDS
+    print("✅ Claims are exclusive and failed attempts retry with backoff")
+
+    # A worker dies during the final attempt: the job can't be claimed again and gets failed
+    db = mongomock.MongoClient().db
+    ensure_indexes(db)
+    abandoned = enqueue_insight_job(db, "profile-2", "key-2")
+    for attempt in range(1, AI_INSIGHT_JOB_MAX_ATTEMPTS + 1):
+        assert claim_insight_job(db, "worker-c")["attempts"] == attempt
+        expire_lease(db, abandoned)
+    assert claim_insight_job(db, "worker-c") is None
+    assert enqueue_insight_job(db, "profile-2", "key-2")["_id"] == abandoned["_id"]
+    assert fail_abandoned_insight_jobs(db) == 1
+    assert db.ai_insight_jobs.find_one({"_id": abandoned["_id"]})["status"] == "failed"
+    assert enqueue_insight_job(db, "profile-2", "key-2")["_id"] != abandoned["_id"]
+    print("✅ Jobs abandoned on their final attempt are failed")
+
+def test_process_insight_job():
+    """Test that AI failures are retried and then failed instead of completing with rule-based insights"""
+
+    print("Testing insight job processing...")
+
+    db = mongomock.MongoClient().db
+    ensure_indexes(db)
+    profile = build_profile_document(ProfileCreate(name="Jane Actor", location="Los Angeles", age_range="25-35"), "user-1")
+    profile["_id"] = db.profiles.insert_one(profile).inserted_id
+    cache_key = profile_insights_cache_key(profile)
+    job = enqueue_insight_job(db, profile["_id"], cache_key)
+
+    failing = AIService(StubBackend(latency_ms=0, latency_sigma=0, error_rate=1.0))
+    failing.retry_base_delay = 0
+    failing.circuit_breaker = CircuitBreaker(failure_threshold=100)
+    original_get_ai_service = main.get_ai_service
+    main.get_ai_service = lambda: failing
+    try:
+        for attempt in range(1, AI_INSIGHT_JOB_MAX_ATTEMPTS + 1):
+            make_due(db, job)
+            asyncio.run(process_insight_job(db, claim_insight_job(db, "worker-a")))
+            stored = db.ai_insight_jobs.find_one({"_id": job["_id"]})
+            assert stored["attempts"] == attempt and stored["result"] is None
+            assert stored["status"] == ("failed" if attempt == AI_INSIGHT_JOB_MAX_ATTEMPTS else "queued")
+        assert "Gemini" in stored["error"]
+        assert db.profile_insights_cache.count_documents({}) == 0
+        print("✅ Failed AI calls are retried, then the job is failed")
+
+        main.get_ai_service = lambda: AIService(StubBackend(latency_ms=0, latency_sigma=0))
+        job = enqueue_insight_job(db, profile["_id"], cache_key)
+        asyncio.run(process_insight_job(db, claim_insight_job(db, "worker-a")))
+        stored = db.ai_insight_jobs.find_one({"_id": job["_id"]})
+        assert stored["status"] == "completed" and stored["result"]["scripts"][0]["title"].startswith("Stub")
+        assert db.profile_insights_cache.find_one({"_id": cache_key})["source"] == "ai"
+        print("✅ Successful AI calls complete the job and are cached")
+
+        main.get_ai_service = lambda: None
+        db.profile_insights_cache.delete_many({})
+        job = enqueue_insight_job(db, profile["_id"], "key-without-ai")
+        asyncio.run(process_insight_job(db, claim_insight_job(db, "worker-a")))
+        stored = db.ai_insight_jobs.find_one({"_id": job["_id"]})
+        assert stored["status"] == "failed" and stored["attempts"] == 1
+        print("✅ Jobs fail immediately without an AI service")
+    finally:
+        main.get_ai_service = original_get_ai_service
+
+def test_ensure_indexes_isolates_failures():
+    """Test that an index the server rejects doesn't stop the others from being created"""
+
+    print("Testing index creation failures...")
+
+    db = mongomock.MongoClient().db
+    jobs = db.ai_insight_jobs
+    create_index = jobs.create_index
+
+    def reject_partial_filters(keys, **options):
+        # Servers before MongoDB 6.0 reject $in in partial filter expressions
+        if "partialFilterExpression" in options:
+            raise OperationFailure("Expression not supported in partial index: $in")
+        return create_index(keys, **options)
+
+    jobs.create_index = reject_partial_filters
+    failed = ensure_indexes(db)
+    assert failed == ["ai_insight_jobs cache_key_active_unique"]
+    assert "expires_at_1" in jobs.index_information()
+    assert "news_text_search" in db.news_articles.index_information()
+    print("✅ Indexes after a rejected one are still created")
+
+def test_process_insight_job_off_event_loop():
+    """Test that job processing reads and writes the insights cache in the threadpool"""
+
+    print("Testing insight job database calls...")
+
+    db = mongomock.MongoClient().db
+    ensure_indexes(db)
+    profile = build_profile_document(ProfileCreate(name="Jane Actor", location="Los Angeles", age_range="25-35"), "user-1")
+    profile["_id"] = db.profiles.insert_one(profile).inserted_id
+    enqueue_insight_job(db, profile["_id"], profile_insights_cache_key(profile))
+    on_event_loop = []
+
+    def off_loop(function):
+        def wrapper(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                on_event_loop.append(function.__name__)
+            except RuntimeError:
+                pass
+            return function(*args, **kwargs)
+        return wrapper
+
+    originals = (main.get_ai_service, main.get_cached_profile_insights, main.store_profile_insights)
+    main.get_ai_service = lambda: AIService(StubBackend(latency_ms=0, latency_sigma=0))
+    main.get_cached_profile_insights = off_loop(main.get_cached_profile_insights)
+    main.store_profile_insights = off_loop(main.store_profile_insights)
+    try:
+        asyncio.run(process_insight_job(db, claim_insight_job(db, "worker-a")))
+    finally:
+        main.get_ai_service, main.get_cached_profile_insights, main.store_profile_insights = originals
+
+    assert db.profile_insights_cache.count_documents({}) == 1 and on_event_loop == []
+    print("✅ Cache reads and writes run off the event loop")
+
+def test_stream_insights_off_event_loop():
+    """Test that the SSE stream reads the profile and insights cache in the threadpool"""
+
+    print("Testing insight stream database calls...")
+
+    db = mongomock.MongoClient().db
+    ensure_indexes(db)
+    profile = build_profile_document(ProfileCreate(name="Jane Actor", location="Los Angeles", age_range="25-35"), "user-1")
+    profile["_id"] = db.profiles.insert_one(profile).inserted_id
+    on_event_loop = []
+
+    def off_loop(function):
+        def wrapper(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                on_event_loop.append(function.__name__)
+            except RuntimeError:
+                pass
+            return function(*args, **kwargs)
+        return wrapper
+
+    originals = (main.get_db, main.get_ai_service, main.get_profile_by_id, main.get_cached_profile_insights, main.store_profile_insights)
+    main.get_db = lambda: db
+    main.get_ai_service = lambda: AIService(StubBackend(latency_ms=0, latency_sigma=0))
+    main.get_profile_by_id = off_loop(main.get_profile_by_id)
+    main.get_cached_profile_insights = off_loop(main.get_cached_profile_insights)
+    main.store_profile_insights = off_loop(main.store_profile_insights)
+    main.app.dependency_overrides[main.get_current_user] = lambda: main.UserResponse(
+        id="user-1", email="jane@example.com", name="Jane", is_member=True, profile_completed=True
+    )
+    try:
+        client = TestClient(main.app)
+        for expected_source in ("ai", "cache"):
+            response = client.get(f"/api/v1/profiles/{profile['_id']}/ai-insights/stream")
+            assert response.status_code == 200
+            assert f'"source": "{expected_source}"' in response.text
+    finally:
+        main.get_db, main.get_ai_service, main.get_profile_by_id, main.get_cached_profile_insights, main.store_profile_insights = originals
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+
+    assert on_event_loop == []
+    print("✅ Stream profile and cache lookups run off the event loop")
+
+def test_get_insights_endpoint():
+    """Test that GET returns cached insights or a job status, never waiting on Gemini"""
+
+    print("Testing insight GET endpoints...")
+
+    db = mongomock.MongoClient().db
+    ensure_indexes(db)
+    user_id = "507f1f77bcf86cd799439011"
+    profile = build_profile_document(ProfileCreate(name="Jane Actor", location="Los Angeles", age_range="25-35"), ObjectId(user_id))
+    profile_id = str(db.profiles.insert_one(profile).inserted_id)
+
+    calls = []
+
+    class CountingBackend(StubBackend):
+        async def generate_async(self, prompt, response_schema):
+            calls.append(prompt)
+            return await super().generate_async(prompt, response_schema)
+
+    service = AIService(CountingBackend(latency_ms=0, latency_sigma=0))
+    original_get_db = main.get_db
+    original_get_ai_service = main.get_ai_service
+    main.get_db = lambda: db
+    main.get_ai_service = lambda: service
+    main.app.dependency_overrides[main.get_current_user] = lambda: main.UserResponse(
+        id=user_id, email="jane@example.com", name="Jane", is_member=True, profile_completed=True
+    )
+    try:
+        client = TestClient(main.app)
+        for url in [f"/api/v1/profiles/{profile_id}/ai-insights", f"/api/v1/profiles/user/{user_id}/ai-insights"]:
+            response = client.get(url)
+            assert response.status_code == 202 and response.json()["status"] == "queued"
+        assert calls == [] and db.ai_insight_jobs.count_documents({}) == 1
+        print("✅ A cache miss queues one job and returns 202 without calling Gemini")
+
+        asyncio.run(process_insight_job(db, claim_insight_job(db, "worker-a")))
+        response = client.get(f"/api/v1/profiles/{profile_id}/ai-insights")
+        assert response.status_code == 200 and response.json()["scripts"][0]["title"].startswith("Stub")
+        assert len(calls) == 1
+        print("✅ Insights generated by the job are served from the cache")
+
+        main.get_ai_service = lambda: None
+        response = client.get(f"/api/v1/profiles/user/{user_id}/ai-insights")
+        assert response.status_code == 200 and set(response.json()) >= {"lookalikes", "scripts"}
+        print("✅ Rule-based insights are returned without an AI service")
+
+        # An open circuit breaker serves rules right away instead of queueing a doomed job
+        db.profile_insights_cache.delete_many({})
+        db.ai_insight_jobs.delete_many({})
+        service.circuit_breaker = CircuitBreaker(failure_threshold=1)
+        service.circuit_breaker.record_failure()
+        main.get_ai_service = lambda: service
+        response = client.get(f"/api/v1/profiles/{profile_id}/ai-insights")
+        assert response.status_code == 200 and set(response.json()) >= {"lookalikes", "scripts"}
+        response = client.post(f"/api/v1/profiles/{profile_id}/ai-insights")
+        assert response.status_code == 200 and response.json()["source"] == "rules"
+        assert db.ai_insight_jobs.count_documents({}) == 0
+        print("✅ Rule-based insights are returned while the circuit breaker is open")
+
+        # A failed job carries rule-based insights for the client to fall back on
+        job = enqueue_insight_job(db, ObjectId(profile_id), "failed-key")
+        db.ai_insight_jobs.update_one({"_id": job["_id"]}, {"$set": {"status": "failed", "error": "Gemini unavailable"}})
+        response = client.get(f"/api/v1/ai-insight-jobs/{job['_id']}")
+        body = response.json()
+        assert body["status"] == "failed" and set(body["fallback"]) >= {"lookalikes", "scripts"}
+        print("✅ Failed jobs expose a rule-based fallback")
+    finally:
+        main.get_db = original_get_db
+        main.get_ai_service = original_get_ai_service
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+
+if __name__ == "__main__":
+    test_insight_jobs()
+    test_process_insight_job()
+    test_ensure_indexes_isolates_failures()
+    test_process_insight_job_off_event_loop()
+    test_stream_insights_off_event_loop()
+    test_get_insights_endpoint()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import json
+from datetime import datetime
+from bson import ObjectId
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_service import (
+    build_insight_prompt,
+    insight_instruction_prefix,
+    prompt_token_report,
+    profile_insights_cache_key,
+)
+
+def test_insight_prompt():
+    """Test that the insights prompt only carries the compact, relevant profile fields"""
+
+    stored_profile = {
+        "_id": ObjectId("507f1f77bcf86cd799439011"),
+        "user_id": ObjectId("507f1f77bcf86cd799439012"),
+        "name": " John Actor ",
+        "pronouns": "",
+        "age_range": "25-35",
+        "stage_experience": False,
+        "special_skills": ["Piano", "", "  Fencing "],
+        "coaches": [],
+        "headshots": ["https://cdn.example.com/headshot.jpg"],
+        "social_links": {},
+        "created_at": datetime.utcnow(),
+        "completion_percentage": 40,
+    }
+
+    print("Testing compact insights prompt...")
+
+    prompt = build_insight_prompt(stored_profile)
+    prefix = insight_instruction_prefix(("lookalikes", "scripts", "headshots", "careerAdvice"))
+    assert prompt.startswith(prefix)
+    profile_payload = json.loads(prompt[len(prefix):])
+    assert profile_payload == {
+        "name": "John Actor",
+        "age_range": "25-35",
+        "stage_experience": False,
+        "special_skills": ["Piano", "Fencing"],
+    }
+    print(f"✅ Profile payload: {prompt[len(prefix):]}")
+
+    # The prefix is built once per section set and shared by every profile
+    assert build_insight_prompt({"name": "Other"}).startswith(prefix)
+    assert insight_instruction_prefix(("scripts",)) is insight_instruction_prefix(("scripts",))
+    assert "lookalikes" not in build_insight_prompt(stored_profile, ["scripts"])
+
+    report = prompt_token_report(stored_profile)
+    assert report["total_tokens"] <= report["prefix_tokens"] + report["profile_tokens"]
+    assert report["profile_fields"] == 4
+    print(f"✅ Token report: {report}")
+
+    # Changes to fields the prompt ignores don't invalidate cached insights
+    relinked = dict(stored_profile, headshots=[], completion_percentage=90)
+    assert profile_insights_cache_key(relinked) == profile_insights_cache_key(stored_profile)
+
+if __name__ == "__main__":
+    test_insight_prompt()
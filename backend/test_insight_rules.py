@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+
+import main
+from insight_rules import InsightRuleEngine, SECTIONS
+
+def test_insight_rules():
+    """Test the fallback insight rule table without calling the AI API"""
+
+    sample_profile = {
+        "name": "John Actor",
+        "age_range": "18-25",
+        "build": "Athletic",
+        "eye_color": "Blue",
+        "hair_color": "Blonde",
+        "preferred_genres": ["Drama", "Horror", "Thriller"],
+        "special_skills": ["Martial Arts", "Piano"],
+        "stage_experience": True,
+        "film_experience": False,
+        "career_goals": "Recurring roles in television, then film",
+    }
+
+    print("Testing rule-based profile insights...")
+
+    engine = InsightRuleEngine.from_file()
+    insights = engine.generate(sample_profile)
+
+    assert list(insights.keys()) == SECTIONS
+    assert all(len(items) <= engine.section_limit for items in insights.values())
+    print(f"✅ All insight categories present: {list(insights.keys())}")
+
+    assert [item["name"] for item in insights["lookalikes"]] == ["Zendaya", "Timothée Chalamet", "Scarlett Johansson"]
+    assert insights["lookalikes"][2]["reason"] == "Similar blue eyes and blonde hair combination"
+
+    # Horror and Thriller share an exclusive group, so the suspense monologue appears once
+    assert [item["title"] for item in insights["scripts"]] == [
+        "Contemporary Monologue: 'Rabbit Hole' by David Lindsay-Abaire",
+        "Suspense Monologue: 'Black Swan'",
+        "Classical Scene: 'Romeo and Juliet' by Shakespeare",
+    ]
+
+    assert [item["tip"] for item in insights["headshots"]] == [
+        "Natural outdoor lighting", "Soft, diffused lighting", "Fresh, minimal makeup look"
+    ]
+
+    assert [item["advice"] for item in insights["careerAdvice"]] == [
+        "Transition to on-camera work",
+        "Pursue musical theater and film opportunities",
+        "Consider action and stunt work",
+    ]
+    print(f"Sample career advice: {insights['careerAdvice'][0]}")
+
+    # Television and film goals are mutually exclusive, television declared first
+    goal_advice = engine.generate({"career_goals": "Film and television"})["careerAdvice"]
+    assert [item["advice"] for item in goal_advice] == ["Study current TV shows in your demographic"]
+
+    assert engine.generate({}) == {section: [] for section in SECTIONS}
+    print("✅ Rule table evaluated as expected")
+
+def test_reload_endpoint_admin_only():
+    """Test that only admins can reload the rule table"""
+
+    print("Testing insight rule reload access...")
+
+    original_admins = main.ADMIN_EMAILS
+    main.ADMIN_EMAILS = {"admin@example.com"}
+    try:
+        client = TestClient(main.app)
+        for email, expected_status in [("member@example.com", 403), ("admin@example.com", 200)]:
+            main.app.dependency_overrides[main.get_current_user] = lambda email=email: main.UserResponse(
+                id="507f1f77bcf86cd799439011", email=email, name="User", is_member=True, profile_completed=True
+            )
+            assert client.post("/api/v1/admin/insight-rules/reload").status_code == expected_status
+        print("✅ Members can't reload the insight rules")
+    finally:
+        main.ADMIN_EMAILS = original_admins
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+
+if __name__ == "__main__":
+    test_insight_rules()
+    test_reload_endpoint_admin_only()
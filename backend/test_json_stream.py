@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import json
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from json_stream import IncrementalObjectParser
+
+def test_json_stream():
+    """Test that streamed insight sections are emitted as soon as each one is complete"""
+
+    insights = {
+        "lookalikes": [{"name": "Zendaya", "reason": "Braces {like} these, and \"quotes\" in strings"}],
+        "scripts": [{"title": "Scene [1]", "reason": "Commas, brackets ] and escapes \\\\ are fine"}],
+        "headshots": [],
+        "careerAdvice": [{"advice": "Study TV", "reason": "Trends"}],
+    }
+    response_text = "Here are your insights:\n```json\n" + json.dumps(insights, indent=2) + "\n```"
+
+    print("Testing incremental JSON section parsing...")
+
+    # Feed a few characters at a time, like a streamed model response
+    parser = IncrementalObjectParser()
+    emitted = []
+    for i in range(0, len(response_text), 7):
+        for section, value in parser.feed(response_text[i:i + 7]):
+            emitted.append(section)
+            assert value == insights[section]
+            # A section is emitted before the rest of the object has arrived
+            if section == "lookalikes":
+                assert not parser.finished
+
+    assert emitted == ["lookalikes", "scripts", "headshots", "careerAdvice"]
+    assert parser.finished and not parser.errors
+    assert parser.members == insights
+    print(f"✅ Sections emitted in order: {emitted}")
+
+    # A truncated stream keeps the sections that completed
+    truncated = IncrementalObjectParser()
+    truncated.feed(json.dumps(insights)[:120])
+    assert "lookalikes" in truncated.members
+    assert not truncated.finished
+    print("✅ Truncated stream keeps completed sections")
+
+if __name__ == "__main__":
+    test_json_stream()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from keyword_matcher import (
+    KeywordMatcher,
+    INSIGHT_TEXT,
+    DEFAULT_INSIGHT,
+    generate_keyword_insights,
+    generate_keyword_insights_for_articles,
+)
+
+ARTICLES = [
+    {"title": "Netflix Opens Casting for New Series",
+     "summary": "Auditions are being accepted via self-tape submissions for the lead role."},
+    {"title": "Industry Push for Inclusion", "summary": "Studios commit to better representation on screen."},
+    {"title": "Oscar Nominations Announced", "summary": "The academy revealed this year's nominees."},
+    {"title": "Quarterly Earnings Call", "summary": "The company controlled costs this quarter."},
+    {"title": None, "summary": None},
+]
+
+def test_keyword_matcher():
+    """Test the word-start keyword matcher and the insight helpers built on it"""
+
+    print("Testing keyword matcher...")
+
+    matcher = KeywordMatcher({"a": ["role", "cast"], "b": ["self-tape", "role"]})
+    assert matcher.match("Two new ROLES announced") == ["a", "b"]
+    assert matcher.match("Submit a self-taped audition") == ["b"]
+    assert matcher.first("Submit a self-taped audition") == "b"
+    # Keywords match the start of a word only, even after an earlier partial hit
+    assert matcher.match("Costs were controlled, broadcast delayed") == []
+    assert matcher.match("Broadcast first, then casting") == ["a"]
+    assert matcher.match(None) == [] and matcher.first("") is None
+    print("✅ Word-start matching works")
+
+    insights = generate_keyword_insights(ARTICLES[0]["title"], ARTICLES[0]["summary"])
+    assert insights == " ".join([INSIGHT_TEXT["casting"], INSIGHT_TEXT["streaming"], INSIGHT_TEXT["remote"]])
+    assert generate_keyword_insights(ARTICLES[3]["title"], ARTICLES[3]["summary"]) == DEFAULT_INSIGHT
+    assert generate_keyword_insights_for_articles(ARTICLES) == [
+        generate_keyword_insights(article["title"], article["summary"]) for article in ARTICLES
+    ]
+    print("✅ Insights for a list of articles match single-article insights")
+
+if __name__ == "__main__":
+    test_keyword_matcher()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import tempfile
+
+import mongomock
+from fastapi.testclient import TestClient
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+import news_classifier
+from news_classifier import NewsClassifier, train_model, get_news_classifier, DEFAULT_CATEGORY
+from train_news_classifier import categorize_articles
+
+EXAMPLES = [
+    ("Open casting call for new series", "Actors can submit self-tape auditions for the lead role", "casting"),
+    ("Studio casting lead for thriller", "Auditions for the role begin next week", "casting"),
+    ("Oscar nominations announced", "The academy named best picture nominees", "awards"),
+    ("Emmy nominations revealed", "Best drama nominees were named by the academy", "awards"),
+]
+
+def test_news_classifier():
+    """Test training, classification and the shipped news category model"""
+
+    print("Testing news classifier...")
+
+    classifier = NewsClassifier(train_model(EXAMPLES, min_score=0.1))
+    assert classifier.classify("Casting call announced", "Auditions open for the lead role") == "casting"
+    assert classifier.classify("Golden Globe nominations", "The nominees for best picture") == "awards"
+    # Articles sharing no terms with any category get the default
+    assert classifier.classify("Quarterly earnings", "Revenue rose") == DEFAULT_CATEGORY
+    assert classifier.classify(None, None) == DEFAULT_CATEGORY
+    articles = [{"title": title, "summary": summary} for title, summary, _ in EXAMPLES]
+    assert classifier.classify_batch(articles) == [category for _, _, category in EXAMPLES]
+    print("✅ Trained model classifies by nearest centroid")
+
+    shipped = get_news_classifier()
+    assert set(shipped.categories) >= {"casting", "film", "television", "streaming", "awards"}
+    assert shipped.classify("Emmy nominations announced", "The television academy revealed this year's nominees") == "awards"
+    assert shipped.classify("Netflix subscriber growth slows", "The streamer added fewer subscribers than expected") == "streaming"
+    assert shipped.classify("HBO renews drama for third season", "The series will return next year") == "television"
+    print(f"✅ Shipped model loaded with categories {sorted(shipped.categories)}")
+
+def test_keyword_labels():
+    """Test the keyword rules that label stored articles for training"""
+
+    print("Testing keyword training labels...")
+
+    articles = [
+        {"title": "Netflix Opens Casting for New Series", "summary": "Auditions via self-tape for the lead role."},
+        {"title": "Industry Push for Inclusion", "summary": "Studios commit to better representation on screen."},
+        {"title": "Oscar Nominations Announced", "summary": "The academy revealed this year's nominees."},
+        {"title": "Quarterly Earnings Call", "summary": "The company controlled costs this quarter."},
+        {"title": None, "summary": None},
+    ]
+    assert categorize_articles(articles) == ["casting", "film", "awards", DEFAULT_CATEGORY, DEFAULT_CATEGORY]
+    print("✅ Articles labeled by keyword priority")
+
+def test_classifier_endpoints():
+    """Test that created articles are classified only without a category, and the model reload endpoint"""
+
+    print("Testing news classifier endpoints...")
+
+    db = mongomock.MongoClient().db
+    original_get_db = main.get_db
+    original_admins = main.ADMIN_EMAILS
+    main.get_db = lambda: db
+    main.ADMIN_EMAILS = {"admin@example.com"}
+    main.app.dependency_overrides[main.get_current_user] = lambda: main.UserResponse(
+        id="507f1f77bcf86cd799439011", email="admin@example.com", name="Admin", is_member=True, profile_completed=True
+    )
+    original_classifier = get_news_classifier()
+    try:
+        client = TestClient(main.app)
+        response = client.get("/api/v1/news/categories")
+        assert response.status_code == 200 and response.json()["categories"]
+        print("✅ /news/categories isn't routed as an article id")
+
+        article = {
+            "title": "Emmy nominations announced", "summary": "The television academy revealed this year's nominees",
+            "source": "Variety", "url": "https://example.com/emmys", "published_at": "2024-05-01T10:00:00",
+            "ai_insights": "Award season is casting season."
+        }
+        classified_id = client.post("/api/v1/news", json=article).json()["id"]
+        chosen_id = client.post("/api/v1/news", json=dict(article, url="https://example.com/2", category=DEFAULT_CATEGORY)).json()["id"]
+        categories = {str(doc["_id"]): doc["category"] for doc in db.news_articles.find()}
+        assert categories == {classified_id: "awards", chosen_id: DEFAULT_CATEGORY}
+        print("✅ Only articles created without a category are classified")
+
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as model_file:
+            model_file.write("{not json")
+        os.environ["NEWS_CLASSIFIER_MODEL_PATH"] = model_file.name
+        try:
+            assert client.post("/api/v1/admin/news/classifier/reload").status_code == 400
+            assert get_news_classifier() is original_classifier
+        finally:
+            del os.environ["NEWS_CLASSIFIER_MODEL_PATH"]
+            os.unlink(model_file.name)
+        response = client.post("/api/v1/admin/news/classifier/reload")
+        assert response.status_code == 200
+        assert response.json()["categories"] == sorted(original_classifier.categories)
+        assert get_news_classifier() is not original_classifier
+        print("✅ Invalid models are rejected on reload, valid ones replace the loaded model")
+
+        main.app.dependency_overrides[main.get_current_user] = lambda: main.UserResponse(
+            id="507f1f77bcf86cd799439012", email="member@example.com", name="Member", is_member=True, profile_completed=True
+        )
+        assert client.post("/api/v1/admin/news/classifier/reload").status_code == 403
+        print("✅ Members can't reload the classifier")
+    finally:
+        main.get_db = original_get_db
+        main.ADMIN_EMAILS = original_admins
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+        news_classifier._classifier = original_classifier
+
+if __name__ == "__main__":
+    test_news_classifier()
+    test_keyword_labels()
+    test_classifier_endpoints()
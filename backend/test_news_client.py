@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import asyncio
+from datetime import datetime
+
+import httpx
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_client import NewsAPIClient, NewsAPIError
+
+def test_news_client():
+    """Test paging, retries, completeness and the from/to window against a mock NewsAPI transport"""
+
+    requests_seen = []
+    failures_left = {"rate_limited": 2}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        requests_seen.append(params)
+        assert request.headers["X-Api-Key"] == "test-key"
+        if params["q"] == "broken":
+            return httpx.Response(401, json={"status": "error", "message": "apiKeyInvalid"})
+        if params["q"] == "casting" and failures_left["rate_limited"]:
+            failures_left["rate_limited"] -= 1
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        page = int(params["page"])
+        if params["q"] == "capped" and page == 3:
+            return httpx.Response(426, json={"status": "error", "code": "maximumResultsReached"})
+        if params["q"] == "flaky" and page == 2:
+            return httpx.Response(503)
+        articles = [
+            {"title": f"{params['q']} {page}-{i}", "url": f"https://example.com/{page}-{i}"}
+            for i in range(2)
+        ]
+        return httpx.Response(200, json={"status": "ok", "totalResults": 5, "articles": articles})
+
+    async def run():
+        async with NewsAPIClient("test-key", transport=httpx.MockTransport(handler), retry_base_delay=0) as client:
+            since = datetime(2024, 5, 1, 12, 30, 15, 123000)
+            until = datetime(2024, 5, 2, 8, 0)
+            articles, complete = await client.fetch_query("acting", since=since, until=until, page_size=2, max_pages=5)
+            assert len(articles) == 6 and complete
+            assert sorted(params["page"] for params in requests_seen) == ["1", "2", "3"]
+            assert all(params["from"] == "2024-05-01T12:30:15" for params in requests_seen)
+            assert all(params["to"] == "2024-05-02T08:00:00" for params in requests_seen)
+            print(f"✅ Fetched {len(articles)} articles over 3 pages")
+
+            # Stopping at max_pages leaves the oldest matches unfetched
+            articles, complete = await client.fetch_query("acting", page_size=2, max_pages=2)
+            assert len(articles) == 4 and not complete
+            print("✅ Fetches cut short by max_pages are reported incomplete")
+
+            # Rate-limited pages are retried; queries sharing URLs are merged
+            merged, complete = await client.fetch_articles(["acting", "casting"])
+            assert failures_left["rate_limited"] == 0
+            assert len(merged) == 2 and complete
+            print("✅ Retried 429s and merged duplicate URLs across queries")
+
+            # Any failed query fails the fetch, so it can't pass for a complete one
+            try:
+                await client.fetch_articles(["acting", "broken"])
+                assert False, "Expected NewsAPIError"
+            except NewsAPIError:
+                pass
+            print("✅ Non-retryable errors surface")
+
+            # Pages past the plan's cap end the query without retries, as an incomplete fetch
+            requests_seen.clear()
+            capped, complete = await client.fetch_query("capped", page_size=2, max_pages=5)
+            assert [article["title"] for article in capped] == ["capped 1-0", "capped 1-1", "capped 2-0", "capped 2-1"]
+            assert sum(params["page"] == "3" for params in requests_seen) == 1 and not complete
+            print("✅ Pages past the plan's cap are reported incomplete")
+
+            # Any other failed page fails the query
+            try:
+                await client.fetch_query("flaky", page_size=2, max_pages=5)
+                assert False, "Expected NewsAPIError"
+            except NewsAPIError:
+                pass
+            print("✅ A failed later page fails the fetch")
+
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    test_news_client()
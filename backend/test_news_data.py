@@ -4,9 +4,15 @@ Script to add test news articles to the database for demonstration purposes.
 """
 
 import os
+import sys
 from datetime import datetime, timedelta
 from pymongo import MongoClient
 
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from keyword_matcher import generate_keyword_insights
+
 # Database connection
 def get_db():
     mongo_uri = os.environ.get("MONGODB_URI", "mongodb+srv://joyjyhuang_db_user:<db_password>@next-cinema-playgrnd.dqcgzov.mongodb.net/?retryWrites=true&w=majority&appName=next-cinema-playgrnd")
@@ -18,25 +24,6 @@ def get_db():
     db = client.get_database("next_cinema_db")
     return db
 
-def generate_ai_insights(title: str, summary: str) -> str:
-    """Generate AI insights for an article"""
-    content = f"{title} {summary}".lower()
-    insights = []
-    
-    if any(word in content for word in ["casting", "audition", "role"]):
-        insights.append("This could present new opportunities for actors seeking roles.")
-    
-    if any(word in content for word in ["streaming", "netflix", "hulu", "amazon"]):
-        insights.append("Streaming platforms continue to drive demand for diverse content.")
-    
-    if any(word in content for word in ["self-tape", "virtual", "remote"]):
-        insights.append("The industry continues to embrace remote audition processes.")
-    
-    if any(word in content for word in ["diversity", "inclusion", "representation"]):
-        insights.append("Industry focus on diversity creates more opportunities for underrepresented actors.")
-    
-    return " ".join(insights) if insights else "Stay informed about industry trends that may impact your career."
-
 def add_test_articles():
     """Add test news articles to the database"""
     db = get_db()
@@ -98,7 +85,7 @@ def add_test_articles():
     
     # Add AI insights to each article
     for article in test_articles:
-        article["ai_insights"] = generate_ai_insights(article["title"], article["summary"])
+        article["ai_insights"] = generate_keyword_insights(article["title"], article["summary"])
     
     try:
         # Create unique index on URL if it doesn't exist
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import json
+import itertools
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_dedup import (
+    DuplicateIndex,
+    article_fingerprint,
+    hamming_distance,
+    simhash_bands,
+    SIMHASH_BANDS,
+    SIMHASH_BAND_BITS,
+    NEWS_DUPLICATE_MAX_DISTANCE,
+)
+
+TITLE = "Netflix Orders Third Season of Hit Drama 'The Crown' Spinoff"
+SUMMARY = ("Netflix has renewed the period drama spinoff for a third season, "
+           "with production set to begin in London this spring, sources say.")
+
+# How syndicated copies of a story differ in practice
+SYNDICATED = {
+    "source suffix": (f"{TITLE} - Variety", SUMMARY + "..", None),
+    "outlet suffix": (f"{TITLE} | The Hollywood Reporter", SUMMARY, None),
+    "reworded title": (TITLE.replace("Orders", "Renews"), SUMMARY, None),
+    "trimmed summary": (TITLE, "Netflix has renewed the period drama spinoff for a third season.", None),
+    "own source suffix": (f"{TITLE} - Deadline", SUMMARY, "Deadline"),
+}
+
+def test_news_dedup():
+    """Test SimHash fingerprints and the banded duplicate index"""
+
+    print("Testing news near-duplicate detection...")
+
+    original = article_fingerprint(TITLE, SUMMARY)
+    unrelated = article_fingerprint("Disney Announces New Marvel Slate at D23",
+                                    "Disney revealed its upcoming Marvel film slate including three new features.")
+    assert original == article_fingerprint(TITLE, SUMMARY)
+    assert -(1 << 63) <= original < (1 << 63)
+    assert article_fingerprint(*SYNDICATED["own source suffix"]) == original
+    for variant, (title, summary, source) in SYNDICATED.items():
+        distance = hamming_distance(original, article_fingerprint(title, summary, source))
+        assert distance <= NEWS_DUPLICATE_MAX_DISTANCE, (variant, distance)
+        print(f"✅ {variant}: {distance} bits away")
+
+    # Unrelated stories from the same beat stay well clear of the threshold
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "news_category_seed.json")) as f:
+        seed = json.load(f)
+    fingerprints = [article_fingerprint(article["title"], article["summary"]) for article in seed] + [unrelated]
+    closest = min(hamming_distance(first, second) for first, second in itertools.combinations(fingerprints, 2))
+    assert closest > NEWS_DUPLICATE_MAX_DISTANCE + 2
+    print(f"✅ Closest pair of unrelated stories is {closest} bits apart")
+
+    bands = simhash_bands(original)
+    assert len(bands) == SIMHASH_BANDS and len(set(bands)) == SIMHASH_BANDS
+    # Flipping one bit per band but the last still leaves a shared band
+    flipped = original ^ sum(1 << (band * SIMHASH_BAND_BITS) for band in range(SIMHASH_BANDS - 1))
+    assert len(set(simhash_bands(flipped)) & set(bands)) == 1
+
+    index = DuplicateIndex()
+    index.add("deadline", original)
+    index.add("thr", unrelated)
+    for title, summary, source in SYNDICATED.values():
+        assert index.find(article_fingerprint(title, summary, source)) == "deadline"
+    assert index.find(flipped) == "deadline"
+    assert index.find(article_fingerprint("Broadway Revival Sets Opening Night", "The musical returns in May.")) is None
+    print("✅ Banded index finds near-duplicates only")
+
+if __name__ == "__main__":
+    test_news_dedup()
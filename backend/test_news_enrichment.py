@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import json
+import asyncio
+
+import mongomock
+from bson import ObjectId
+from fastapi.testclient import TestClient
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+from ai_backends import StubBackend
+from ai_service import AIService
+from keyword_matcher import generate_keyword_insights
+from main import enrich_news_articles, generate_news_insights_batch
+
+class FixedBackend(StubBackend):
+    """Stub backend that always answers with the same response text"""
+
+    def __init__(self, text: str):
+        super().__init__(latency_ms=0, latency_sigma=0)
+        self.text = text
+
+    def render(self, prompt, response_schema):
+        return self.text
+
+ARTICLES = [
+    {"title": "Studio greenlights a new film", "summary": "Casting starts next month"},
+    {"title": "Streaming series renewed", "summary": "Audition calls for season two"},
+    {"title": "Broadway revival announced", "summary": "Stage roles open"},
+]
+
+def test_news_insights_batch():
+    """Test that AI insights are matched by id and the rest fall back to keywords in order"""
+
+    print("Testing batched news insights...")
+
+    response = json.dumps({"insights": [
+        {"id": "3", "insight": "  Stage actors should submit early.  "},
+        {"id": "1", "insight": "Expect open calls."},
+        {"id": "2", "insight": "   "},
+        {"id": "7", "insight": "Out of range"},
+        {"id": "x", "insight": "Not a position"},
+        "not an object",
+    ]})
+    service = AIService(FixedBackend(response))
+    results = asyncio.run(generate_news_insights_batch(service, ARTICLES))
+    assert results == [
+        ("Expect open calls.", "ai"),
+        (generate_keyword_insights(ARTICLES[1]["title"], ARTICLES[1]["summary"]), "keywords"),
+        ("Stage actors should submit early.", "ai"),
+    ]
+    print("✅ Insights are matched by id, blank and unknown entries fall back to keywords")
+
+    # The offline stub answers every article in the batch, so none fall back
+    stub = AIService(StubBackend(latency_ms=0, latency_sigma=0))
+    results = asyncio.run(generate_news_insights_batch(stub, ARTICLES))
+    assert [source for _, source in results] == ["ai"] * 3
+    assert len({insight for insight, _ in results}) == 3
+    print("✅ Stub backend insights are applied to their articles")
+
+    malformed = AIService(FixedBackend('{"insights": [{"id": "1", "ins'))
+    results = asyncio.run(generate_news_insights_batch(malformed, ARTICLES))
+    assert [source for _, source in results] == ["keywords"] * 3
+    print("✅ Malformed responses fall back to keywords for the whole batch")
+
+    failing = AIService(StubBackend(latency_ms=0, latency_sigma=0, error_rate=1.0))
+    failing.retry_base_delay = 0
+    results = asyncio.run(generate_news_insights_batch(failing, ARTICLES))
+    assert results == [
+        (generate_keyword_insights(article["title"], article["summary"]), "keywords") for article in ARTICLES
+    ]
+    assert asyncio.run(generate_news_insights_batch(None, ARTICLES)) == results
+    print("✅ Failed or missing AI service falls back to keywords")
+
+def test_enrichment_rerun():
+    """Test that a trigger during a running pass queues a rescan instead of being dropped"""
+
+    print("Testing news enrichment rerun...")
+
+    db = mongomock.MongoClient().db
+    for number in range(3):
+        db.news_articles.insert_one({"title": f"Article {number}", "summary": "Casting news", "ai_insights": None})
+
+    original_get_ai_service = main.get_ai_service
+    original_batch = main.generate_news_insights_batch
+    main.get_ai_service = lambda: None
+    calls = []
+
+    async def batch_with_concurrent_trigger(service, articles):
+        calls.append(len(articles))
+        if len(calls) == 1:
+            # An article lands behind the cursor and its trigger arrives mid-pass
+            db.news_articles.insert_one({
+                "_id": ObjectId("000000000000000000000001"), "title": "Late article", "summary": "", "ai_insights": None
+            })
+            skipped = await enrich_news_articles(db)
+            assert skipped["skipped"] and skipped["scanned"] == 0
+        return await original_batch(service, articles)
+
+    main.generate_news_insights_batch = batch_with_concurrent_trigger
+    try:
+        report = asyncio.run(enrich_news_articles(db))
+    finally:
+        main.get_ai_service = original_get_ai_service
+        main.generate_news_insights_batch = original_batch
+
+    assert report["scanned"] == 4 and report["updated"] == 4 and report["keywords"] == 4
+    assert db.news_articles.count_documents({"ai_insights": None}) == 0
+    assert not main.news_enrichment_rerun.is_set()
+    print("✅ Articles inserted behind the cursor are enriched by the queued rerun")
+
+def test_enrichment_off_event_loop():
+    """Test that enrichment reads and writes articles in the threadpool"""
+
+    print("Testing news enrichment database calls...")
+
+    db = mongomock.MongoClient().db
+    for number in range(3):
+        db.news_articles.insert_one({"title": f"Article {number}", "summary": "Casting news", "ai_insights": None})
+    on_event_loop = []
+
+    def off_loop(function):
+        def wrapper(*args):
+            try:
+                asyncio.get_running_loop()
+                on_event_loop.append(function.__name__)
+            except RuntimeError:
+                pass
+            return function(*args)
+        return wrapper
+
+    originals = (main.get_ai_service, main.find_unenriched_news_articles, main.store_news_insights,
+                 main.bump_news_cache_version)
+    main.get_ai_service = lambda: None
+    main.find_unenriched_news_articles = off_loop(main.find_unenriched_news_articles)
+    main.store_news_insights = off_loop(main.store_news_insights)
+    main.bump_news_cache_version = off_loop(main.bump_news_cache_version)
+    try:
+        report = asyncio.run(enrich_news_articles(db))
+    finally:
+        (main.get_ai_service, main.find_unenriched_news_articles, main.store_news_insights,
+         main.bump_news_cache_version) = originals
+
+    assert report["updated"] == 3 and on_event_loop == []
+    print("✅ Article scans, insight writes and the cache version bump run off the event loop")
+
+def test_enrich_endpoint_admin_only():
+    """Test that only admins can trigger an enrichment pass"""
+
+    print("Testing news enrichment endpoint access...")
+
+    db = mongomock.MongoClient().db
+    db.news_articles.insert_one({"title": "Article", "summary": "Casting news", "ai_insights": None})
+    originals = (main.get_db, main.get_ai_service, main.ADMIN_EMAILS)
+    main.get_db = lambda: db
+    main.get_ai_service = lambda: None
+    main.ADMIN_EMAILS = {"admin@example.com"}
+    try:
+        client = TestClient(main.app)
+        for email, expected_status in [("member@example.com", 403), ("admin@example.com", 200)]:
+            main.app.dependency_overrides[main.get_current_user] = lambda email=email: main.UserResponse(
+                id="507f1f77bcf86cd799439011", email=email, name="User", is_member=True, profile_completed=True
+            )
+            assert client.post("/api/v1/admin/news/enrich").status_code == expected_status
+        assert db.news_articles.count_documents({"ai_insights": None}) == 0
+        print("✅ Members can't trigger paid enrichment passes")
+    finally:
+        main.get_db, main.get_ai_service, main.ADMIN_EMAILS = originals
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+
+def test_member_writes_skip_enrichment():
+    """Test that articles created by members don't start a paid enrichment pass"""
+
+    print("Testing news enrichment triggers...")
+
+    db = mongomock.MongoClient().db
+    triggered = []
+
+    async def record_enrichment(db):
+        triggered.append(db)
+
+    originals = (main.get_db, main.run_news_enrichment, main.ADMIN_EMAILS)
+    main.get_db = lambda: db
+    main.run_news_enrichment = record_enrichment
+    main.ADMIN_EMAILS = {"admin@example.com"}
+    try:
+        client = TestClient(main.app)
+        for email, expected_triggers in [("member@example.com", 0), ("admin@example.com", 1)]:
+            main.app.dependency_overrides[main.get_current_user] = lambda email=email: main.UserResponse(
+                id="507f1f77bcf86cd799439011", email=email, name="User", is_member=True, profile_completed=True
+            )
+            article = {"title": f"Article by {email}", "summary": "Casting news", "source": "Variety",
+                       "url": f"https://example.com/{email}", "published_at": "2024-01-01T00:00:00"}
+            assert client.post("/api/v1/news", json=article).status_code == 200
+            assert len(triggered) == expected_triggers
+        assert db.news_articles.count_documents({"ai_insights": None}) == 2
+        print("✅ Only admin writes trigger enrichment, members' articles wait for the scheduled pass")
+    finally:
+        main.get_db, main.run_news_enrichment, main.ADMIN_EMAILS = originals
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+
+if __name__ == "__main__":
+    test_news_insights_batch()
+    test_enrichment_rerun()
+    test_enrichment_off_event_loop()
+    test_enrich_endpoint_admin_only()
+    test_member_writes_skip_enrichment()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import mongomock
+from fastapi.testclient import TestClient
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+from main import (
+    latest_news_published_at,
+    load_news_fetch_window,
+    record_news_fetch,
+    normalize_news_article,
+    process_and_store_news_articles,
+)
+
+def newsapi_article(number: int, published_at: str, **overrides) -> dict:
+    article = {
+        "title": f"Article {number} about a studio film",
+        "description": f"Summary of article {number}",
+        "url": f"https://example.com/{number}",
+        "source": {"name": "Variety"},
+        "urlToImage": None,
+        "publishedAt": published_at,
+    }
+    article.update(overrides)
+    return article
+
+def test_news_watermark():
+    """Test that only fetched, non-future articles set the incremental fetch watermark"""
+
+    print("Testing news fetch watermark...")
+
+    db = mongomock.MongoClient().db
+    assert latest_news_published_at(db) is None
+
+    process_and_store_news_articles(db, [newsapi_article(1, "2024-05-01T10:00:00Z")])
+    # A manually created article far in the future must not hold back fetching
+    db.news_articles.insert_one({
+        "title": "Admin post", "summary": "", "source": "Admin", "url": "https://example.com/admin",
+        "category": "entertainment", "published_at": datetime.utcnow() + timedelta(days=365),
+        "fetched_at": datetime.utcnow(), "ai_insights": None
+    })
+    assert latest_news_published_at(db) == datetime(2024, 5, 1, 10, 0)
+    print("✅ Watermark ignores manually created articles")
+
+def test_news_fetch_window():
+    """Test that the watermark only advances after complete fetches and capped fetches are backfilled"""
+
+    print("Testing news fetch window...")
+
+    db = mongomock.MongoClient().db
+    calls = []
+    # Distinct stories, so none of them cluster as near-duplicates
+    stories = {
+        1: ("Indie thriller wraps production", "Filming ended in Atlanta"),
+        2: ("Broadway revival opens auditions", "Stage roles for the ensemble"),
+        3: ("Festival unveils documentary lineup", "Twelve premieres this fall"),
+        4: ("Voice cast announced for animated feature", "Studio names its leads"),
+        5: ("Streaming series renewed for season two", "Casting for new roles begins"),
+    }
+
+    def story(number, published_at):
+        title, description = stories[number]
+        return newsapi_article(number, published_at, title=title, description=description)
+
+    results = [
+        ([story(1, "2024-05-01T10:00:00Z"), story(2, "2024-05-01T11:00:00Z")], True),
+        RuntimeError("NewsAPI page 2 failed"),
+        # Capped: the newest articles arrive, the older ones past the page cap don't
+        ([story(5, "2024-05-01T15:00:00Z"), story(4, "2024-05-01T14:00:00Z")], False),
+        ([story(3, "2024-05-01T13:00:00Z")], True),
+        ([], True),
+    ]
+
+    async def fake_fetch(api_key, since=None, until=None):
+        calls.append((since, until))
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    original_fetch = main.fetch_news_from_api
+    main.fetch_news_from_api = fake_fetch
+    try:
+        asyncio.run(main.ingest_news(db))
+        assert load_news_fetch_window(db)["watermark"] == datetime(2024, 5, 1, 11, 0)
+        try:
+            asyncio.run(main.ingest_news(db))
+            assert False, "Expected the failed fetch to raise"
+        except RuntimeError:
+            pass
+        assert load_news_fetch_window(db)["watermark"] == datetime(2024, 5, 1, 11, 0)
+        print("✅ A failed fetch leaves the watermark where it was")
+
+        report = asyncio.run(main.ingest_news(db))
+        window = load_news_fetch_window(db)
+        assert report["complete"] is False and report["inserted"] == 2
+        assert window["watermark"] == datetime(2024, 5, 1, 11, 0)
+        assert window["backfill_until"] == datetime(2024, 5, 1, 14, 0)
+        asyncio.run(main.ingest_news(db))
+        asyncio.run(main.ingest_news(db))
+        assert load_news_fetch_window(db)["watermark"] == datetime(2024, 5, 1, 15, 0)
+        print("✅ A capped fetch is backfilled before the watermark moves past it")
+    finally:
+        main.fetch_news_from_api = original_fetch
+
+    assert calls == [
+        (None, None),
+        (datetime(2024, 5, 1, 11, 0), None),
+        (datetime(2024, 5, 1, 11, 0), None),
+        (datetime(2024, 5, 1, 11, 0), datetime(2024, 5, 1, 14, 0)),
+        (datetime(2024, 5, 1, 15, 0), None),
+    ]
+    assert db.news_articles.count_documents({}) == 5
+
+def test_normalize_news_article():
+    """Test required fields, summary handling and publish date parsing"""
+
+    print("Testing news article normalization...")
+
+    fetched_at = datetime(2024, 5, 2)
+    document = normalize_news_article(newsapi_article(1, "2024-05-01T10:00:00Z", source=None), fetched_at)
+    assert document["url"] == "https://example.com/1"
+    assert document["source"] == "Unknown"
+    assert document["published_at"] == datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc)
+    assert document["fetched_at"] == fetched_at and document["ai_insights"] is None
+    print("✅ Articles are normalized with UTC publish dates")
+
+    offset = normalize_news_article(newsapi_article(2, "2024-05-01T12:00:00+02:00", description="x" * 600), fetched_at)
+    assert offset["published_at"] == datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc)
+    assert len(offset["summary"]) == 500
+    assert normalize_news_article(newsapi_article(3, "2024-05-01T10:00:00Z", description=None), fetched_at)["summary"] == ""
+    print("✅ Offset dates are parsed and summaries are capped")
+
+    assert normalize_news_article(newsapi_article(4, "2024-05-01T10:00:00Z", title=None), fetched_at) is None
+    assert normalize_news_article(newsapi_article(5, "2024-05-01T10:00:00Z", url=""), fetched_at) is None
+    assert normalize_news_article(newsapi_article(6, None), fetched_at) is None
+    try:
+        normalize_news_article(newsapi_article(7, "yesterday"), fetched_at)
+        assert False, "Expected an unparseable date to raise"
+    except ValueError:
+        pass
+    print("✅ Articles missing a title, url or date are rejected")
+
+def test_store_report_counts():
+    """Test inserted/updated/unchanged/skipped counts, including after failed writes"""
+
+    print("Testing news store report counts...")
+
+    db = mongomock.MongoClient().db
+    first = [
+        newsapi_article(1, "2024-05-01T10:00:00Z"),
+        newsapi_article(2, "2024-05-01T11:00:00Z", title="Broadway revival opens auditions", description="Stage roles"),
+    ]
+    assert process_and_store_news_articles(db, first) == {
+        "inserted": 2, "updated": 0, "unchanged": 0, "clustered": 0, "skipped": 0, "errors": 0
+    }
+
+    second = first[:1] + [
+        dict(first[1], title="Broadway revival opens open auditions"),
+        newsapi_article(3, "2024-05-01T12:00:00Z", title="Streaming series renewed for season two", description="Casting"),
+        newsapi_article(4, None),
+        newsapi_article(5, "yesterday"),
+        newsapi_article(1, "2024-05-01T10:00:00Z"),
+    ]
+    assert process_and_store_news_articles(db, second) == {
+        "inserted": 1, "updated": 1, "unchanged": 1, "clustered": 0, "skipped": 3, "errors": 0
+    }
+    assert db.news_articles.count_documents({}) == 3
+    print("✅ Inserted, updated, unchanged and skipped articles are counted")
+
+    # A unique index makes one of the upserts fail; the rest of the batch is still written and counted
+    db.news_articles.create_index("summary", unique=True)
+    third = [
+        newsapi_article(6, "2024-05-02T10:00:00Z", title="Indie thriller wraps production", description="Wire copy"),
+        newsapi_article(7, "2024-05-02T11:00:00Z", title="Voice cast announced for animated feature", description="Wire copy"),
+        dict(first[0], description="Updated summary of article 1"),
+        second[2],
+    ]
+    report = process_and_store_news_articles(db, third)
+    assert report == {"inserted": 1, "updated": 1, "unchanged": 1, "clustered": 0, "skipped": 0, "errors": 1}, report
+    assert db.news_articles.count_documents({}) == 4
+    print("✅ Counts are taken from the bulk write error details when some writes fail")
+
+def test_store_duplicates():
+    """Test that near-duplicates are recorded on their canonical article, new or already stored"""
+
+    print("Testing news duplicate storage...")
+
+    db = mongomock.MongoClient().db
+    story = dict(title="Netflix Orders Third Season of Hit Drama 'The Crown' Spinoff",
+                 description="Netflix has renewed the period drama spinoff for a third season, "
+                             "with production set to begin in London this spring, sources say.")
+    canonical = newsapi_article(1, "2024-05-01T10:00:00Z", **story)
+    copy = newsapi_article(2, "2024-05-01T11:00:00Z", title=story["title"] + " - Variety",
+                           description=story["description"] + "..", source={"name": "Variety"})
+
+    # Canonical and copy in one batch
+    report = process_and_store_news_articles(db, [canonical, copy])
+    assert report["inserted"] == 1 and report["clustered"] == 1
+    stored = db.news_articles.find_one({"url": canonical["url"]})
+    assert [duplicate["url"] for duplicate in stored["duplicates"]] == [copy["url"]]
+
+    # The stored canonical is re-fetched alongside a new copy, as the inclusive watermark does
+    second_copy = newsapi_article(3, "2024-05-01T12:00:00Z", title=story["title"] + " - Deadline",
+                                  description=story["description"] + "..", source={"name": "Deadline"})
+    report = process_and_store_news_articles(db, [canonical, copy, second_copy])
+    assert report["clustered"] == 2 and db.news_articles.count_documents({}) == 1
+    stored = db.news_articles.find_one({"url": canonical["url"]})
+    assert [duplicate["url"] for duplicate in stored["duplicates"]] == [copy["url"], second_copy["url"]]
+    print("✅ Duplicates of a re-fetched stored article are kept")
+
+def test_fetch_endpoint_off_event_loop():
+    """Test that the manual fetch endpoint stores articles with its database calls in the threadpool"""
+
+    print("Testing manual news fetch endpoint...")
+
+    db = mongomock.MongoClient().db
+    on_event_loop = []
+
+    def off_loop(function):
+        def wrapper(*args):
+            try:
+                asyncio.get_running_loop()
+                on_event_loop.append(function.__name__)
+            except RuntimeError:
+                pass
+            return function(*args)
+        return wrapper
+
+    async def fake_fetch(api_key, since=None, until=None):
+        return [newsapi_article(1, "2024-05-01T10:00:00Z")], True
+
+    originals = (main.get_db, main.fetch_news_from_api, main.load_news_fetch_window, main.record_news_fetch,
+                 main.process_and_store_news_articles, main.run_news_enrichment)
+    main.get_db = lambda: db
+    main.fetch_news_from_api = fake_fetch
+    main.load_news_fetch_window = off_loop(load_news_fetch_window)
+    main.record_news_fetch = off_loop(record_news_fetch)
+    main.process_and_store_news_articles = off_loop(process_and_store_news_articles)
+    main.run_news_enrichment = lambda db: None
+    main.app.dependency_overrides[main.get_current_user] = lambda: main.UserResponse(
+        id="507f1f77bcf86cd799439011", email="admin@example.com", name="Admin", is_member=True, profile_completed=True
+    )
+    try:
+        response = TestClient(main.app).post("/api/v1/news/fetch")
+        assert response.status_code == 200
+        assert response.json()["inserted"] == 1 and db.news_articles.count_documents({}) == 1
+        assert on_event_loop == []
+        assert db.batch_checkpoints.find_one({"_id": main.NEWS_FETCH_CHECKPOINT_ID})["watermark"] == datetime(2024, 5, 1, 10, 0)
+        print("✅ Watermark read, bulk write and watermark update run off the event loop")
+    finally:
+        (main.get_db, main.fetch_news_from_api, main.load_news_fetch_window, main.record_news_fetch,
+         main.process_and_store_news_articles, main.run_news_enrichment) = originals
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+
+if __name__ == "__main__":
+    test_news_watermark()
+    test_news_fetch_window()
+    test_normalize_news_article()
+    test_store_report_counts()
+    test_store_duplicates()
+    test_fetch_endpoint_off_event_loop()
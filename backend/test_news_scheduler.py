@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import asyncio
+from datetime import datetime, timedelta
+
+import mongomock
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+from main import acquire_scheduler_lock, release_scheduler_lock
+
+LOCK = "test_lock"
+
+def expire_lease(db):
+    db.scheduler_locks.update_one({"_id": LOCK}, {"$set": {"lease_expires_at": datetime.utcnow() - timedelta(seconds=1)}})
+
+def test_scheduler_lock():
+    """Test the scheduler lease: exclusivity, release, crash recovery and legacy lock documents"""
+
+    print("Testing scheduler lock...")
+
+    db = mongomock.MongoClient().db
+    assert acquire_scheduler_lock(db, LOCK, "a", 60)
+    assert not acquire_scheduler_lock(db, LOCK, "b", 60)
+
+    # Released with a future next run: nobody runs early, even with the lease over
+    release_scheduler_lock(db, LOCK, "a", 3600)
+    assert not acquire_scheduler_lock(db, LOCK, "b", 60)
+    # Stored times have millisecond precision, so step clear of the release instant
+    past = datetime.utcnow() - timedelta(seconds=1)
+    db.scheduler_locks.update_one({"_id": LOCK}, {"$set": {"next_run_at": past, "lease_expires_at": past}})
+    assert acquire_scheduler_lock(db, LOCK, "b", 60)
+    print("✅ One holder at a time, next run respected")
+
+    # The holder crashes without releasing: the lease blocks others until it expires
+    assert not acquire_scheduler_lock(db, LOCK, "c", 60)
+    expire_lease(db)
+    assert acquire_scheduler_lock(db, LOCK, "c", 60)
+    assert db.scheduler_locks.find_one({"_id": LOCK})["owner"] == "c"
+    print("✅ Crashed holder is taken over after its lease expires")
+
+    # Lock documents written without next_run_at (first holder never released) are recoverable
+    db.scheduler_locks.replace_one({"_id": LOCK}, {"_id": LOCK, "owner": "old", "acquired_at": datetime.utcnow()})
+    assert acquire_scheduler_lock(db, LOCK, "d", 60)
+    db.scheduler_locks.update_one({"_id": LOCK}, {"$unset": {"next_run_at": ""}})
+    assert not acquire_scheduler_lock(db, LOCK, "e", 60)
+    expire_lease(db)
+    assert acquire_scheduler_lock(db, LOCK, "e", 60)
+    print("✅ Lock documents missing next_run_at or lease_expires_at are recoverable")
+
+def test_news_scheduler():
+    """Test that concurrent scheduler loops ingest once per interval, survive failures and enrich after releasing"""
+
+    print("Testing news scheduler loop...")
+
+    db = mongomock.MongoClient().db
+    runs = []
+    enrichments = []
+    connections = []
+
+    async def fake_ingest(_db):
+        runs.append(len(runs))
+        if len(runs) == 1:
+            raise RuntimeError("NewsAPI unavailable")
+        return {"fetched_count": 1, "inserted": 1}
+
+    async def fake_enrich(_db):
+        # Enrichment runs after the lease is given back, so it can't hold up other workers
+        lock = db.scheduler_locks.find_one({"_id": main.NEWS_INGEST_LOCK})
+        assert lock["lease_expires_at"] <= datetime.utcnow()
+        enrichments.append(len(runs))
+        return {"scanned": 1}
+
+    def fake_get_db():
+        connections.append(1)
+        return db
+
+    originals = (main.get_db, main.ingest_news, main.enrich_news_articles,
+                 main.NEWS_SCHEDULER_POLL_SECONDS, main.NEWS_INGEST_INTERVAL_SECONDS)
+    main.get_db = fake_get_db
+    main.ingest_news = fake_ingest
+    main.enrich_news_articles = fake_enrich
+    main.NEWS_SCHEDULER_POLL_SECONDS = 0.01
+    main.NEWS_INGEST_INTERVAL_SECONDS = 3600
+
+    async def run():
+        stop_event = asyncio.Event()
+        loops = [asyncio.create_task(main.run_news_scheduler(f"worker-{i}", stop_event)) for i in range(3)]
+        await asyncio.sleep(0.1)
+        assert runs == [0] and enrichments == []
+        # A failed run still releases the lease and schedules the next one
+        lock = db.scheduler_locks.find_one({"_id": main.NEWS_INGEST_LOCK})
+        assert lock["next_run_at"] > datetime.utcnow() + timedelta(seconds=3000)
+
+        # Make the next run due: exactly one more ingestion happens
+        db.scheduler_locks.update_one({"_id": main.NEWS_INGEST_LOCK}, {"$set": {"next_run_at": datetime.utcnow()}})
+        await asyncio.sleep(0.1)
+        stop_event.set()
+        await asyncio.gather(*loops)
+
+    try:
+        asyncio.run(run())
+    finally:
+        (main.get_db, main.ingest_news, main.enrich_news_articles,
+         main.NEWS_SCHEDULER_POLL_SECONDS, main.NEWS_INGEST_INTERVAL_SECONDS) = originals
+
+    assert runs == [0, 1]
+    print("✅ Three workers ingested once per due run")
+    assert enrichments == [2]
+    print("✅ New articles are enriched after the lease is released")
+    assert len(connections) == 3
+    print("✅ Each loop connects to the database once")
+
+if __name__ == "__main__":
+    test_scheduler_lock()
+    test_news_scheduler()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+from datetime import datetime
+
+import mongomock
+from bson import ObjectId
+from fastapi.testclient import TestClient
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+from main import encode_news_search_cursor, decode_news_search_cursor, search_news_articles
+
+class FixedScoreDatabase:
+    """
+    Database whose news_articles aggregate treats each article's fixed_score as
+    its text score, since mongomock has no $text search. The cursor, sort and
+    limit stages of the search pipeline still run as written.
+    """
+
+    def __init__(self, db):
+        self.news_articles = self
+        self.collection = db.news_articles
+
+    def aggregate(self, pipeline):
+        match, add_score, *rest = pipeline
+        assert "$text" in match["$match"] and add_score == {"$addFields": {"score": {"$meta": "textScore"}}}
+        match = {"$match": {key: value for key, value in match["$match"].items() if key != "$text"}}
+        return self.collection.aggregate([match, {"$addFields": {"score": "$fixed_score"}}] + rest)
+
+def make_db(scores: list):
+    db = mongomock.MongoClient().db
+    for number, score in enumerate(scores):
+        db.news_articles.insert_one({
+            "_id": ObjectId(f"{number + 1:024x}"), "title": f"Article {number}", "summary": "Casting news",
+            "source": "Variety", "url": f"https://example.com/{number}", "category": "casting",
+            "published_at": datetime(2024, 5, 1 + number), "fetched_at": datetime(2024, 5, 1 + number),
+            "ai_insights": None, "fixed_score": score
+        })
+    return db
+
+def test_search_cursor():
+    """Test the cursor round trip and that pages continue on (score, _id) ties"""
+
+    print("Testing news search cursors...")
+
+    article_id = ObjectId()
+    assert decode_news_search_cursor(encode_news_search_cursor(1.25, article_id)) == (1.25, article_id)
+    for malformed in ["", "not base64!", encode_news_search_cursor(1.0, "not-an-object-id"), "WzFd"]:
+        try:
+            decode_news_search_cursor(malformed)
+            assert False, f"Expected {malformed!r} to be rejected"
+        except ValueError:
+            pass
+    print("✅ Cursors round trip and malformed cursors are rejected")
+
+    # Several articles share each score, so pages have to break ties on _id
+    db = FixedScoreDatabase(make_db([2.0, 1.5, 2.0, 1.5, 2.0, 1.0, 1.5]))
+    expected, cursor = search_news_articles(db, "casting", limit=10)
+    assert cursor is None
+    assert [(article["score"], article["_id"]) for article in expected] == sorted(
+        [(article["score"], article["_id"]) for article in expected], reverse=True
+    )
+
+    pages = []
+    cursor = None
+    while True:
+        page, cursor = search_news_articles(db, "casting", limit=2, cursor=cursor)
+        pages.append(page)
+        if cursor is None:
+            break
+    assert [len(page) for page in pages] == [2, 2, 2, 1]
+    assert [article["_id"] for page in pages for article in page] == [article["_id"] for article in expected]
+    print("✅ Pages continue on score ties without skipping or repeating articles")
+
+def test_search_endpoint_cursor():
+    """Test that the search endpoint pages with next_cursor and rejects malformed cursors"""
+
+    print("Testing news search endpoint cursors...")
+
+    db = FixedScoreDatabase(make_db([1.0, 1.0, 1.0]))
+    original_get_db = main.get_db
+    main.get_db = lambda: db
+    main.app.dependency_overrides[main.get_current_user] = lambda: main.UserResponse(
+        id="507f1f77bcf86cd799439011", email="jane@example.com", name="Jane", is_member=True, profile_completed=True
+    )
+    try:
+        client = TestClient(main.app)
+        first = client.get("/api/v1/news/search", params={"q": "casting", "limit": 2}).json()
+        second = client.get("/api/v1/news/search", params={"q": "casting", "limit": 2, "cursor": first["next_cursor"]}).json()
+        assert [article["title"] for article in first["articles"] + second["articles"]] == [
+            "Article 2", "Article 1", "Article 0"
+        ]
+        assert second["next_cursor"] is None
+
+        response = client.get("/api/v1/news/search", params={"q": "casting", "cursor": "garbage"})
+        assert response.status_code == 400 and "Invalid cursor" in response.json()["detail"]
+        print("✅ Endpoint pages with next_cursor and returns 400 for a malformed cursor")
+    finally:
+        main.get_db = original_get_db
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+
+if __name__ == "__main__":
+    test_search_cursor()
+    test_search_endpoint_cursor()
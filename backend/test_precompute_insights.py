@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import asyncio
+
+import mongomock
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import precompute_insights
+from precompute_insights import RateLimiter, load_checkpoint
+from main import get_cached_profile_insights, store_profile_insights, profile_insights_cache_key
+
+class Interrupted(BaseException):
+    """Stops a run mid-way, like a killed process"""
+
+class FakeService:
+    def __init__(self, interrupt_after=None):
+        self.calls = []
+        self.interrupt_after = interrupt_after
+
+    async def generate_profile_insights_async(self, profile):
+        if self.interrupt_after is not None and len(self.calls) >= self.interrupt_after:
+            raise Interrupted()
+        self.calls.append(profile["_id"])
+        return {"scripts": [{"title": f"Script for {profile['name']}"}]}
+
+def test_rate_limiter():
+    """Test that the token bucket allows a one-second burst, then the configured rate"""
+
+    print("Testing rate limiter...")
+
+    now = [0.0]
+    delays = []
+
+    async def fake_sleep(seconds):
+        delays.append(seconds)
+        now[0] += seconds
+
+    async def run():
+        limiter = RateLimiter(requests_per_minute=1200, clock=lambda: now[0], sleep=fake_sleep)  # 20 per second, bucket of 20
+        for _ in range(20):
+            await limiter.acquire()
+        burst = list(delays)
+        for _ in range(5):
+            await limiter.acquire()
+        return burst
+
+    burst = asyncio.run(run())
+    assert burst == []
+    assert len(delays) == 5 and all(abs(delay - 0.05) < 1e-9 for delay in delays)
+    print(f"✅ 20 acquisitions without waiting, then one every {delays[0] * 1000:.0f}ms")
+
+    # Idle time refills the bucket, but never beyond one second's worth
+    now[0] += 60
+    delays.clear()
+
+    async def refill():
+        limiter = RateLimiter(requests_per_minute=1200, clock=lambda: now[0], sleep=fake_sleep)
+        now[0] += 60
+        for _ in range(21):
+            await limiter.acquire()
+
+    asyncio.run(refill())
+    assert len(delays) == 1
+    print("✅ An idle bucket holds at most one second of requests")
+
+def test_precompute_resume():
+    """Test that an interrupted run resumes after the last checkpointed batch"""
+
+    print("Testing precompute checkpoint resume...")
+
+    db = mongomock.MongoClient().db
+    db.profiles.insert_many([{"_id": number, "name": f"Actor {number}", "age_range": "25-35"} for number in range(1, 6)])
+    original_get_ai_service = precompute_insights.get_ai_service
+
+    try:
+        # Interrupted during the second batch: only the first batch is checkpointed
+        precompute_insights.get_ai_service = lambda: FakeService(interrupt_after=3)
+        try:
+            asyncio.run(precompute_insights.precompute_insights(db, batch_size=2, requests_per_minute=60_000))
+            assert False, "Expected the run to be interrupted"
+        except Interrupted:
+            pass
+        checkpoint = load_checkpoint(db)
+        assert checkpoint["last_id"] == 2 and not checkpoint["completed"]
+
+        service = FakeService()
+        precompute_insights.get_ai_service = lambda: service
+        stats = asyncio.run(precompute_insights.precompute_insights(db, batch_size=2, requests_per_minute=60_000))
+        # Profile 3 was generated before the interruption but not checkpointed, so it is fresh now
+        assert service.calls == [4, 5]
+        assert stats["scanned"] == 5 and stats["ai"] == 4 and stats["fresh"] == 1
+        assert load_checkpoint(db)["completed"]
+        print("✅ Resumed after the last checkpointed batch")
+
+        # A completed run starts over, and everything is fresh
+        service = FakeService()
+        stats = asyncio.run(precompute_insights.precompute_insights(db, batch_size=2, requests_per_minute=60_000))
+        assert service.calls == [] and stats["fresh"] == 5
+        print("✅ Completed checkpoint starts a new pass")
+    finally:
+        precompute_insights.get_ai_service = original_get_ai_service
+
+def test_failed_refresh_keeps_cache():
+    """Test that a failed refresh leaves insights that are close to expiry in the cache"""
+
+    print("Testing precompute during an AI outage...")
+
+    class FailingService:
+        async def generate_profile_insights_async(self, profile):
+            raise RuntimeError("Gemini unavailable")
+
+    db = mongomock.MongoClient().db
+    profile = {"_id": 1, "name": "Actor 1", "age_range": "25-35"}
+    db.profiles.insert_one(dict(profile))
+    cache_key = profile_insights_cache_key(db.profiles.find_one({"_id": 1}))
+    # Still valid for 12 hours, so due for a refresh
+    store_profile_insights(db, cache_key, 1, {"scripts": []}, ttl_seconds=12 * 3600)
+
+    original_get_ai_service = precompute_insights.get_ai_service
+    precompute_insights.get_ai_service = lambda: FailingService()
+    try:
+        stats = asyncio.run(precompute_insights.precompute_insights(db, requests_per_minute=60_000, restart=True))
+    finally:
+        precompute_insights.get_ai_service = original_get_ai_service
+
+    assert stats["failed"] == 1 and stats["ai"] == 0
+    assert get_cached_profile_insights(db, cache_key) == {"scripts": []}
+    assert db.profile_insights_cache.find_one({"_id": cache_key})["source"] == "ai"
+    print("✅ Failed refreshes keep the existing AI insights")
+
+def test_rules_entries_not_served():
+    """Test that rule-based precompute fallbacks aren't served from the online cache"""
+
+    db = mongomock.MongoClient().db
+    profile = {"_id": 1, "name": "Actor 1", "age_range": "25-35"}
+    cache_key = profile_insights_cache_key(profile)
+    store_profile_insights(db, cache_key, 1, {"scripts": []}, source="rules")
+    assert get_cached_profile_insights(db, cache_key) is None
+    store_profile_insights(db, cache_key, 1, {"scripts": []})
+    assert get_cached_profile_insights(db, cache_key) == {"scripts": []}
+    print("✅ Only AI entries are served from the cache")
+
+if __name__ == "__main__":
+    test_rate_limiter()
+    test_precompute_resume()
+    test_failed_refresh_keeps_cache()
+    test_rules_entries_not_served()
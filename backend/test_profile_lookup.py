@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+from datetime import datetime
+
+import mongomock
+from fastapi.testclient import TestClient
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+from main import get_user_with_profile
+
+def test_get_user_with_profile():
+    """Test resolving a user and their profile in one aggregation"""
+
+    print("Testing user and profile lookup...")
+
+    db = mongomock.MongoClient().db
+    user_id = db.users.insert_one({"email": "jane@example.com", "name": "Jane", "password_hash": "secret"}).inserted_id
+    other_id = db.users.insert_one({"email": "sam@example.com", "name": "Sam"}).inserted_id
+    profile_id = db.profiles.insert_one({"user_id": user_id, "name": "Jane Actor"}).inserted_id
+
+    user = get_user_with_profile(db, str(user_id))
+    assert user["email"] == "jane@example.com" and "password_hash" not in user
+    assert user["profile"]["_id"] == profile_id
+    assert get_user_with_profile(db, str(other_id))["profile"] is None
+    print("✅ Users are returned with their profile, or None without one")
+
+    assert get_user_with_profile(db, "not-an-id") is None
+    assert get_user_with_profile(db, "507f1f77bcf86cd799439011") is None
+    print("✅ Invalid and unknown user ids resolve to None")
+
+    # Database errors are not mistaken for a missing user
+    class FailingCollection:
+        def aggregate(self, pipeline):
+            raise RuntimeError("database unavailable")
+
+    class FailingDatabase:
+        users = FailingCollection()
+
+    try:
+        get_user_with_profile(FailingDatabase(), str(user_id))
+        assert False, "Expected the database error to propagate"
+    except RuntimeError:
+        pass
+    print("✅ Database errors propagate")
+
+def test_get_user_profile_endpoint():
+    """Test that the profile-by-user endpoint finds existing users"""
+
+    print("Testing profile-by-user endpoint...")
+
+    db = mongomock.MongoClient().db
+    now = datetime.utcnow()
+    user_id = db.users.insert_one({"email": "jane@example.com", "name": "Jane"}).inserted_id
+    db.profiles.insert_one({
+        "user_id": user_id, "name": "Jane Actor", "age_range": "25-35", "location": "Los Angeles",
+        "willing_to_relocate": False, "created_at": now, "updated_at": now
+    })
+
+    original_get_db = main.get_db
+    main.get_db = lambda: db
+    main.app.dependency_overrides[main.get_current_user] = lambda: main.UserResponse(
+        id=str(user_id), email="jane@example.com", name="Jane", is_member=True, profile_completed=True
+    )
+    try:
+        client = TestClient(main.app)
+        response = client.get(f"/api/v1/profiles/user/{user_id}")
+        assert response.status_code == 200 and response.json()["name"] == "Jane Actor"
+        assert client.get("/api/v1/profiles/user/507f1f77bcf86cd799439011").status_code == 404
+        print("✅ Existing users resolve, unknown users are 404")
+    finally:
+        main.get_db = original_get_db
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+
+if __name__ == "__main__":
+    test_get_user_with_profile()
+    test_get_user_profile_endpoint()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import mongomock
+from bson import ObjectId
+from fastapi.testclient import TestClient
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+from main import ProfileCreate, build_profile_document
+from profile_similarity import ProfileSimilarityIndex, encode_profile, VECTOR_WIDTH
+
+def test_profile_similarity():
+    """Test top-k similarity queries and incremental index updates"""
+
+    profiles = {
+        "a": {"age_range": "25-30", "build": "Athletic", "eye_color": "Brown", "hair_color": "Black",
+              "preferred_genres": ["Drama", "Action"], "special_skills": ["Martial Arts"],
+              "stage_experience": True, "film_experience": True},
+        "b": {"age_range": "30-35", "build": "Athletic", "eye_color": "Brown", "hair_color": "Black",
+              "preferred_genres": ["Action"], "special_skills": ["Martial Arts", "Stunts"],
+              "stage_experience": False, "film_experience": True},
+        "c": {"age_range": "60+", "build": "Petite", "eye_color": "Blue", "hair_color": "White",
+              "preferred_genres": ["Musical"], "special_skills": ["Singing"],
+              "stage_experience": True, "film_experience": False},
+    }
+
+    print("Testing profile similarity index...")
+
+    vector = encode_profile(profiles["a"])
+    assert vector.shape == (VECTOR_WIDTH,)
+    assert abs(float((vector ** 2).sum()) - 1.0) < 1e-5
+    assert not encode_profile({}).any()
+    print("✅ Profiles encode to fixed-width unit vectors")
+
+    index = ProfileSimilarityIndex(initial_capacity=1)
+    index.upsert_many(profiles.items())
+    assert len(index) == 3
+
+    matches = index.query(profiles["a"], k=2, exclude_id="a")
+    assert [match_id for match_id, _ in matches] == ["b", "c"]
+    assert matches[0][1] > matches[1][1]
+    print(f"✅ Most similar to 'a': {matches}")
+
+    # Removing a profile moves the last row into its slot
+    index.remove("b")
+    assert "b" not in index and len(index) == 2
+    assert [match_id for match_id, _ in index.query(profiles["a"], k=5, exclude_id="a")] == ["c"]
+
+    # Refreshing a profile replaces its vector in place
+    index.upsert("c", profiles["a"])
+    assert len(index) == 2
+    assert index.query(profiles["a"], k=1, exclude_id="a")[0][1] > 0.999
+    print("✅ Incremental removals and refreshes keep the index consistent")
+
+def test_similarity_index_lifecycle():
+    """Test the per-worker index: one build on first use, and rebuilds that pick up other workers' writes"""
+
+    print("Testing similarity index build and rebuild...")
+
+    db = mongomock.MongoClient().db
+
+    def add_profile(name: str, age_range: str, **fields) -> str:
+        profile = build_profile_document(
+            ProfileCreate(name=name, location="Los Angeles", age_range=age_range, **fields), ObjectId()
+        )
+        return str(db.profiles.insert_one(profile).inserted_id)
+
+    first_id = add_profile("Jane Actor", "25-30", eye_color="Brown", special_skills=["Singing"])
+    add_profile("Private Actor", "25-30", eye_color="Brown", special_skills=["Singing"], is_public=False)
+
+    builds = []
+    original_build = main.build_similarity_index
+
+    def slow_build(db):
+        builds.append(1)
+        time.sleep(0.05)
+        return original_build(db)
+
+    original_get_db = main.get_db
+    main.build_similarity_index = slow_build
+    main.get_db = lambda: db
+    main.similarity_index = None
+    main.app.dependency_overrides[main.get_current_user] = lambda: main.UserResponse(
+        id=str(ObjectId()), email="jane@example.com", name="Jane", is_member=True, profile_completed=True
+    )
+    try:
+        assert not main.rebuild_similarity_index(db) and builds == []
+        with ThreadPoolExecutor(4) as pool:
+            indexes = list(pool.map(lambda _: main.get_similarity_index(db), range(4)))
+        assert builds == [1] and all(index is indexes[0] for index in indexes) and len(indexes[0]) == 1
+        print("✅ Concurrent first lookups build the index once, without private profiles")
+
+        # Another worker creates a profile: this worker only sees it after a rebuild
+        other_id = add_profile("Jane Twin", "25-30", eye_color="Brown", special_skills=["Singing"])
+        client = TestClient(main.app)
+        assert client.get(f"/api/v1/profiles/{first_id}/similar").json() == []
+        assert main.rebuild_similarity_index(db) and len(builds) == 2
+        similar = client.get(f"/api/v1/profiles/{first_id}/similar").json()
+        assert [profile["id"] for profile in similar] == [other_id]
+        print("✅ Rebuilds pick up profiles written by other workers")
+    finally:
+        main.build_similarity_index = original_build
+        main.get_db = original_get_db
+        main.similarity_index = None
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+
+if __name__ == "__main__":
+    test_profile_similarity()
+    test_similarity_index_lifecycle()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import json
+
+import mongomock
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+from fastapi.testclient import TestClient
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+from main import ProfileCreate, build_profile_document, iter_profiles_ndjson, import_profiles_ndjson
+
+def make_profile(user_id, name: str) -> dict:
+    """Build a stored profile document the way the create endpoint does"""
+    profile_data = ProfileCreate(name=name, location="Los Angeles", age_range="25-35", special_skills=["Singing"])
+    return build_profile_document(profile_data, user_id)
+
+def test_profile_round_trip():
+    """Test that an export re-imports as-is into a database with the same users"""
+
+    print("Testing profile export/import round trip...")
+
+    source = mongomock.MongoClient().db
+    target = mongomock.MongoClient().db
+    user_ids = [ObjectId() for _ in range(3)]
+    for number, user_id in enumerate(user_ids):
+        source.profiles.insert_one(make_profile(user_id, f"Actor {number}"))
+        target.users.insert_one({"_id": user_id, "email": f"actor{number}@example.com", "profile_completed": False})
+
+    lines = list(iter_profiles_ndjson(source, batch_size=2))
+    assert len(lines) == 3
+    result = import_profiles_ndjson(target, lines, batch_size=2)
+    assert result == {"total_lines": 3, "inserted_count": 3, "error_count": 0, "errors": []}
+
+    for exported in source.profiles.find():
+        imported = target.profiles.find_one({"_id": exported["_id"]})
+        for field in ("user_id", "name", "location", "age_range", "special_skills", "profile_url", "version", "created_at"):
+            assert imported[field] == exported[field], field
+    assert target.users.count_documents({"profile_completed": True}) == 3
+    print("✅ Exported profiles keep their ids, owners and timestamps")
+
+    # Importing the same export again reports duplicates instead of failing
+    result = import_profiles_ndjson(target, lines)
+    assert result["inserted_count"] == 0 and result["error_count"] == 3
+    assert all("already has a profile" in error["error"] for error in result["errors"])
+    print("✅ Re-imported profiles are reported by line number")
+
+def test_malformed_lines():
+    """Test that bad lines are reported by line number and skipped"""
+
+    print("Testing profile import with malformed lines...")
+
+    db = mongomock.MongoClient().db
+    known_user = ObjectId()
+    unknown_user = ObjectId()
+    db.users.insert_one({"_id": known_user, "profile_completed": False})
+
+    valid = {"user_id": str(known_user), "name": "Jane Actor", "location": "Los Angeles", "ageRange": "25-35"}
+    lines = [
+        "{not json",
+        json.dumps(["a", "list"]),
+        json.dumps({"name": "No Owner", "location": "NYC", "age_range": "18-24"}),
+        json.dumps({"user_id": str(known_user), "name": "No Location", "age_range": "18-24"}),
+        json.dumps({"user_id": "not-an-object-id", "name": "Bad Id", "location": "NYC", "age_range": "18-24"}),
+        json.dumps({"user_id": str(unknown_user), "name": "Stranger", "location": "NYC", "age_range": "18-24"}),
+        "",
+        json.dumps(valid),
+    ]
+    result = import_profiles_ndjson(db, lines)
+
+    assert result["total_lines"] == 7
+    assert result["inserted_count"] == 1
+    assert result["error_count"] == 6
+    assert [error["line"] for error in result["errors"]] == [1, 2, 3, 4, 5, 6]
+    assert "not found" in result["errors"][-1]["error"]
+    print("✅ Malformed, invalid and unknown-user lines are reported by line number")
+
+    profile = db.profiles.find_one()
+    assert profile["user_id"] == known_user and profile["age_range"] == "25-35"
+    assert db.users.find_one({"_id": known_user})["profile_completed"] is True
+    assert db.users.count_documents({}) == 1
+    print("✅ Only existing users are marked as having completed their profile")
+
+def test_one_profile_per_user():
+    """Test that users who already have a profile, or appear twice in an import, are reported"""
+
+    print("Testing profile import with duplicate users...")
+
+    db = mongomock.MongoClient().db
+    main.ensure_indexes(db)
+    profiled_user, new_user = ObjectId(), ObjectId()
+    for number, user_id in enumerate((profiled_user, new_user)):
+        db.users.insert_one({"_id": user_id, "email": f"actor{number}@example.com", "profile_completed": False})
+    db.profiles.insert_one(make_profile(profiled_user, "Existing Actor"))
+
+    def line(user_id, name: str) -> str:
+        return json.dumps({"user_id": str(user_id), "name": name, "location": "NYC", "age_range": "18-24"})
+
+    # The repeated user lands in a later batch than its first line
+    lines = [line(profiled_user, "Second Profile"), line(new_user, "New Actor"), line(new_user, "New Actor Again")]
+    result = import_profiles_ndjson(db, lines, batch_size=2)
+
+    assert result["inserted_count"] == 1 and result["error_count"] == 2
+    assert [error["line"] for error in result["errors"]] == [1, 3]
+    assert "already has a profile" in result["errors"][0]["error"]
+    assert "more than once" in result["errors"][1]["error"]
+    assert db.profiles.count_documents({"user_id": new_user}) == 1
+    assert db.profiles.count_documents({"user_id": profiled_user}) == 1
+    print("✅ Each user keeps a single profile")
+
+    # The unique index backs this up for writes that bypass the import
+    try:
+        db.profiles.insert_one(make_profile(new_user, "Direct Insert"))
+        assert False, "Expected a duplicate key error"
+    except DuplicateKeyError:
+        pass
+    print("✅ The user_id index rejects a second profile")
+
+def test_transfer_endpoints_require_admin():
+    """Test that members who aren't admins can't export or import profiles"""
+
+    print("Testing profile transfer endpoint access...")
+
+    db = mongomock.MongoClient().db
+    user_id = ObjectId()
+    db.users.insert_one({"_id": user_id, "profile_completed": False})
+    db.profiles.insert_one(dict(make_profile(user_id, "Private Actor"), is_public=False))
+    lines = list(iter_profiles_ndjson(db))
+
+    original_get_db = main.get_db
+    original_admins = main.ADMIN_EMAILS
+    main.get_db = lambda: db
+    main.ADMIN_EMAILS = {"admin@example.com"}
+
+    def login(email: str):
+        main.app.dependency_overrides[main.get_current_user] = lambda: main.UserResponse(
+            id=str(ObjectId()), email=email, name="User", is_member=True, profile_completed=True
+        )
+
+    try:
+        client = TestClient(main.app)
+        login("member@example.com")
+        assert client.get("/api/v1/admin/profiles/export").status_code == 403
+        upload = {"file": ("profiles.ndjson", "".join(lines).encode("utf-8"), "application/x-ndjson")}
+        assert client.post("/api/v1/admin/profiles/import", files=upload).status_code == 403
+        print("✅ Members get 403 from export and import")
+
+        login("Admin@Example.com")
+        response = client.get("/api/v1/admin/profiles/export")
+        assert response.status_code == 200 and response.text == "".join(lines)
+        db.profiles.delete_many({})
+        assert client.post("/api/v1/admin/profiles/import", files=upload).json()["inserted_count"] == 1
+        print("✅ Admins can export and import")
+    finally:
+        main.get_db = original_get_db
+        main.ADMIN_EMAILS = original_admins
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+
+if __name__ == "__main__":
+    test_profile_round_trip()
+    test_malformed_lines()
+    test_one_profile_per_user()
+    test_transfer_endpoints_require_admin()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+from datetime import datetime
+
+import mongomock
+from fastapi.testclient import TestClient
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+from main import diff_profile_update, update_profile
+
+def test_diff_and_version_check():
+    """Test no-op diffs, stale versions and legacy profiles without a version"""
+
+    print("Testing profile update diff and version check...")
+
+    stored = {"name": "Jane Actor", "location": "Los Angeles", "special_skills": ["Singing"]}
+    assert diff_profile_update(stored, {"name": "Jane Actor", "location": None, "special_skills": ["Singing"]}) == {}
+    assert diff_profile_update(stored, {"name": "Jane Doe", "location": "Los Angeles"}) == {"name": "Jane Doe"}
+    print("✅ Unchanged and missing fields are left out of the update")
+
+    db = mongomock.MongoClient().db
+    legacy_id = str(db.profiles.insert_one({"name": "Legacy"}).inserted_id)
+    assert update_profile(db, legacy_id, {"name": "Legacy 2"}, 0)
+    assert db.profiles.find_one()["version"] == 1
+    # A second writer that read version 0 lost the race
+    assert not update_profile(db, legacy_id, {"name": "Legacy 3"}, 0)
+    assert update_profile(db, legacy_id, {"name": "Legacy 3"}, 1)
+    assert db.profiles.find_one()["name"] == "Legacy 3"
+    print("✅ Legacy profiles count as version 0, stale versions are rejected")
+
+    # Database errors are not disguised as conflicts
+    try:
+        update_profile(db, "not-an-object-id", {"name": "x"}, 0)
+        assert False, "Expected the error to propagate"
+    except Exception as e:
+        assert not isinstance(e, AssertionError)
+    print("✅ Errors propagate instead of returning False")
+
+def test_update_endpoint():
+    """Test the profile update endpoint's conflict and no-op responses"""
+
+    db = mongomock.MongoClient().db
+    user_id = db.users.insert_one({"email": "jane@example.com"}).inserted_id
+    now = datetime.utcnow()
+    profile_id = str(db.profiles.insert_one({
+        "user_id": user_id, "name": "Jane Actor", "age_range": "25-35", "location": "Los Angeles",
+        "version": 3, "created_at": now, "updated_at": now
+    }).inserted_id)
+
+    original_get_db = main.get_db
+    main.get_db = lambda: db
+    main.app.dependency_overrides[main.get_current_user] = lambda: main.UserResponse(
+        id=str(user_id), email="jane@example.com", name="Jane", is_member=True, profile_completed=True
+    )
+    try:
+        client = TestClient(main.app)
+        url = f"/api/v1/profiles/{profile_id}"
+        assert client.put(url, json={"name": "Jane Actor", "expected_version": 3}).json() == {
+            "id": profile_id, "version": 3, "updated": False
+        }
+        # camelCase input is compared through its snake_case field, not stored as its own
+        assert client.put(url, json={"ageRange": "25-35", "expectedVersion": 3}).json()["updated"] is False
+        assert client.put(url, json={"ageRange": "30-40", "expectedVersion": 3}).json()["version"] == 4
+        stored = db.profiles.find_one()
+        assert stored["age_range"] == "30-40" and "ageRange" not in stored
+        assert client.put(url, json={"name": "Jane Doe", "expected_version": 3}).status_code == 409
+        assert client.put(url, json={"name": "Jane Doe", "expected_version": 4}).json()["version"] == 5
+        assert db.profiles.find_one()["name"] == "Jane Doe"
+        print("✅ Endpoint skips no-op writes, including camelCase ones, and rejects stale versions")
+    finally:
+        main.get_db = original_get_db
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+
+if __name__ == "__main__":
+    test_diff_and_version_check()
+    test_update_endpoint()
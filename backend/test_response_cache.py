@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import time
+
+import mongomock
+from fastapi.testclient import TestClient
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import ai_metrics
+import main
+from response_cache import ResponseCache
+
+def test_response_cache():
+    """Test LRU eviction, expiry and hit/miss counting of the response cache"""
+
+    print("Testing response cache...")
+
+    ai_metrics.reset()
+    cache = ResponseCache("test_cache", max_entries=2, ttl_seconds=60)
+    assert cache.get((1, None, 0, 20)) is None
+    cache.set((1, None, 0, 20), b"[]")
+    cache.set((1, "film", 0, 20), b"[1]")
+    assert cache.get((1, None, 0, 20)) == b"[]"
+
+    # The least recently used entry is evicted first
+    cache.set((1, "awards", 0, 20), b"[2]")
+    assert len(cache) == 2
+    assert cache.get((1, "film", 0, 20)) is None
+    assert cache.get((1, None, 0, 20)) == b"[]"
+    # A bumped version is a different key
+    assert cache.get((2, None, 0, 20)) is None
+    print("✅ Least recently used entries are evicted")
+
+    expiring = ResponseCache("test_cache", max_entries=2, ttl_seconds=0.01)
+    expiring.set("page", b"[]")
+    time.sleep(0.02)
+    assert expiring.get("page") is None and len(expiring) == 0
+    print("✅ Expired entries are dropped")
+
+    counters = ai_metrics.get_counters()
+    assert counters["test_cache_hits"] == 2 and counters["test_cache_misses"] == 4
+    print(f"✅ {counters['test_cache_hits']} hits, {counters['test_cache_misses']} misses counted")
+
+def test_news_list_cache():
+    """Test that news writes bump the version so the next list request misses the cache"""
+
+    print("Testing news list caching...")
+
+    db = mongomock.MongoClient().db
+    original_get_db = main.get_db
+    original_check_seconds = main.NEWS_CACHE_VERSION_CHECK_SECONDS
+    main.get_db = lambda: db
+    main.app.dependency_overrides[main.get_current_user] = lambda: main.UserResponse(
+        id="507f1f77bcf86cd799439011", email="jane@example.com", name="Jane", is_member=True, profile_completed=True
+    )
+    main.news_list_cache.clear()
+    main.news_cache_version.update(version=0, checked_at=None)
+    article = {
+        "title": "Studio greenlights a new film", "summary": "Casting starts next month", "source": "Variety",
+        "url": "https://example.com/1", "category": "film", "published_at": "2024-05-01T10:00:00",
+        "ai_insights": "Expect open calls."
+    }
+
+    def counts():
+        counters = ai_metrics.get_counters()
+        return counters.get("news_list_cache_hits", 0), counters.get("news_list_cache_misses", 0)
+
+    try:
+        ai_metrics.reset()
+        client = TestClient(main.app)
+        assert client.post("/api/v1/news", json=article).status_code == 200
+        assert len(client.get("/api/v1/news").json()) == 1
+        assert len(client.get("/api/v1/news").json()) == 1
+        assert counts() == (1, 1)
+        print("✅ Repeated list requests are served from the cache")
+
+        assert client.post("/api/v1/news", json=dict(article, url="https://example.com/2")).status_code == 200
+        assert len(client.get("/api/v1/news").json()) == 2
+        assert counts() == (1, 2)
+        print("✅ A write in this worker makes the next request miss")
+
+        # Another worker's write is only seen once the version is checked again
+        db.news_articles.insert_one(dict(db.news_articles.find_one({}, {"_id": 0}), url="https://example.com/3"))
+        db.cache_versions.update_one({"_id": main.NEWS_CACHE_VERSION_KEY}, {"$inc": {"version": 1}})
+        main.NEWS_CACHE_VERSION_CHECK_SECONDS = 60
+        assert len(client.get("/api/v1/news").json()) == 2
+        main.NEWS_CACHE_VERSION_CHECK_SECONDS = 0
+        assert len(client.get("/api/v1/news").json()) == 3
+        assert counts() == (2, 3)
+        print("✅ Other workers' writes are picked up at the next version check")
+    finally:
+        main.get_db = original_get_db
+        main.NEWS_CACHE_VERSION_CHECK_SECONDS = original_check_seconds
+        main.app.dependency_overrides.pop(main.get_current_user, None)
+        main.news_list_cache.clear()
+        main.news_cache_version.update(version=0, checked_at=None)
+
+if __name__ == "__main__":
+    test_response_cache()
+    test_news_list_cache()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import asyncio
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import ai_metrics
+from single_flight import SingleFlight
+
+def test_single_flight():
+    """Test that concurrent calls for the same key share one execution"""
+
+    print("Testing single-flight coalescing...")
+
+    calls = []
+
+    async def generate(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        if key == "broken":
+            raise RuntimeError("generation failed")
+        return {"key": key}
+
+    async def run():
+        flights = SingleFlight("test_flight")
+        results = await asyncio.gather(
+            *(flights.do("a", lambda: generate("a")) for _ in range(10)),
+            flights.do("b", lambda: generate("b")),
+        )
+        assert results[:10] == [{"key": "a"}] * 10 and results[10] == {"key": "b"}
+        assert calls == ["a", "b"]
+        assert len(flights) == 0
+
+        # Failures are shared too, and the next call after completion runs again
+        failures = await asyncio.gather(
+            *(flights.do("broken", lambda: generate("broken")) for _ in range(3)),
+            return_exceptions=True
+        )
+        assert all(isinstance(failure, RuntimeError) for failure in failures)
+        assert await flights.do("a", lambda: generate("a")) == {"key": "a"}
+        assert calls == ["a", "b", "broken", "a"]
+
+        # A cancelled waiter doesn't cancel the shared work
+        first = asyncio.ensure_future(flights.do("c", lambda: generate("c")))
+        second = asyncio.ensure_future(flights.do("c", lambda: generate("c")))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == {"key": "c"}
+
+    asyncio.run(run())
+
+    counters = ai_metrics.get_counters()
+    assert counters["test_flight_calls"] == 5
+    assert counters["test_flight_coalesced"] == 12
+    print(f"✅ {counters['test_flight_coalesced']} calls saved out of "
+          f"{counters['test_flight_calls'] + counters['test_flight_coalesced']}")
+
+if __name__ == "__main__":
+    test_single_flight()
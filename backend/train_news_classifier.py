@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Offline training of the news category classifier.
+
+Trains the TF-IDF model from the labeled seed articles in
+news_category_seed.json, optionally adding stored articles labeled by the
+keyword rules, reports leave-one-out accuracy on the seed set and writes the
+model the API loads at startup.
+
+Run from the backend directory:
+    python train_news_classifier.py
+    python train_news_classifier.py --from-db 5000
+    python train_news_classifier.py --reclassify
+"""
+
+import sys
+import os
+import json
+import argparse
+from collections import Counter
+from pathlib import Path
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from keyword_matcher import KeywordMatcher, article_text, DEFAULT_CATEGORY
+from news_classifier import NewsClassifier, train_model, DEFAULT_MODEL_PATH
+
+DEFAULT_SEED_PATH = Path(__file__).resolve().parent / "news_category_seed.json"
+RECLASSIFY_BATCH_SIZE = 500
+
+# Keywords per news category, in priority order, used to label stored articles for training
+CATEGORY_KEYWORDS = {
+    "casting": ["casting", "audition", "self-tape", "open call"],
+    "awards": ["oscar", "emmy", "golden globe", "bafta", "tony award", "sag award", "nominat", "festival"],
+    "streaming": ["streaming", "netflix", "hulu", "disney+", "prime video", "max original", "apple tv"],
+    "television": ["television", "tv series", "series", "sitcom", "showrunner", "episode", "season"],
+    "film": ["film", "movie", "box office", "studio", "director", "sundance"],
+}
+
+_category_matcher = KeywordMatcher(CATEGORY_KEYWORDS)
+
+def categorize_articles(articles: list) -> list:
+    """Highest-priority keyword category for each article, or the default category"""
+    return [
+        _category_matcher.first(article_text(article.get("title"), article.get("summary"))) or DEFAULT_CATEGORY
+        for article in articles
+    ]
+
+def load_seed_examples(path: Path) -> list:
+    with open(path, "r", encoding="utf-8") as seed_file:
+        return [(item["title"], item["summary"], item["category"]) for item in json.load(seed_file)]
+
+def load_keyword_labeled_examples(db, limit: int) -> list:
+    """Recent stored articles that the keyword rules assign a specific category"""
+    articles = list(db.news_articles.find({}, {"title": 1, "summary": 1}).sort("published_at", -1).limit(limit))
+    return [
+        (article["title"], article.get("summary"), category)
+        for article, category in zip(articles, categorize_articles(articles))
+        if category != DEFAULT_CATEGORY
+    ]
+
+def leave_one_out_accuracy(examples: list, min_score: float) -> float:
+    correct = 0
+    for position, (title, summary, category) in enumerate(examples):
+        model = train_model(examples[:position] + examples[position + 1:], min_score=min_score)
+        correct += NewsClassifier(model).classify(title, summary) == category
+    return correct / len(examples)
+
+def reclassify_stored_articles(db, classifier: NewsClassifier) -> int:
+    """Re-run the classifier over every stored article, returning how many changed category"""
+    from pymongo import UpdateOne
+    from main import bump_news_cache_version
+
+    changed = 0
+    last_id = None
+    while True:
+        query = {"_id": {"$gt": last_id}} if last_id is not None else {}
+        articles = list(db.news_articles.find(query, {"title": 1, "summary": 1, "category": 1})
+                        .sort("_id", 1).limit(RECLASSIFY_BATCH_SIZE))
+        if not articles:
+            break
+        last_id = articles[-1]["_id"]
+        operations = [
+            UpdateOne({"_id": article["_id"]}, {"$set": {"category": category}})
+            for article, category in zip(articles, classifier.classify_batch(articles))
+            if article.get("category") != category
+        ]
+        if operations:
+            changed += db.news_articles.bulk_write(operations, ordered=False).modified_count
+    if changed:
+        bump_news_cache_version(db)
+    return changed
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Train the news category classifier")
+    parser.add_argument("--seed", type=Path, default=DEFAULT_SEED_PATH, help="Labeled seed articles")
+    parser.add_argument("--output", type=Path, default=DEFAULT_MODEL_PATH, help="Where to write the model")
+    parser.add_argument("--from-db", type=int, default=0, metavar="LIMIT",
+                        help="Also train on up to LIMIT stored articles labeled by the keyword rules")
+    parser.add_argument("--min-score", type=float, default=0.05,
+                        help="Similarity below which articles get the default category")
+    parser.add_argument("--reclassify", action="store_true",
+                        help="Apply the trained model to every stored article afterwards")
+    args = parser.parse_args()
+
+    seed_examples = load_seed_examples(args.seed)
+    print(f"Seed leave-one-out accuracy: {leave_one_out_accuracy(seed_examples, args.min_score):.1%}", file=sys.stderr)
+
+    examples = list(seed_examples)
+    db = None
+    if args.from_db or args.reclassify:
+        from main import get_db
+        db = get_db()
+    if args.from_db:
+        examples += load_keyword_labeled_examples(db, args.from_db)
+
+    model = train_model(examples, min_score=args.min_score)
+    with open(args.output, "w", encoding="utf-8") as model_file:
+        json.dump(model, model_file, indent=1, sort_keys=True)
+    print(f"Trained on {len(examples)} articles "
+          f"({json.dumps(Counter(category for _, _, category in examples))}), "
+          f"{len(model['idf'])} terms, written to {args.output}", file=sys.stderr)
+
+    if args.reclassify:
+        changed = reclassify_stored_articles(db, NewsClassifier(model))
+        print(f"Reclassified {changed} stored articles", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -64,6 +64,10 @@ const ProfilePage = () => {
         if (insights.error) {
           console.error('AI service error:', insights.error, insights.details);
           setAiInsightsError('AI insights temporarily unavailable. Showing fallback recommendations.');
+          // Failed insight jobs carry rule-based recommendations
+          if (insights.lookalikes) {
+            setAiRecommendations(insights);
+          }
         } else {
           setAiRecommendations(insights);
           return; // Exit early if successful
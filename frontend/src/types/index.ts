@@ -50,6 +50,8 @@ export interface Profile {
   profileUrl: string;
   isPublic: boolean;
   completionPercentage: number;
+  // Incremented on every update; sent back as expectedVersion to detect conflicting edits
+  version?: number;
   
   createdAt: string;
   updatedAt: string;
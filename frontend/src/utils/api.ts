@@ -171,6 +171,36 @@ export const communityApi = {
   },
 };
 
+const AI_INSIGHT_JOB_POLL_MS = 2000;
+const AI_INSIGHT_JOB_MAX_POLLS = 90;
+
+interface AIInsightsResponse {
+  job_id?: string;
+  status?: string;
+  result?: Record<string, unknown>;
+  fallback?: Record<string, unknown>;
+  error?: string | null;
+  [section: string]: unknown;
+}
+
+// A cache miss on GET /ai-insights returns the job generating the insights; poll it until it finishes
+const waitForAIInsights = async (response: AIInsightsResponse): Promise<Record<string, unknown>> => {
+  let job = response;
+  for (let poll = 0; job?.job_id && (job.status === 'queued' || job.status === 'running'); poll++) {
+    if (poll >= AI_INSIGHT_JOB_MAX_POLLS) {
+      throw new Error('AI insights are taking too long');
+    }
+    await new Promise(resolve => setTimeout(resolve, AI_INSIGHT_JOB_POLL_MS));
+    job = await apiRequest(`/ai-insight-jobs/${job.job_id}`);
+  }
+
+  // Cached or rule-based insights come back directly
+  if (!job?.job_id) return job;
+  if (job.status === 'completed') return job.result;
+  if (job.fallback) return { ...job.fallback, error: job.error };
+  throw new Error(job.error || 'AI insight generation failed');
+};
+
 // Auth API functions
 export const authApi = {
   login: async (email: string, password: string) => {
@@ -274,19 +304,20 @@ export const authApi = {
     });
   },
 
-  updateProfile: async (profileId: string, profileData: Record<string, unknown>) => {
+  // expectedVersion is the profile version the edit was based on; the server answers 409 if it changed since
+  updateProfile: async (profileId: string, profileData: Record<string, unknown>, expectedVersion: number) => {
     return apiRequest(`/profiles/${profileId}`, {
       method: 'PUT',
-      body: JSON.stringify(profileData),
+      body: JSON.stringify({ ...profileData, expectedVersion }),
     });
   },
 
   getProfileAIInsights: async (profileId: string) => {
-    return apiRequest(`/profiles/${profileId}/ai-insights`);
+    return waitForAIInsights(await apiRequest(`/profiles/${profileId}/ai-insights`));
   },
 
   getUserProfileAIInsights: async (userId: string) => {
-    return apiRequest(`/profiles/user/${userId}/ai-insights`);
+    return waitForAIInsights(await apiRequest(`/profiles/user/${userId}/ai-insights`));
   },
 };
 